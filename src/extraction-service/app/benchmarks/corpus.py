@@ -0,0 +1,168 @@
+from datetime import date, timedelta
+from typing import List
+
+SOURCE = {
+    "name": "Benchmark Source",
+    "base_url": "http://news.example.com",
+    "url": "http://news.example.com/archive/{year}/{month}/{day}",
+    "article_selector": "article-card",
+    "date_format": "%d/%m/%Y",
+    "button_selector": None,
+}
+
+PAGED_SOURCE = {
+    **SOURCE,
+    "name": "Benchmark Paginated Source",
+    "url": "http://news.example.com/latest?page={page}",
+}
+
+LOAD_MORE_SOURCE = {
+    **SOURCE,
+    "name": "Benchmark Load More Source",
+    "url": "http://news.example.com/more",
+    "button_selector": "load-more",
+}
+
+PARAGRAPH = (
+    "The regional government announced on Tuesday a new package of measures aimed at "
+    "reducing energy prices, according to a statement published by the ministry."
+)
+
+PAGE_HEADER = """
+<html>
+  <head>
+    <title>{title}</title>
+    <script>window.dataLayer = window.dataLayer || []; dataLayer.push({{"page": "{title}"}});</script>
+    <style>.article-card {{ margin: 0 }} body {{ font-family: sans-serif }}</style>
+  </head>
+  <body>
+    <header><nav>{nav}</nav></header>
+"""
+
+PAGE_FOOTER = """
+    <footer><p>© Benchmark News. All rights reserved. <a href="/legal">Legal</a></p></footer>
+  </body>
+</html>
+"""
+
+
+def _nav() -> str:
+    return "".join(
+        f'<a href="/section/{section}">{section.title()}</a>'
+        for section in ("politics", "economy", "sports", "culture", "science", "world")
+    )
+
+
+def article_card(day: date, index: int) -> str:
+    """
+    Builds the card of the 'index'-th article published on 'day', every fifth without a date.
+    """
+    link = f"/{day.year}/{day.month:02d}/{day.day:02d}/story-{index}"
+    time_elem = f"<time>{day.strftime('%d/%m/%Y')}</time>" if index % 5 else ""
+    return f"""
+    <div class="article-card">
+      <span class="kicker">Economy</span>
+      <h3><a href="{link}">Story number {index} about the economy &amp; energy</a></h3>
+      {time_elem}
+      <p class="summary">{PARAGRAPH[:90]}</p>
+      <img src="/img/{index}.jpg" alt="">
+    </div>"""
+
+
+def _archive(title: str, cards: List[str], extra: str = "") -> str:
+    return (
+        PAGE_HEADER.format(title=title, nav=_nav())
+        + '<main><section class="archive">'
+        + "".join(cards)
+        + "</section>"
+        + extra
+        + "</main>"
+        + PAGE_FOOTER
+    )
+
+
+def archive_page(day: date, cards: int = 40) -> str:
+    """
+    Builds a synthetic archive page listing 'cards' articles published on 'day'.
+    """
+    return _archive(
+        f"Archive {day.isoformat()}", [article_card(day, i) for i in range(cards)]
+    )
+
+
+def _daily_cards(pages: int, cards: int, start: date) -> List[List[str]]:
+    # EVERY PAGE OR BATCH HOLDS THE ARTICLES OF ONE DAY, NEWEST FIRST
+    return [
+        [article_card(start - timedelta(days=page), i) for i in range(cards)]
+        for page in range(pages)
+    ]
+
+
+def article_page(index: int = 0, paragraphs: int = 20) -> str:
+    """
+    Builds a synthetic article page with 'paragraphs' paragraphs and inline references.
+    """
+    body = []
+    for i in range(paragraphs):
+        reference = (
+            f' as reported by <a href="https://agency.example.org/{index}/{i}">the agency</a>'
+            if i % 3 == 0
+            else ""
+        )
+        body.append(f"<p>{PARAGRAPH} Paragraph {i}{reference}.</p>")
+        if i % 7 == 6:
+            body.append(
+                '<aside><p>Related: <a href="/related">more news</a></p></aside>'
+            )
+            body.append("<script>trackScroll();</script>")
+    return (
+        PAGE_HEADER.format(title=f"Story {index}", nav=_nav())
+        + f"<main><article><h1>Story number {index}</h1>"
+        + "".join(body)
+        + "</article></main>"
+        + PAGE_FOOTER
+    )
+
+
+def archive_corpus(days: int = 10, cards: int = 40, start: date = date(2022, 1, 10)):
+    """Returns a list of (url, html, day) tuples for consecutive archive days."""
+    corpus = []
+    for offset in range(days):
+        day = start - timedelta(days=offset)
+        url = SOURCE["url"].format(
+            year=day.year, month=f"{day.month:02d}", day=f"{day.day:02d}"
+        )
+        corpus.append((url, archive_page(day, cards), day))
+    return corpus
+
+
+def article_corpus(count: int = 50, paragraphs: int = 20):
+    """Returns a list of article page HTML documents."""
+    return [article_page(i, paragraphs) for i in range(count)]
+
+
+def paged_corpus(pages: int = 10, cards: int = 40, start: date = date(2022, 1, 10)):
+    """Returns a list of (url, html) tuples for the pages of a paginated archive."""
+    return [
+        (
+            PAGED_SOURCE["url"].format(page=page + 1),
+            _archive(f"Latest, page {page + 1}", page_cards),
+        )
+        for page, page_cards in enumerate(_daily_cards(pages, cards, start))
+    ]
+
+
+def load_more_corpus(
+    batches: int = 10, cards: int = 40, start: date = date(2022, 1, 10)
+):
+    """
+    Returns a list of (url, html) tuples for a load-more archive: the page holding the first
+    batch of cards and the button, followed by the fragments the button appends.
+    """
+    url = LOAD_MORE_SOURCE["url"]
+    button = f'<button class="{LOAD_MORE_SOURCE["button_selector"]}">More</button>'
+    first, *rest = _daily_cards(batches, cards, start)
+    corpus = [(url, _archive("More news", first, button))]
+    for batch, batch_cards in enumerate(rest, start=1):
+        corpus.append((f"{url}?offset={batch * cards}", "".join(batch_cards)))
+    return corpus
@@ -0,0 +1,293 @@
+"""
+Offline throughput benchmark of the extraction stages.
+
+Serves a recorded corpus of static, paginated and load-more archives and their article pages
+from a local FixtureServer, runs every stage of the extraction on it and prints the pages and
+articles processed per second. Results can be saved as a baseline and compared in later runs,
+failing when a metric drops by more than the tolerance.
+
+Usage:
+    python -m app.benchmarks.extraction [--rounds N] [--save PATH] [--compare PATH] [--tolerance T]
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from typing import Callable, List, Optional
+import httpx
+from app.benchmarks.corpus import (
+    SOURCE,
+    PAGED_SOURCE,
+    LOAD_MORE_SOURCE,
+    archive_corpus,
+    article_corpus,
+    load_more_corpus,
+    paged_corpus,
+)
+from app.benchmarks.server import FixtureServer
+from app.core.article_processing import process_articles_base, process_articles_content
+from app.core.fetcher import ContentFetcher
+from app.core.scheduler import CrawlScheduler
+from app.core.scraper import find_cards, obtain_urls
+from app.utils import date_formatter
+from app.utils.html_parser import make_soup
+from app.utils.http_cache import HttpCache
+
+DATE_BASE = date(2022, 1, 31)
+DATE_CUTOFF = date(2021, 12, 1)
+URL_DAYS = 3650
+
+STAGES = (
+    "urls",
+    "fetch_archives",
+    "fetch_articles",
+    "parse",
+    "process_articles_base",
+    "process_articles_content",
+    "dates",
+)
+
+
+class BenchmarkCorpus:
+    """
+    Archive pages of every layout together with the article pages they link to.
+
+    Attributes:
+        archives (list): (source, url, html) tuples of the static, paginated and load-more archives.
+        articles (list): Base articles listed by the static archives.
+        pages (dict): HTML of every page, by URL.
+    """
+
+    def __init__(self, days: int = 10, cards: int = 40, articles: int = 50):
+        self.archives = [(SOURCE, u, h) for u, h, _ in archive_corpus(days, cards)]
+        self.archives += [(PAGED_SOURCE, u, h) for u, h in paged_corpus(days, cards)]
+        self.archives += [
+            (LOAD_MORE_SOURCE, u, h) for u, h in load_more_corpus(days, cards)
+        ]
+        self.articles = []
+        for source, url, html in self.archives:
+            if source is SOURCE:
+                self.articles += process_articles_base(
+                    find_cards(source, html), source, DATE_BASE, DATE_CUTOFF, url
+                )[0]
+        bodies = article_corpus(articles)
+        self.pages = {url: html for _, url, html in self.archives}
+        for index, article in enumerate(self.articles):
+            self.pages[str(article.Link)] = bodies[index % len(bodies)]
+
+
+def _measure(rounds: int, stage: Callable[[], tuple]) -> tuple[int, int, float]:
+    pages = articles = 0
+    seconds = 0.0
+    for _ in range(rounds):
+        start = time.perf_counter()
+        stage_pages, stage_articles = stage()
+        seconds += time.perf_counter() - start
+        pages += stage_pages or 0
+        articles += stage_articles or 0
+    return pages, articles, seconds
+
+
+def _rates(pages: int, articles: int, seconds: float) -> dict:
+    return {
+        "pages_per_sec": pages / seconds if pages else None,
+        "articles_per_sec": articles / seconds if articles else None,
+    }
+
+
+def _date_texts() -> List[str]:
+    # THE SOURCE FORMAT, ALTERNATIVE FORMATS REACHED BY FALLBACK AND RELATIVE DATES
+    texts = []
+    for offset in range(365):
+        day = DATE_BASE - timedelta(days=offset)
+        texts.append(day.strftime("%d/%m/%Y"))
+        texts.append(day.strftime("%B %d, %Y"))
+        texts.append(day.isoformat())
+    texts += [f"{days} days ago" for days in range(1, 30)]
+    return texts
+
+
+def run(rounds: int = 3, days: int = 10, cards: int = 40) -> dict:
+    """
+    Runs every stage on the corpus and returns its pages and articles per second.
+
+    Args:
+        rounds (int): Number of times each stage is repeated.
+        days (int): Number of pages of each archive layout.
+        cards (int): Number of article cards of each archive page.
+
+    Returns:
+        dict: The 'pages_per_sec' and 'articles_per_sec' of every stage, None when the stage
+            does not handle pages or articles.
+    """
+    corpus = BenchmarkCorpus(days, cards)
+    results = {}
+
+    results["urls"] = _rates(
+        *_measure(
+            rounds,
+            lambda: (
+                len(
+                    obtain_urls(SOURCE, DATE_BASE, DATE_BASE - timedelta(days=URL_DAYS))
+                ),
+                None,
+            ),
+        )
+    )
+
+    server = FixtureServer(corpus.pages)
+    with server, tempfile.TemporaryDirectory() as cache_dir:
+
+        def fetch_archives():
+            with httpx.Client() as client:
+                for _, url, _ in corpus.archives:
+                    client.get(server.url_for(url)).raise_for_status()
+            return len(corpus.archives), None
+
+        async def fetch_all_articles():
+            scheduler = CrawlScheduler(rate=1e6, burst=10**6, concurrency=32)
+            async with ContentFetcher(
+                cache=HttpCache(cache_dir), scheduler=scheduler
+            ) as fetcher:
+                await asyncio.gather(
+                    *(
+                        fetcher.fetch(server.url_for(str(article.Link)), ttl=0)
+                        for article in corpus.articles
+                    )
+                )
+            return len(corpus.articles), len(corpus.articles)
+
+        results["fetch_archives"] = _rates(*_measure(rounds, fetch_archives))
+        results["fetch_articles"] = _rates(
+            *_measure(rounds, lambda: asyncio.run(fetch_all_articles()))
+        )
+
+    parsed = [
+        (source, url, find_cards(source, html)) for source, url, html in corpus.archives
+    ]
+    results["parse"] = _rates(
+        *_measure(
+            rounds,
+            lambda: (
+                len(corpus.archives),
+                sum(
+                    len(find_cards(source, html)) for source, _, html in corpus.archives
+                ),
+            ),
+        )
+    )
+
+    def process_base():
+        for source, url, cards in parsed:
+            process_articles_base(cards, source, DATE_BASE, DATE_CUTOFF, url)
+        return len(parsed), sum(len(cards) for _, _, cards in parsed)
+
+    results["process_articles_base"] = _rates(*_measure(rounds, process_base))
+
+    soups = [
+        (article, make_soup(corpus.pages[str(article.Link)]))
+        for article in corpus.articles
+    ]
+
+    def process_content():
+        for article, soup in soups:
+            process_articles_content(article, soup)
+        return len(soups), len(soups)
+
+    results["process_articles_content"] = _rates(*_measure(rounds, process_content))
+
+    texts = _date_texts()
+
+    def parse_dates():
+        date_formatter._parse_absolute.cache_clear()
+        for text in texts:
+            date_formatter.format_date_str(text, SOURCE["date_format"])
+        return None, len(texts)
+
+    results["dates"] = _rates(*_measure(rounds, parse_dates))
+    return results
+
+
+def save_baseline(results: dict, path: str, rounds: int):
+    """Stores benchmark results as the baseline of later runs."""
+    baseline = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "rounds": rounds,
+        "results": results,
+    }
+    with open(path, "w", encoding="utf-8") as baseline_file:
+        json.dump(baseline, baseline_file, indent=2)
+
+
+def compare(results: dict, baseline: dict, tolerance: float = 0.25) -> List[tuple]:
+    """
+    Compares benchmark results with a baseline.
+
+    Args:
+        results (dict): Results of the current run.
+        baseline (dict): Baseline as stored by 'save_baseline'.
+        tolerance (float): Relative drop of a metric that counts as a regression.
+
+    Returns:
+        List[tuple]: (stage, metric, baseline, current, change, regressed) for every metric
+            present in both, where 'change' is relative to the baseline.
+    """
+    rows = []
+    for stage, metrics in results.items():
+        for metric, current in metrics.items():
+            previous = baseline["results"].get(stage, {}).get(metric)
+            if not previous or current is None:
+                continue
+            change = current / previous - 1
+            rows.append((stage, metric, previous, current, change, change < -tolerance))
+    return rows
+
+
+def _format_rate(rate: Optional[float]) -> str:
+    return f"{rate:>14.1f}" if rate is not None else f"{'-':>14}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--save", metavar="PATH", help="store the results as baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = run(args.rounds)
+    print(f"{'stage':<26} {'pages/s':>14} {'articles/s':>14}")
+    for stage in STAGES:
+        print(
+            f"{stage:<26} {_format_rate(results[stage]['pages_per_sec'])} "
+            f"{_format_rate(results[stage]['articles_per_sec'])}"
+        )
+
+    regressed = False
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            baseline = json.load(baseline_file)
+        print(f"\nCompared with baseline from {baseline['created']}:")
+        for stage, metric, previous, current, change, worse in compare(
+            results, baseline, args.tolerance
+        ):
+            regressed = regressed or worse
+            print(
+                f"{stage:<26} {metric:<17} {previous:>12.1f} -> {current:>12.1f} "
+                f"{change:>+8.1%}{'  REGRESSION' if worse else ''}"
+            )
+    if args.save:
+        save_baseline(results, args.save, args.rounds)
+        print(f"\nBaseline saved to {args.save}")
+    sys.exit(1 if regressed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark of the HTML parser backends used for article extraction.
+
+Parses a synthetic corpus of archive and article pages with every available backend, runs
+'process_articles_base'/'process_articles_content' on the result, checks that the extracted
+articles match the 'html.parser' output and prints the pages parsed per second.
+
+Usage:
+    python -m app.benchmarks.parsers [--rounds N]
+"""
+
+import argparse
+import time
+from datetime import date
+from app.benchmarks.corpus import SOURCE, archive_corpus, article_corpus
+from app.core.article_processing import process_articles_base, process_articles_content
+from app.models import ArticleBase
+from app.utils.html_parser import PARSER_BACKENDS, make_soup
+
+ARTICLE_BASE = ArticleBase(
+    Title="Benchmark",
+    Date="2022-01-10",
+    Link="http://news.example.com/2022/01/10/story-0",
+    Source=SOURCE["base_url"],
+)
+
+
+def extract_archive(html: str, url: str, backend: str):
+    soup = make_soup(html, backend)
+    cards = soup.find_all("div", class_=SOURCE["article_selector"])
+    articles, _ = process_articles_base(
+        cards, SOURCE, date(2022, 1, 31), date(2021, 12, 1), url
+    )
+    return [(a.Title, a.Date, str(a.Link)) for a in articles]
+
+
+def extract_article(html: str, backend: str):
+    article = process_articles_content(ARTICLE_BASE, make_soup(html, backend))
+    return article.Paragraphs, [(r.Text, str(r.Link)) for r in article.References]
+
+
+def run(rounds: int = 3) -> dict:
+    """
+    Runs the benchmark and returns pages per second and parity per backend.
+    """
+    archives = archive_corpus()
+    articles = article_corpus()
+    expected_archives = [extract_archive(h, u, "html.parser") for u, h, _ in archives]
+    expected_articles = [extract_article(h, "html.parser") for h in articles]
+
+    results = {}
+    for backend in PARSER_BACKENDS:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            archive_output = [extract_archive(h, u, backend) for u, h, _ in archives]
+        archive_rate = rounds * len(archives) / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for _ in range(rounds):
+            article_output = [extract_article(h, backend) for h in articles]
+        article_rate = rounds * len(articles) / (time.perf_counter() - start)
+
+        results[backend] = {
+            "archive_pages_per_sec": archive_rate,
+            "article_pages_per_sec": article_rate,
+            "matches_html_parser": archive_output == expected_archives
+            and article_output == expected_articles,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'backend':<12} {'archive p/s':>12} {'article p/s':>12}  parity")
+    for backend, result in run(args.rounds).items():
+        print(
+            f"{backend:<12} {result['archive_pages_per_sec']:>12.1f} "
+            f"{result['article_pages_per_sec']:>12.1f}  "
+            f"{'ok' if result['matches_html_parser'] else 'MISMATCH'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
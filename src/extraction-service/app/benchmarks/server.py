@@ -0,0 +1,66 @@
+"""
+Local HTTP server replaying a fixture corpus, so benchmarks fetch pages without any network.
+"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+from urllib.parse import urlsplit
+
+
+def route_of(url: str) -> str:
+    """Returns the path and query of a URL, which identify a page regardless of its host."""
+    parts = urlsplit(url)
+    return f"{parts.path or '/'}?{parts.query}" if parts.query else parts.path or "/"
+
+
+class FixtureServer:
+    """
+    Serves recorded pages from a background thread on a free local port.
+
+    Pages are looked up by path and query only, so a corpus recorded for any host can be served
+    as is and requested through 'url_for'. Unknown routes answer 404.
+
+    Args:
+        pages (Dict[str, str]): HTML of every page, by original URL.
+
+    Usage:
+        with FixtureServer(pages) as server:
+            httpx.get(server.url_for("http://news.example.com/archive/2022/01/10"))
+    """
+
+    def __init__(self, pages: Dict[str, str]):
+        routes = {route_of(url): html.encode("utf-8") for url, html in pages.items()}
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                body = routes.get(self.path)
+                self.send_response(200 if body is not None else 404)
+                body = body if body is not None else b"Not Found"
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def url_for(self, url: str) -> str:
+        """Returns the local URL serving the page recorded for 'url'."""
+        return self.url + route_of(url)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -1,8 +1,26 @@
 from app.models import ArticleBase, Article, Reference
-from app.utils.url_helpers import fix_links, is_valid_url
+from app.utils.url_helpers import canonical_link
 from app.utils.date_formatter import format_date_str
 from app.utils.logger import DefaultLogger
-import re
+from app.core.compiled_source import CompiledSource, get_compiled_source
+from datetime import datetime
+
+
+def extract_card_fields(article, compiled: CompiledSource) -> dict:
+    """
+    Reads the fields of an article card element.
+
+    Returns:
+        dict: The card 'title' and 'date' texts (None if the card has no title or <time>
+            element) and the raw 'href' of its link (None if it has no link).
+    """
+    title_elem = compiled.find_title(article)
+    date_elem = article.find("time")
+    return {
+        "title": title_elem.get_text(strip=True) if title_elem else None,
+        "date": date_elem.get_text(strip=True) if date_elem else None,
+        "href": compiled.find_href(article, title_elem),
+    }
 
 
 def process_articles_base(
@@ -13,10 +31,37 @@ def process_articles_base(
 
     This function extracts article details such as title, date, and link from the provided HTML elements,
     validates and formats the date, and determines if the article falls within the specified date range.
-    It also checks if articles are older than the cutoff date.
+    It also checks if articles are older than the cutoff date. The matchers come from the source's
+    CompiledSource, built once per source configuration.
+
+    Args:
+        article_soup: A list of parsed elements (BeautifulSoup or a compatible backend) representing article elements.
+        source (dict): Source configuration containing base URL and scraping parameters.
+        date_base (datetime.date): The base date for filtering articles.
+        date_cutoff (datetime.date): The exclusive cutoff date for filtering articles.
+        url (str): The URL from which articles are being scraped.
+
+    Returns:
+        tuple:
+            - List[ArticleBase]: A list of valid ArticleBase objects.
+            - bool: A flag indicating whether an article older than the cutoff date was encountered.
+    """
+    compiled = get_compiled_source(source)
+    cards = (extract_card_fields(article, compiled) for article in article_soup)
+    return process_article_cards(cards, source, date_base, date_cutoff, url)
+
+
+def process_article_cards(
+    cards, source, date_base, date_cutoff, url
+) -> tuple[list[ArticleBase], bool]:
+    """
+    Processes the fields of article cards and filters valid articles.
+
+    The cards are dictionaries with the 'title', 'date' and 'href' of each article, read either
+    from parsed HTML elements ('extract_card_fields') or directly in the browser.
 
     Args:
-        article_soup: A list of BeautifulSoup objects representing article elements.
+        cards: An iterable of card field dictionaries.
         source (dict): Source configuration containing base URL and scraping parameters.
         date_base (datetime.date): The base date for filtering articles.
         date_cutoff (datetime.date): The exclusive cutoff date for filtering articles.
@@ -29,87 +74,69 @@ def process_articles_base(
     """
     valid_articles = []
     older_than_cutoff = False
+    compiled = get_compiled_source(source)
+    url_date = None
 
-    for article in article_soup:
-        title_elem = (
-            article.find("h2")
-            or article.find("h3")
-            or article.find("h4")
-            or article.find("a")
-        )
-        date_elem = article.find("time")
-        link_elem = (
-            (title_elem.find("a") if title_elem else None)
-            or article.find("a")
-            or article.parent
-        )
-
+    for card in cards:
         # IF NO LINK - SKIP ARTICLE
-        if not link_elem or not link_elem.get("href"):
+        if not card["href"]:
             DefaultLogger().get_logger().warning(
-                f"No link found in article from source {source['base_url']}"
+                f"No link found in article from source {compiled.base_url}"
             )
             continue
-        else:
-            link = fix_links(source["base_url"], link_elem.get("href"))
-
-        # IF NO DATE -> DATE = 'NoDate'
-        if not date_elem:
-            if "{day}" in source["url"]:
-                match = re.search(r"/(\d{4})/(\d{1,2})/(\d{1,2})/", link)
-                if match:
-                    year_extracted, month_extracted, day_extracted = match.groups()
-                    date_text = f"{day_extracted}/{month_extracted}/{year_extracted}"
+        link = canonical_link(compiled.base_url, card["href"])
+        if link is None:
+            DefaultLogger().get_logger().warning(
+                f"Invalid link {card['href']} in article from source {compiled.base_url}"
+            )
+            continue
+
+        # IF NO DATE -> DATE = TODAY
+        date_text = card["date"]
+        if date_text is not None:
+            try:
+                date_article = (
+                    format_date_str(date_text, compiled.date_format, compiled.base_url)
+                    if date_text
+                    else datetime.today().date()
+                )
+            except Exception as e:
+                DefaultLogger().get_logger().error(
+                    "Error formatting date", exc_info=True
+                )
+                continue
+        elif compiled.dates_from_urls:
+            date_article = compiled.date_from_link(link)
+            if date_article:
+                DefaultLogger().get_logger().debug(
+                    f"Date extracted from article link: {date_article}"
+                )
+            else:
+                url_date = url_date or compiled.date_from_url(url)
+                date_article = url_date
+                if date_article:
                     DefaultLogger().get_logger().debug(
-                        f"Date extracted from article link: {date_text}"
+                        f"Date extracted from archive URL: {date_article}"
                     )
                 else:
-                    template = source["url"]
-                    pattern = re.escape(template)
-                    pattern = pattern.replace(r"\{year\}", r"(?P<year>\d{4})")
-                    pattern = pattern.replace(r"\{month\}", r"(?P<month>\d{1,2})")
-                    pattern = pattern.replace(r"\{day\}", r"(?P<day>\d{1,2})")
-                    pattern = pattern.replace(r"\{page\}", r"\d+")
-
-                    match = re.search(pattern, url)
-                    if match:
-                        year_extracted = match.group("year")
-                        month_extracted = match.group("month")
-                        day_extracted = match.group("day")
-
-                        date_text = (
-                            f"{day_extracted}/{month_extracted}/{year_extracted}"
-                        )
-                        DefaultLogger().get_logger().debug(
-                            f"Date extracted from archive URL: {date_text}"
-                        )
-                    else:
-                        DefaultLogger().get_logger().warning(
-                            "Date couldn't be extracted from archive URL"
-                        )
-                        date_text = "NoDate"
-            else:
-                DefaultLogger().get_logger().warning(
-                    "Date couldn't be found in the article"
-                )
-                date_text = "NoDate"
+                    DefaultLogger().get_logger().warning(
+                        "Date couldn't be extracted from archive URL"
+                    )
+                    date_article = datetime.today().date()
         else:
-            date_text = date_elem.get_text(strip=True) or date_elem.today().isoformat()
+            DefaultLogger().get_logger().warning(
+                "Date couldn't be found in the article"
+            )
+            date_article = datetime.today().date()
 
         # IF NO TITLE -> TITLE = 'NoTitle'
-        if not title_elem:
+        if card["title"] is None:
             DefaultLogger().get_logger().warning(
                 "Title couldn't be found in the article"
             )
             title = "NoTitle"
         else:
-            title = title_elem.get_text(strip=True)
-
-        try:
-            date_article = format_date_str(date_text, source["date_format"])
-        except Exception as e:
-            DefaultLogger().get_logger().error("Error formatting date", exc_info=True)
-            continue
+            title = card["title"]
 
         if date_article > date_base:
             DefaultLogger().get_logger().debug(f"Article date is newer than base date")
@@ -122,7 +149,7 @@ def process_articles_base(
 
         valid_articles.append(
             ArticleBase(
-                Title=title, Date=date_article, Link=link, Source=source["base_url"]
+                Title=title, Date=date_article, Link=link, Source=compiled.base_url
             )
         )
 
@@ -139,7 +166,7 @@ def process_articles_content(article: ArticleBase, article_soup) -> Article:
 
     Args:
         article (ArticleBase): The base article information.
-        article_soup: BeautifulSoup object of the article's HTML content.
+        article_soup: Parsed document (BeautifulSoup or a compatible backend) of the article's HTML content.
 
     Returns:
         Article: An Article object with the content, paragraphs, and references.
@@ -147,6 +174,7 @@ def process_articles_content(article: ArticleBase, article_soup) -> Article:
     paragraphs = []
     references = []
     seen_links = set()
+    source_url = str(article.Source)
 
     article_container = article_soup.find("main")
     if article_container is None:
@@ -164,15 +192,16 @@ def process_articles_content(article: ArticleBase, article_soup) -> Article:
                 if not href:
                     continue
 
-                full_url = fix_links(str(article.Source), href)
-
-                if is_valid_url(full_url):
-                    link_text = a.get_text(strip=True) or ""
-
-                    if full_url not in seen_links and link_text != "":
-                        seen_links.add(full_url)
-                        references.append(Reference(Text=link_text, Link=full_url))
-                else:
+                full_url = canonical_link(source_url, href)
+                if full_url is None or full_url in seen_links:
                     continue
 
+                link_text = a.get_text(strip=True)
+                if link_text:
+                    seen_links.add(full_url)
+                    # THE LINK IS ALREADY VALIDATED BY 'canonical_link'
+                    references.append(
+                        Reference.model_construct(Text=link_text, Link=full_url)
+                    )
+
     return Article(**article.model_dump(), Paragraphs=paragraphs, References=references)
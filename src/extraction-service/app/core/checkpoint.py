@@ -0,0 +1,173 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import date
+from typing import Iterable, List, Optional
+from app.models import ArticleBase
+from app.utils.logger import DefaultLogger
+
+CHECKPOINT_DIR = os.getenv("CHECKPOINT_DIR", "/tmp/factually/checkpoints")
+CHECKPOINT_INTERVAL = float(os.getenv("CHECKPOINT_INTERVAL", "5"))
+
+
+def _frontier_key(source: dict, url: str) -> str:
+    return f"{source.get('id') or source['base_url']} {url}"
+
+
+class JobCheckpoint:
+    """
+    Persisted crawl frontier of a long-running extraction job.
+
+    Records the archive URLs already crawled, the last page crawled of every paginated URL and
+    the base articles discovered but not yet stored. The checkpoint is written to
+    '<CHECKPOINT_DIR>/<job id>.json' at most every CHECKPOINT_INTERVAL seconds, so a job that is
+    restarted with the same id (for instance a redelivered RabbitMQ task) continues from it
+    instead of starting over. Work done after the last write is repeated, and the duplicated
+    articles are dropped by the known links filter.
+
+    Args:
+        job_id (str): Identifier of the job, stable across restarts.
+        date_base (date): The base date of the job.
+        date_cutoff (date): The cutoff date of the job.
+        directory (Optional[str]): Directory where checkpoints are stored, defaults to CHECKPOINT_DIR.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        date_base: date,
+        date_cutoff: date,
+        directory: Optional[str] = None,
+    ):
+        self.job_id = job_id
+        self.range = [date_base.isoformat(), date_cutoff.isoformat()]
+        safe_id = re.sub(r"[^\w.-]", "_", job_id)
+        self.path = os.path.join(directory or CHECKPOINT_DIR, f"{safe_id}.json")
+        self._lock = threading.Lock()
+        self._saved_at = 0.0
+        self._dirty = False
+        self.done_urls: set[str] = set()
+        self.pages: dict[str, int] = {}
+        self.pending: dict[str, dict] = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as checkpoint_file:
+                state = json.load(checkpoint_file)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError):
+            DefaultLogger().get_logger().warning(
+                f"Ignoring unreadable checkpoint {self.path}", exc_info=True
+            )
+            return
+        if state.get("range") != self.range:
+            DefaultLogger().get_logger().warning(
+                f"Ignoring checkpoint of job {self.job_id} for another date range"
+            )
+            return
+        self.done_urls = set(state.get("done_urls", []))
+        self.pages = state.get("pages", {})
+        self.pending = state.get("pending", {})
+        DefaultLogger().get_logger().info(
+            f"Resuming job {self.job_id}: {len(self.done_urls)} URLs done, "
+            f"{len(self.pending)} articles pending"
+        )
+
+    @property
+    def resumed(self) -> bool:
+        return bool(self.done_urls or self.pages or self.pending)
+
+    def is_done(self, source: dict, url: str) -> bool:
+        return _frontier_key(source, url) in self.done_urls
+
+    def next_page(self, source: dict, url: str) -> int:
+        """Returns the first page of a paginated archive URL that has not been crawled."""
+        return self.pages.get(_frontier_key(source, url), 0) + 1
+
+    def page_done(self, source: dict, url: str, page: int):
+        with self._lock:
+            self.pages[_frontier_key(source, url)] = page
+            self._changed()
+
+    def url_done(self, source: dict, url: str):
+        key = _frontier_key(source, url)
+        with self._lock:
+            self.done_urls.add(key)
+            self.pages.pop(key, None)
+            self._changed()
+
+    def pending_articles(self) -> List[ArticleBase]:
+        """Returns the articles discovered before the restart that were not stored yet."""
+        with self._lock:
+            return [ArticleBase(**article) for article in self.pending.values()]
+
+    def add_pending(self, articles: Iterable[ArticleBase]):
+        with self._lock:
+            for article in articles:
+                self.pending[article.id] = article.model_dump(mode="json")
+            self._changed()
+
+    def remove_pending(self, articles: Iterable[ArticleBase]):
+        with self._lock:
+            for article in articles:
+                self.pending.pop(article.id, None)
+            self._changed()
+
+    def _changed(self):
+        self._dirty = True
+        if time.monotonic() - self._saved_at >= CHECKPOINT_INTERVAL:
+            self._save()
+
+    def save(self):
+        """Writes the checkpoint to disk if it changed since the last write."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def _save(self):
+        state = {
+            "job_id": self.job_id,
+            "range": self.range,
+            "done_urls": sorted(self.done_urls),
+            "pages": self.pages,
+            "pending": self.pending,
+        }
+        tmp_path = f"{self.path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as checkpoint_file:
+                json.dump(state, checkpoint_file)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            DefaultLogger().get_logger().warning(
+                f"Could not write checkpoint {self.path}", exc_info=True
+            )
+            return
+        self._saved_at = time.monotonic()
+        self._dirty = False
+
+    def delete(self):
+        """Removes the checkpoint once the job has completed."""
+        with self._lock:
+            self._dirty = False
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+
+
+def open_checkpoint(
+    job_id: Optional[str], date_base: date, date_cutoff: date
+) -> Optional[JobCheckpoint]:
+    """
+    Returns the checkpoint of a job, resuming the persisted one if it exists.
+
+    Jobs without a stable id are not checkpointed.
+    """
+    if not job_id:
+        return None
+    return JobCheckpoint(job_id, date_base, date_cutoff)
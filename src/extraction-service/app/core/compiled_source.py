@@ -0,0 +1,107 @@
+import re
+import threading
+from datetime import date
+from typing import Optional
+
+# TITLE FALLBACKS IN PRIORITY ORDER, THE LINK IS ALWAYS THE LAST RESORT
+HEADING_TAGS = ("h2", "h3", "h4")
+
+_LINK_DATE_PATTERN = re.compile(r"/(\d{4})/(\d{1,2})/(\d{1,2})/")
+
+
+def _safe_date(year: str, month: str, day: str) -> Optional[date]:
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+class CompiledSource:
+    """
+    Extraction plan of a source, compiled once from its configuration.
+
+    Holds everything 'process_articles_base' would otherwise rebuild for every article card:
+    the archive URL regex derived from the URL template, the link date regex and the date
+    strategy. Plans are shared by every thread crawling the source, so they hold no per-card state.
+
+    Args:
+        source (dict): Source configuration containing base URL and scraping parameters.
+    """
+
+    def __init__(self, source: dict):
+        self.base_url = source["base_url"]
+        self.date_format = source.get("date_format")
+        # DATES CAN ONLY BE RECOVERED FROM LINKS OR ARCHIVE URLS OF DAILY ARCHIVES
+        self.dates_from_urls = "{day}" in source["url"]
+        self.url_date_pattern = (
+            self._compile_template(source["url"]) if self.dates_from_urls else None
+        )
+        self.link_date_pattern = _LINK_DATE_PATTERN
+
+    @staticmethod
+    def _compile_template(template: str) -> Optional[re.Pattern]:
+        if not all(field in template for field in ("{year}", "{month}", "{day}")):
+            return None
+        pattern = re.escape(template)
+        pattern = pattern.replace(r"\{year\}", r"(?P<year>\d{4})")
+        pattern = pattern.replace(r"\{month\}", r"(?P<month>\d{1,2})")
+        pattern = pattern.replace(r"\{day\}", r"(?P<day>\d{1,2})")
+        pattern = pattern.replace(r"\{page\}", r"\d+")
+        return re.compile(pattern)
+
+    def find_title(self, article):
+        """Returns the title element of a card, trying the heading tags in priority order."""
+        for tag in HEADING_TAGS:
+            title_elem = article.find(tag)
+            if title_elem:
+                return title_elem
+        return article.find("a")
+
+    def find_href(self, article, title_elem) -> Optional[str]:
+        """Returns the raw link of a card, or None if the card has no link."""
+        link_elem = (
+            (title_elem.find("a") if title_elem else None)
+            or article.find("a")
+            or article.parent
+        )
+        if not link_elem:
+            return None
+        return link_elem.get("href") or None
+
+    def date_from_link(self, link: str) -> Optional[date]:
+        """Returns the date embedded in an article link as /YYYY/MM/DD/, if any."""
+        match = self.link_date_pattern.search(link)
+        return _safe_date(*match.groups()) if match else None
+
+    def date_from_url(self, url: str) -> Optional[date]:
+        """Returns the date of a daily archive URL according to the source URL template."""
+        if self.url_date_pattern is None:
+            return None
+        match = self.url_date_pattern.search(url)
+        if not match:
+            return None
+        return _safe_date(match.group("year"), match.group("month"), match.group("day"))
+
+
+_compiled_sources: dict[tuple, CompiledSource] = {}
+_compiled_sources_lock = threading.Lock()
+
+
+def get_compiled_source(source: dict) -> CompiledSource:
+    """
+    Returns the compiled extraction plan of a source, building it on first use.
+
+    Plans are cached by source id together with the configuration fields they are built from,
+    so an edited source gets a new plan.
+    """
+    key = (
+        source.get("id") or source["base_url"],
+        source["url"],
+        source["base_url"],
+        source.get("date_format"),
+    )
+    compiled = _compiled_sources.get(key)
+    if compiled is None:
+        with _compiled_sources_lock:
+            compiled = _compiled_sources.setdefault(key, CompiledSource(source))
+    return compiled
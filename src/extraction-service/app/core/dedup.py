@@ -0,0 +1,206 @@
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from datetime import date, timedelta
+from typing import Iterable, Optional
+from app.models import Article, ArticleAlias
+from app.utils.logger import DefaultLogger
+from app.utils.services import get_article_fingerprints
+
+DEDUP_MAX_DISTANCE = int(os.getenv("DEDUP_MAX_DISTANCE", "3"))
+DEDUP_INDEX_SIZE = int(os.getenv("DEDUP_INDEX_SIZE", "200000"))
+DEDUP_WINDOW_DAYS = int(os.getenv("DEDUP_WINDOW_DAYS", "7"))
+# SHORT TEXTS (TEASERS, PAYWALL STUBS) SHARE TOO MUCH BOILERPLATE TO BE COMPARED
+DEDUP_MIN_TOKENS = int(os.getenv("DEDUP_MIN_TOKENS", "50"))
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def _hash(shingle: str) -> str:
+    digest = hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest()
+    return format(int.from_bytes(digest, "big"), f"0{FINGERPRINT_BITS}b")
+
+
+def simhash(paragraphs: Iterable[str]) -> Optional[int]:
+    """
+    Computes the 64-bit SimHash of a text over its word shingles.
+
+    Texts that differ in a few words (a different byline, an added sentence) get fingerprints
+    that differ in a few bits, so near-duplicates are found by Hamming distance.
+
+    Args:
+        paragraphs (Iterable[str]): Paragraphs of the text.
+
+    Returns:
+        Optional[int]: The fingerprint, or None if the text has fewer than DEDUP_MIN_TOKENS words.
+    """
+    tokens = _TOKEN_PATTERN.findall(" ".join(paragraphs).lower())
+    if len(tokens) < DEDUP_MIN_TOKENS:
+        return None
+    shingles = {
+        " ".join(tokens[i : i + SHINGLE_SIZE])
+        for i in range(len(tokens) - SHINGLE_SIZE + 1)
+    }
+    # EVERY BIT IS SET WHEN MOST SHINGLE HASHES HAVE IT SET
+    hashes = [_hash(shingle) for shingle in shingles]
+    half = len(hashes) / 2
+    bits = "".join("1" if column.count("1") > half else "0" for column in zip(*hashes))
+    return int(bits, 2)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+class FingerprintIndex:
+    """
+    Bounded index of recent fingerprints supporting near-duplicate lookups.
+
+    Fingerprints are split into 'max_distance' + 1 bands. Two fingerprints within
+    'max_distance' bits of each other agree on at least one whole band, so a lookup only
+    compares against the fingerprints sharing a band instead of the whole index. The oldest
+    entries are evicted once the index holds 'capacity' fingerprints.
+
+    Args:
+        max_distance (int): Maximum Hamming distance between near-duplicates.
+        capacity (int): Maximum number of fingerprints kept.
+    """
+
+    def __init__(
+        self, max_distance: int = DEDUP_MAX_DISTANCE, capacity: int = DEDUP_INDEX_SIZE
+    ):
+        self.max_distance = max_distance
+        self.capacity = capacity
+        bands = max_distance + 1
+        width = FINGERPRINT_BITS // bands
+        self._bands = [
+            (index * width, (1 << width) - 1 if index < bands - 1 else None)
+            for index in range(bands)
+        ]
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._buckets: dict[tuple, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _keys(self, fingerprint: int):
+        for band, (shift, mask) in enumerate(self._bands):
+            value = fingerprint >> shift
+            yield band, value & mask if mask is not None else value
+
+    def add(self, fingerprint: int, article_id: str):
+        """Indexes the fingerprint of an article, evicting the oldest one if full."""
+        if article_id in self._entries:
+            return
+        self._entries[article_id] = fingerprint
+        for key in self._keys(fingerprint):
+            self._buckets.setdefault(key, set()).add(article_id)
+        if len(self._entries) > self.capacity:
+            self.remove(next(iter(self._entries)))
+
+    def remove(self, article_id: str):
+        """Removes the fingerprint of an article from the index, if present."""
+        fingerprint = self._entries.pop(article_id, None)
+        if fingerprint is None:
+            return
+        for key in self._keys(fingerprint):
+            bucket = self._buckets[key]
+            bucket.discard(article_id)
+            if not bucket:
+                del self._buckets[key]
+
+    def find(self, fingerprint: int) -> Optional[tuple[str, int]]:
+        """
+        Returns the closest indexed article within 'max_distance' bits, if any.
+
+        Returns:
+            Optional[tuple]: The article id and its distance to the fingerprint.
+        """
+        best = None
+        for key in self._keys(fingerprint):
+            for article_id in self._buckets.get(key, ()):
+                distance = hamming_distance(fingerprint, self._entries[article_id])
+                if distance <= self.max_distance and (
+                    best is None or distance < best[1]
+                ):
+                    best = (article_id, distance)
+        return best
+
+
+class Deduplicator:
+    """
+    Clusters near-duplicate articles, such as syndicated wire stories, before they are stored.
+
+    The first article of a cluster is its canonical copy and is stored with its fingerprint.
+    Later members are turned into aliases pointing to it, so their text is not stored, embedded
+    or analysed again. The index is seeded with the fingerprints of the stored articles published
+    around the scraped date range.
+
+    Args:
+        index (Optional[FingerprintIndex]): Index to use, defaults to a new one.
+    """
+
+    def __init__(self, index: Optional[FingerprintIndex] = None):
+        self.index = index or FingerprintIndex()
+
+    async def load(self, date_base: date, date_cutoff: date):
+        """
+        Seeds the index with stored fingerprints, at most DEDUP_WINDOW_DAYS outside the range.
+
+        If the storage service can't be reached, only the articles of this run are compared.
+        """
+        window = timedelta(days=DEDUP_WINDOW_DAYS)
+        try:
+            stored = await get_article_fingerprints(
+                (date_cutoff - window).isoformat(), (date_base + window).isoformat()
+            )
+        except Exception as e:
+            DefaultLogger().get_logger().warning(
+                f"Stored fingerprints lookup failed, deduplicating within the run only: {e}"
+            )
+            return
+        for entry in stored:
+            self.index.add(int(entry["Fingerprint"], 16), entry["id"])
+        DefaultLogger().get_logger().debug(f"Loaded {len(stored)} stored fingerprints")
+
+    def check(self, article: Article) -> Optional[ArticleAlias]:
+        """
+        Fingerprints an article and checks it against the index.
+
+        Canonical copies are indexed right away, so near-duplicates later in the same batch are
+        found too. The caller must 'forget' them if they could not be stored.
+
+        Returns:
+            Optional[ArticleAlias]: The alias to record if the article is a near-duplicate of an
+                indexed one, otherwise None, after indexing the article as a canonical copy.
+        """
+        fingerprint = simhash(article.Paragraphs or [])
+        if fingerprint is None:
+            return None
+        match = self.index.find(fingerprint)
+        if match is None:
+            article.Fingerprint = format(fingerprint, f"0{FINGERPRINT_BITS // 4}x")
+            self.index.add(fingerprint, article.id)
+            return None
+        canonical_id, distance = match
+        DefaultLogger().get_logger().debug(
+            f"{article.Link} is a near-duplicate of article {canonical_id} ({distance} bits)"
+        )
+        return ArticleAlias(
+            id=article.id,
+            Title=article.Title,
+            Date=article.Date,
+            Link=article.Link,
+            Source=article.Source,
+            CanonicalId=canonical_id,
+            Distance=distance,
+        )
+
+    def forget(self, articles: Iterable[Article]):
+        """Removes canonical copies that could not be stored, so nothing is aliased to them."""
+        for article in articles:
+            self.index.remove(article.id)
@@ -1,7 +1,126 @@
+import json
+import os
+import queue
+import threading
 import time
+from contextlib import ExitStack, contextmanager
+from typing import List, Optional
 from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from app.utils.logger import DefaultLogger
+
+DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "4"))
+# DRIVERS RESERVED FOR THE SELENIUM FALLBACK OF CONTENT FETCHING, SO IT NEVER WAITS ON THE CRAWL
+FALLBACK_POOL_SIZE = int(os.getenv("FALLBACK_POOL_SIZE", "1"))
+DRIVER_MAX_PAGES = int(os.getenv("DRIVER_MAX_PAGES", "50"))
+SETTLE_QUIET_MS = int(os.getenv("SETTLE_QUIET_MS", "500"))
+SETTLE_TIMEOUT = float(os.getenv("SETTLE_TIMEOUT", "10"))
+SETTLE_POLL_INTERVAL = 0.1
+SCROLL_MAX_ITERATIONS = int(os.getenv("SCROLL_MAX_ITERATIONS", "10"))
+
+# DEFAULT BLOCKING PROFILE: FONTS, MEDIA, ANALYTICS, AD NETWORKS AND SOCIAL/VIDEO EMBEDS
+_DEFAULT_BLOCKED_URLS = (
+    "*.woff",
+    "*.woff2",
+    "*.ttf",
+    "*.otf",
+    "*.eot",
+    "*.mp4",
+    "*.webm",
+    "*.m3u8",
+    "*.mp3",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*googletagservices.com*",
+    "*googlesyndication.com*",
+    "*doubleclick.net*",
+    "*adservice.google.*",
+    "*amazon-adsystem.com*",
+    "*adnxs.com*",
+    "*criteo.com*",
+    "*criteo.net*",
+    "*pubmatic.com*",
+    "*rubiconproject.com*",
+    "*taboola.com*",
+    "*outbrain.com*",
+    "*scorecardresearch.com*",
+    "*quantserve.com*",
+    "*chartbeat.com*",
+    "*chartbeat.net*",
+    "*hotjar.com*",
+    "*connect.facebook.net*",
+    "*platform.twitter.com*",
+    "*youtube.com/embed*",
+    "*player.vimeo.com*",
+)
+BLOCKED_URLS = [
+    pattern.strip()
+    for pattern in os.getenv("BLOCKED_URLS", ",".join(_DEFAULT_BLOCKED_URLS)).split(",")
+    if pattern.strip()
+]
+
+# Installs a MutationObserver on first call and returns the milliseconds elapsed since the
+# last node added or removed or the end of the last network request, whichever is more recent.
+# Attribute and text changes are ignored, tickers and carousels would never let the page settle
+_SETTLE_SCRIPT = """
+if (!window.__factuallySettle) {
+    window.__factuallySettle = {lastMutation: performance.now()};
+    new MutationObserver(function () {
+        window.__factuallySettle.lastMutation = performance.now();
+    }).observe(document, {childList: true, subtree: true});
+}
+var lastResponse = 0;
+performance.getEntriesByType("resource").forEach(function (entry) {
+    lastResponse = Math.max(lastResponse, entry.responseEnd);
+});
+return performance.now() - Math.max(window.__factuallySettle.lastMutation, lastResponse);
+"""
+
+# Finds the article cards of the page like BeautifulSoup's find_all("div", class_=selector):
+# the selector matches a single class, or the whole class attribute when it holds several
+_FIND_CARDS_JS = """
+function findCards(selector) {
+    var multiple = /\\s/.test(selector);
+    return Array.prototype.filter.call(document.getElementsByTagName("div"), function (div) {
+        return multiple ? div.getAttribute("class") === selector : div.classList.contains(selector);
+    });
+}
+"""
+
+_COUNT_CARDS_SCRIPT = _FIND_CARDS_JS + "return findCards(arguments[0]).length;"
+
+# Reads the title, <time> text and raw href of the article cards from index arguments[2] on,
+# mirroring 'extract_card_fields', with texts joined like BeautifulSoup's get_text(strip=True)
+_CARDS_SCRIPT = _FIND_CARDS_JS + """
+var selector = arguments[0], titleTags = arguments[1], start = arguments[2];
+function text(element) {
+    var parts = [], walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT), node;
+    while ((node = walker.nextNode())) {
+        var part = node.nodeValue.trim();
+        if (part) parts.push(part);
+    }
+    return parts.join("");
+}
+var cards = findCards(selector);
+var result = [];
+cards.slice(start).forEach(function (card) {
+    var title = null;
+    for (var i = 0; i < titleTags.length && !title; i++) {
+        title = card.querySelector(titleTags[i]);
+    }
+    title = title || card.querySelector("a");
+    var link = (title && title.querySelector("a")) || card.querySelector("a") || card.parentElement;
+    var time = card.querySelector("time");
+    result.push({
+        title: title ? text(title) : null,
+        date: time ? text(time) : null,
+        href: (link && link.getAttribute("href")) || null
+    });
+});
+return {total: cards.length, cards: result};
+"""
 
 
 def init_driver():
@@ -25,27 +144,428 @@ def init_driver():
         "profile.managed_default_content_settings.stylesheets": 2,
     }
     chrome_options.add_experimental_option("prefs", prefs)
+    # NETWORK EVENTS ARE LOGGED TO COUNT THE REQUESTS BLOCKED BY THE BLOCKLIST
+    chrome_options.add_experimental_option(
+        "perfLoggingPrefs", {"enableNetwork": True, "enablePage": False}
+    )
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
 
     service = Service(executable_path="/usr/bin/chromedriver")
     return webdriver.Chrome(service=service, options=chrome_options)
 
 
-def scroll_down(driver, pausa: int = 1):
+def source_blocklist(source: dict) -> List[str]:
+    """
+    Returns the URL patterns blocked while rendering the pages of a source.
+
+    Sources add their own patterns to the default profile through 'blocked_urls', and can turn
+    request blocking off with 'block_requests'.
+    """
+    if source.get("block_requests") is False:
+        return []
+    return BLOCKED_URLS + list(source.get("blocked_urls") or [])
+
+
+def apply_blocklist(driver, patterns: List[str]):
+    """
+    Makes the browser block the requests matching the given URL patterns.
+
+    The blocklist is enforced by Chrome through the DevTools Protocol ('Network.setBlockedURLs'),
+    and it is only sent again when it differs from the one already applied to the driver.
+    Drivers without DevTools support are left unchanged.
+
+    Args:
+        driver: The Selenium WebDriver instance controlling the browser.
+        patterns (List[str]): URL patterns, where '*' matches any sequence of characters.
+    """
+    if getattr(driver, "blocked_urls", None) == patterns:
+        return
+    execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+    if execute_cdp_cmd is None:
+        return
+    if getattr(driver, "blocked_urls", None) is None:
+        execute_cdp_cmd("Network.enable", {})
+    execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    driver.blocked_urls = patterns
+
+
+def count_blocked_requests(driver) -> int:
+    """
+    Returns the number of requests blocked by the browser since the last call.
+
+    The count is read from the performance log, which is drained in the process.
+    """
+    get_log = getattr(driver, "get_log", None)
+    if get_log is None:
+        return 0
+    try:
+        entries = get_log("performance")
+    except WebDriverException:
+        return 0
+    blocked = 0
+    for entry in entries:
+        message = json.loads(entry["message"]).get("message", {})
+        if message.get("method") == "Network.loadingFailed" and message.get(
+            "params", {}
+        ).get("blockedReason"):
+            blocked += 1
+    return blocked
+
+
+def wait_for_settle(
+    driver, quiet_ms: int = SETTLE_QUIET_MS, timeout: float = SETTLE_TIMEOUT
+) -> bool:
+    """
+    Waits until the page has settled: no DOM mutation and no finished network request for 'quiet_ms'.
+
+    A MutationObserver installed in the page records the time nodes were last added or removed,
+    ignoring attribute and text changes that animated pages make forever, and the Resource Timing
+    entries give the time the last network request finished. The page is polled
+    until both are older than 'quiet_ms' or until 'timeout' seconds have elapsed.
+
+    Args:
+        driver: The Selenium WebDriver instance controlling the browser.
+        quiet_ms (int, optional): Quiet period in milliseconds that marks the page as settled.
+        timeout (float, optional): Maximum time in seconds to wait.
+
+    Returns:
+        bool: True if the page settled, False if the timeout was reached first.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        idle_ms = driver.execute_script(_SETTLE_SCRIPT)
+        if idle_ms is None or idle_ms >= quiet_ms:
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(min(SETTLE_POLL_INTERVAL, (quiet_ms - idle_ms) / 1000))
+
+
+def scroll_down(
+    driver, max_scrolls: int = SCROLL_MAX_ITERATIONS, timeout: float = SETTLE_TIMEOUT
+) -> tuple[float, float]:
     """
     Scrolls down the web page until no further scrolling is possible.
 
-    This function repeatedly scrolls down the page and waits for a specified pause interval
-    until the page height remains unchanged, indicating the bottom of the page has been reached.
+    After every scroll step the function waits for the page to settle instead of sleeping a fixed
+    interval, and stops as soon as the page height remains unchanged. The number of scroll steps
+    and the total time spent are capped by 'max_scrolls' and 'timeout'.
 
     Args:
         driver: The Selenium WebDriver instance controlling the browser.
-        pausa (int, optional): The pause duration in seconds between scroll attempts. Default is 1 second.
+        max_scrolls (int, optional): Maximum number of scroll steps.
+        timeout (float, optional): Maximum total time in seconds spent scrolling.
+
+    Returns:
+        tuple: Seconds spent issuing scroll steps and seconds spent waiting for the page to settle.
     """
+    deadline = time.monotonic() + timeout
+    scroll_time = settle_time = 0.0
     last_height = driver.execute_script("return document.body.scrollHeight")
-    while True:
+    for _ in range(max_scrolls):
+        start = time.perf_counter()
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(pausa)
+        scrolled = time.perf_counter()
+        wait_for_settle(driver, timeout=max(0.0, deadline - time.monotonic()))
+        settle_time += time.perf_counter() - scrolled
         new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
+        scroll_time += scrolled - start
+        if new_height == last_height or time.monotonic() >= deadline:
             break
         last_height = new_height
+    return scroll_time, settle_time
+
+
+def render_page(
+    driver, url: str, scroll: bool = True, blocked_urls: Optional[List[str]] = None
+) -> dict:
+    """
+    Loads a page, scrolls it if required and waits for it to settle.
+
+    Requests matching the blocklist are not sent by the browser.
+
+    Args:
+        driver: The Selenium WebDriver instance controlling the browser.
+        url (str): The URL to load.
+        scroll (bool, optional): Whether the page must be scrolled to load lazy content.
+        blocked_urls (Optional[List[str]]): URL patterns to block, defaults to BLOCKED_URLS.
+
+    Returns:
+        dict: Seconds spent in each phase, under the 'render', 'scroll' and 'settle' keys,
+            and the number of requests blocked while loading the page, under 'blocked'.
+    """
+    apply_blocklist(driver, BLOCKED_URLS if blocked_urls is None else blocked_urls)
+    start = time.perf_counter()
+    driver.get(url)
+    timings = {"render": time.perf_counter() - start, "scroll": 0.0, "settle": 0.0}
+    if scroll:
+        timings["scroll"], timings["settle"] = scroll_down(driver)
+    else:
+        start = time.perf_counter()
+        wait_for_settle(driver)
+        timings["settle"] = time.perf_counter() - start
+    timings["blocked"] = count_blocked_requests(driver)
+    DefaultLogger().get_logger().debug(
+        f"Rendered {url} in {timings['render']:.2f}s "
+        f"(scroll {timings['scroll']:.2f}s, settle {timings['settle']:.2f}s, "
+        f"{timings['blocked']} requests blocked)"
+    )
+    return timings
+
+
+def query_cards(
+    driver, selector: str, title_tags: tuple, start: int = 0
+) -> tuple[int, list[dict]]:
+    """
+    Reads the fields of the article cards of the loaded page inside the browser.
+
+    Only a compact list of card fields crosses the WebDriver protocol, instead of the whole
+    page source that would otherwise be downloaded and parsed again in Python.
+
+    Args:
+        driver: The Selenium WebDriver instance controlling the browser.
+        selector (str): Class of the article card elements.
+        title_tags (tuple): Heading tags holding the card title, in priority order.
+        start (int, optional): Index of the first card to read, to skip cards already read.
+
+    Returns:
+        tuple: The total number of cards in the page and the 'title', 'date' and 'href'
+            fields of the cards from 'start' on.
+    """
+    result = driver.execute_script(_CARDS_SCRIPT, selector, list(title_tags), start)
+    return result["total"], result["cards"]
+
+
+def count_cards(driver, selector: str) -> int:
+    """Returns the number of article cards in the loaded page."""
+    return driver.execute_script(_COUNT_CARDS_SCRIPT, selector)
+
+
+def wait_for_cards(
+    driver, selector: str, seen: int, timeout: float = SETTLE_TIMEOUT
+) -> int:
+    """
+    Waits until new article cards are appended to the page and the page has settled.
+
+    The card count is polled until it exceeds 'seen', then the function waits for DOM mutations
+    to stop so the whole batch of appended cards is in place.
+
+    Args:
+        driver: The Selenium WebDriver instance controlling the browser.
+        selector (str): Class of the article card elements.
+        seen (int): Number of cards already in the page.
+        timeout (float, optional): Maximum time in seconds to wait.
+
+    Returns:
+        int: The number of cards in the page, which is 'seen' or less if none was appended in time.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        total = count_cards(driver, selector)
+        if total > seen:
+            wait_for_settle(driver, timeout=max(0.0, deadline - time.monotonic()))
+            return count_cards(driver, selector)
+        if time.monotonic() >= deadline:
+            return total
+        time.sleep(SETTLE_POLL_INTERVAL)
+
+
+class PooledDriver:
+    """
+    Thin proxy around a WebDriver that counts the pages loaded through it.
+
+    Every attribute other than 'get' is delegated to the wrapped driver, so the proxy can be
+    used anywhere a WebDriver is expected.
+    """
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.healthy = True
+        self.blocked_urls = None
+
+    def get(self, url: str):
+        self.pages += 1
+        return self.driver.get(url)
+
+    def __getattr__(self, name):
+        return getattr(self.driver, name)
+
+
+class LazyDriver:
+    """
+    Proxy that leases a driver from a pool the first time the browser is used.
+
+    Every attribute access and assignment is delegated to the leased PooledDriver, so the proxy
+    can be used anywhere a driver is expected. See 'DriverPool.lazy_lease'.
+    """
+
+    def __init__(self, pool: "DriverPool", stack: ExitStack):
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "_stack", stack)
+        object.__setattr__(self, "_driver", None)
+
+    @property
+    def leased(self) -> bool:
+        return self._driver is not None
+
+    def _lease(self) -> PooledDriver:
+        if self._driver is None:
+            object.__setattr__(
+                self, "_driver", self._stack.enter_context(self._pool.lease())
+            )
+        return self._driver
+
+    def __getattr__(self, name):
+        return getattr(self._lease(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._lease(), name, value)
+
+
+class DriverPool:
+    """
+    Pool of warm headless WebDrivers with lease/return semantics.
+
+    Drivers are created lazily up to 'size' and reused across leases. A driver is health-checked
+    before it is handed out, and it is quit and replaced once it has loaded 'max_pages' pages
+    or raised a WebDriverException, which caps Chromium memory growth.
+
+    Args:
+        size (int): Maximum number of drivers alive at the same time.
+        max_pages (int): Number of page loads after which a driver is recycled.
+        factory (callable): Function creating a new WebDriver. Defaults to 'init_driver'.
+    """
+
+    def __init__(
+        self,
+        size: int = DRIVER_POOL_SIZE,
+        max_pages: int = DRIVER_MAX_PAGES,
+        factory=init_driver,
+    ):
+        self.size = size
+        self.max_pages = max_pages
+        self._factory = factory
+        self._idle = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    @contextmanager
+    def lease(self):
+        """
+        Leases a driver from the pool for the duration of the context.
+
+        Yields:
+            PooledDriver: A healthy driver that is returned to the pool on exit.
+        """
+        self._slots.acquire()
+        driver = None
+        try:
+            driver = self._acquire()
+            yield driver
+        except WebDriverException:
+            if driver is not None:
+                driver.healthy = False
+            raise
+        finally:
+            if driver is not None:
+                self._release(driver)
+            self._slots.release()
+
+    @contextmanager
+    def lazy_lease(self):
+        """
+        Leases a driver from the pool only once the browser is first used within the context.
+
+        Crawls that may not need the browser, such as those of static sources, don't launch or
+        hold a driver unless one of their pages has to be rendered.
+
+        Yields:
+            LazyDriver: A proxy leasing a driver on first use, returned to the pool on exit.
+        """
+        with ExitStack() as stack:
+            yield LazyDriver(self, stack)
+
+    def _acquire(self) -> PooledDriver:
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return PooledDriver(self._factory())
+            if self._is_healthy(driver):
+                return driver
+            self._quit(driver)
+
+    def _release(self, driver: PooledDriver):
+        if not driver.healthy or driver.pages >= self.max_pages:
+            DefaultLogger().get_logger().debug(
+                f"Recycling driver after {driver.pages} pages"
+            )
+            self._quit(driver)
+        else:
+            self._idle.put(driver)
+
+    @staticmethod
+    def _is_healthy(driver: PooledDriver) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except WebDriverException:
+            DefaultLogger().get_logger().warning("Discarding unresponsive driver")
+            return False
+
+    @staticmethod
+    def _quit(driver: PooledDriver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            DefaultLogger().get_logger().warning("Error quitting driver", exc_info=True)
+
+    def close(self):
+        """Quits every idle driver held by the pool."""
+        while True:
+            try:
+                self._quit(self._idle.get_nowait())
+            except queue.Empty:
+                break
+
+
+_pool: DriverPool = None
+_fallback_pool: DriverPool = None
+_pool_lock = threading.Lock()
+
+
+def get_driver_pool() -> DriverPool:
+    """
+    Returns the process-wide DriverPool used to crawl archives, creating it on first use.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DriverPool()
+        return _pool
+
+
+def get_fallback_driver_pool() -> DriverPool:
+    """
+    Returns the process-wide DriverPool of the Selenium content fallback, creating it on first use.
+
+    It is separate from the crawl pool: crawl threads may block handing articles to the content
+    stage while holding their drivers, and the content stage may wait for the fallback.
+    """
+    global _fallback_pool
+    with _pool_lock:
+        if _fallback_pool is None:
+            _fallback_pool = DriverPool(size=FALLBACK_POOL_SIZE)
+        return _fallback_pool
+
+
+def close_driver_pool():
+    """
+    Closes the process-wide DriverPools and resets the singleton instances.
+    """
+    global _pool, _fallback_pool
+    with _pool_lock:
+        for pool in (_pool, _fallback_pool):
+            if pool is not None:
+                pool.close()
+        _pool = _fallback_pool = None
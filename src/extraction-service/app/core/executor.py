@@ -0,0 +1,218 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+from uuid import uuid4
+from app.utils.logger import DefaultLogger
+
+SCRAPE_WORKERS = int(os.getenv("SCRAPE_WORKERS", "2"))
+
+logger = DefaultLogger().get_logger()
+
+
+class JobCancelled(Exception):
+    """Raised inside a scrape job once its cancellation has been requested."""
+
+
+class ScrapeJob:
+    """
+    Bookkeeping for a blocking scrape job running in the worker pool.
+
+    Attributes:
+        id (str): Unique identifier of the job.
+        name (str): Human readable description of the job.
+        cancel_event (threading.Event): Set when the job has been asked to stop.
+        submitted_at (float): Epoch timestamp at which the job was submitted.
+        started_at (Optional[float]): Epoch timestamp at which a worker picked the job up.
+    """
+
+    def __init__(self, job_id: str, name: str):
+        self.id = job_id
+        self.name = name
+        self.cancel_event = threading.Event()
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": "running" if self.started_at else "queued",
+            "cancelled": self.cancel_event.is_set(),
+            "submitted_at": self.submitted_at,
+            "started_at": self.started_at,
+        }
+
+
+_current_job: contextvars.ContextVar[Optional[ScrapeJob]] = contextvars.ContextVar(
+    "current_scrape_job", default=None
+)
+
+
+def raise_if_cancelled():
+    """
+    Cooperative cancellation point for blocking scrape code.
+
+    Scrapers call this between pages and articles. It raises JobCancelled when the job the
+    calling thread is working for has been cancelled, and is a no-op outside of a job.
+
+    Raises:
+        JobCancelled: If the current job has been cancelled.
+    """
+    job = _current_job.get()
+    if job is not None and job.cancel_event.is_set():
+        raise JobCancelled(f"Scrape job {job.id} was cancelled")
+
+
+class ScrapeExecutor:
+    """
+    Runs blocking Selenium/HTTP scrape jobs on a bounded thread pool off the asyncio event loop.
+
+    Jobs are awaited from the loop, so health checks, API requests and AMQP heartbeats keep being
+    served while a scrape runs. At most 'max_workers' jobs run at the same time and the rest wait
+    in the pool queue. Cancellation is cooperative: it sets the job's cancel event, which the
+    scrapers observe through 'raise_if_cancelled'.
+
+    Args:
+        max_workers (int): Maximum number of scrape jobs running concurrently.
+    """
+
+    def __init__(self, max_workers: int = SCRAPE_WORKERS):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="scrape-job"
+        )
+        self._jobs: dict[str, ScrapeJob] = {}
+
+    @property
+    def jobs(self) -> list[ScrapeJob]:
+        return list(self._jobs.values())
+
+    async def run(
+        self,
+        fn: Callable,
+        *args,
+        name: Optional[str] = None,
+        job_id: Optional[str] = None,
+    ):
+        """
+        Runs a blocking function as a scrape job and waits for its completion.
+
+        Args:
+            fn (Callable): The blocking function to run.
+            *args: Positional arguments passed to the function.
+            name (Optional[str]): Description of the job, defaults to the function name.
+            job_id (Optional[str]): Identifier of the job, a random UUID if omitted.
+
+        Inside a 'track' block the function runs as part of the tracked job, and 'name' and
+        'job_id' are ignored.
+
+        Returns:
+            The value returned by the function.
+
+        Raises:
+            JobCancelled: If the job was cancelled before or while running.
+        """
+        parent = _current_job.get()
+        job = parent or ScrapeJob(job_id or str(uuid4()), name or fn.__name__)
+        if parent is None:
+            self._jobs[job.id] = job
+        logger.info(f"Submitted scrape job {job.id} ({job.name})")
+
+        def run_job():
+            job.started_at = time.time()
+            _current_job.set(job)
+            raise_if_cancelled()
+            return fn(*args)
+
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._executor, functools.partial(context.run, run_job)
+            )
+        except asyncio.CancelledError:
+            job.cancel_event.set()
+            raise
+        finally:
+            if parent is None:
+                self._jobs.pop(job.id, None)
+            logger.info(
+                f"Scrape job {job.id} finished in {time.time() - job.submitted_at:.1f}s"
+            )
+
+    @contextlib.contextmanager
+    def track(self, name: str, job_id: Optional[str] = None):
+        """
+        Registers a job made of several steps, such as the stages of the extraction pipeline.
+
+        Scrape jobs run, threads started with 'asyncio.to_thread' and asyncio tasks created inside
+        the block belong to the job, so cancelling it stops every step at its next
+        'raise_if_cancelled'.
+
+        Args:
+            name (str): Human readable description of the job.
+            job_id (Optional[str]): Identifier of the job, a random UUID if omitted.
+
+        Yields:
+            ScrapeJob: The tracked job.
+        """
+        job = ScrapeJob(job_id or str(uuid4()), name)
+        job.started_at = time.time()
+        self._jobs[job.id] = job
+        token = _current_job.set(job)
+        try:
+            yield job
+        finally:
+            _current_job.reset(token)
+            self._jobs.pop(job.id, None)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Requests the cancellation of a job.
+
+        Returns:
+            bool: True if the job was known to the executor, False otherwise.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        job.cancel_event.set()
+        logger.info(f"Cancellation requested for scrape job {job_id}")
+        return True
+
+    def shutdown(self):
+        """Cancels every job and stops the worker pool without waiting for it."""
+        for job in self.jobs:
+            job.cancel_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+_instance: ScrapeExecutor = None
+
+
+def get_scrape_executor() -> ScrapeExecutor:
+    """
+    Returns a singleton instance of ScrapeExecutor.
+    """
+    global _instance
+    if _instance is None:
+        _instance = ScrapeExecutor()
+        logger.info(f"Initialized scrape executor with {_instance.max_workers} workers")
+    return _instance
+
+
+def shutdown_scrape_executor():
+    """
+    Shuts the ScrapeExecutor down and resets the singleton instance.
+    """
+    global _instance
+    if _instance is not None:
+        _instance.shutdown()
+        _instance = None
+        logger.info("Scrape executor shut down")
@@ -0,0 +1,226 @@
+import os
+import time
+import zlib
+from collections import deque
+from datetime import date, datetime
+from email.utils import parsedate_to_datetime
+from typing import Iterator, List, Optional
+from xml.etree.ElementTree import XMLPullParser, ParseError
+import httpx
+from pydantic import ValidationError
+from app.core.executor import raise_if_cancelled
+from app.core.fetcher import get_sync_client
+from app.core.scheduler import get_crawl_scheduler
+from app.models import ArticleBase
+from app.utils.logger import DefaultLogger
+from app.utils.metrics import get_metrics
+from app.utils.url_helpers import canonical_link
+
+FEED_BATCH_SIZE = int(os.getenv("FEED_BATCH_SIZE", "100"))
+FEED_MAX_DOCUMENTS = int(os.getenv("FEED_MAX_DOCUMENTS", "50"))
+
+# ELEMENTS HOLDING ONE ENTRY: RSS ITEM, ATOM ENTRY, SITEMAP URL AND SITEMAP INDEX CHILD
+_ENTRY_TAGS = ("item", "entry", "url", "sitemap")
+_LINK_TAGS = ("link", "loc")
+_TITLE_TAGS = ("title",)
+# IN ORDER OF PREFERENCE
+_DATE_TAGS = ("publication_date", "published", "pubDate", "date", "updated", "lastmod")
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_feed_date(text: Optional[str]) -> Optional[date]:
+    """
+    Parses an RFC 822 (RSS) or ISO 8601 (Atom, sitemaps) timestamp into a date.
+    """
+    if not text:
+        return None
+    text = text.strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00")).date()
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(text).date()
+    except (TypeError, ValueError):
+        return None
+
+
+class FeedEntry:
+    """
+    An entry of a feed or sitemap.
+
+    Attributes:
+        link (str): URL of the article, or of the child sitemap for sitemap index entries.
+        title (Optional[str]): Title of the article, if the document provides one.
+        published (Optional[date]): Publication or last modification date.
+        is_sitemap (bool): Whether the entry points to another sitemap.
+    """
+
+    __slots__ = ("link", "title", "published", "is_sitemap")
+
+    def __init__(self, link, title=None, published=None, is_sitemap=False):
+        self.link = link
+        self.title = title
+        self.published = published
+        self.is_sitemap = is_sitemap
+
+    @classmethod
+    def from_element(cls, element) -> Optional["FeedEntry"]:
+        link = title = None
+        dates = {}
+        for child in element.iter():
+            name = _local_name(child.tag)
+            if name in _LINK_TAGS and link is None:
+                # ATOM LINKS CARRY THE URL IN 'href', SKIPPING NON-ALTERNATE RELATIONS
+                if child.get("href"):
+                    if child.get("rel", "alternate") == "alternate":
+                        link = child.get("href")
+                elif child.text and child.text.strip():
+                    link = child.text.strip()
+            elif name in _TITLE_TAGS and title is None and child.text:
+                title = child.text.strip()
+            elif name in _DATE_TAGS and name not in dates:
+                dates[name] = child.text
+        if link is None:
+            return None
+        published = next(
+            (
+                parsed
+                for name in _DATE_TAGS
+                if (parsed := parse_feed_date(dates.get(name)))
+            ),
+            None,
+        )
+        is_sitemap = _local_name(element.tag) == "sitemap"
+        return cls(link, title, published, is_sitemap)
+
+
+def iter_feed_entries(
+    url: str, client: Optional[httpx.Client] = None
+) -> Iterator[FeedEntry]:
+    """
+    Streams the entries of an RSS/Atom feed, a sitemap or a sitemap index.
+
+    The document is parsed incrementally with an XMLPullParser while it is downloaded, and
+    every entry element is cleared once it has been read, so only the entries are kept in
+    memory. Gzipped sitemaps ('.gz') are decompressed on the fly. The entries are yielded once
+    the response is closed and the scheduler slot is released, so a slow consumer never holds
+    the domain slot or the connection.
+
+    Args:
+        url (str): URL of the document.
+        client (Optional[httpx.Client]): Client to use, defaults to the shared blocking client.
+
+    Yields:
+        FeedEntry: The entries of the document, in document order.
+
+    Raises:
+        httpx.HTTPError: If the request fails or the response status is not successful.
+        xml.etree.ElementTree.ParseError: If the document is not well-formed XML.
+    """
+    client = client or get_sync_client()
+    parser = XMLPullParser(events=("end",))
+    decompressor = (
+        zlib.decompressobj(16 + zlib.MAX_WBITS) if url.lower().endswith(".gz") else None
+    )
+
+    entries = []
+
+    def drain():
+        for _, element in parser.read_events():
+            if _local_name(element.tag) in _ENTRY_TAGS:
+                entry = FeedEntry.from_element(element)
+                element.clear()
+                if entry is not None:
+                    entries.append(entry)
+
+    with get_crawl_scheduler().slot(url) as permit:
+        start = time.perf_counter()
+        with client.stream("GET", url) as response:
+            # LATENCY UNTIL THE HEADERS, THE BODY IS PARSED WHILE IT IS DOWNLOADED
+            latency = time.perf_counter() - start
+            permit.record(response)
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                if decompressor is not None:
+                    chunk = decompressor.decompress(chunk)
+                parser.feed(chunk)
+                drain()
+            parser.close()
+            drain()
+        get_metrics().record_fetch(url, latency, response.num_bytes_downloaded)
+    yield from entries
+
+
+def iter_feed_articles(
+    source: dict, feed_url: str, date_base: date, date_cutoff: date
+) -> Iterator[List[ArticleBase]]:
+    """
+    Discovers the articles of a source from its feed or sitemap, without rendering any page.
+
+    Sitemap indexes are followed breadth-first, skipping child sitemaps last modified before
+    the cutoff date, up to FEED_MAX_DOCUMENTS documents. Articles are filtered on the structured
+    publication dates of the entries and entries without a date are skipped.
+
+    Args:
+        source (dict): Source configuration.
+        feed_url (str): URL of the RSS/Atom feed, sitemap or sitemap index.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+
+    Yields:
+        List[ArticleBase]: Batches of up to FEED_BATCH_SIZE base articles.
+    """
+    logger = DefaultLogger().get_logger()
+    pending = deque([feed_url])
+    visited = set()
+    batch = []
+
+    while pending and len(visited) < FEED_MAX_DOCUMENTS:
+        url = pending.popleft()
+        if url in visited:
+            continue
+        visited.add(url)
+        raise_if_cancelled()
+
+        try:
+            for entry in iter_feed_entries(url):
+                if entry.is_sitemap:
+                    if entry.published is None or entry.published >= date_cutoff:
+                        pending.append(entry.link)
+                    continue
+                if entry.published is None:
+                    logger.debug(f"Skipping undated feed entry {entry.link}")
+                    continue
+                if not date_cutoff <= entry.published <= date_base:
+                    continue
+                link = canonical_link(source["base_url"], entry.link)
+                if link is None:
+                    logger.debug(f"Skipping feed entry with invalid link {entry.link}")
+                    continue
+                try:
+                    article = ArticleBase(
+                        Title=entry.title or "NoTitle",
+                        Date=entry.published,
+                        Link=link,
+                        Source=source["base_url"],
+                    )
+                except ValidationError:
+                    logger.debug(f"Skipping feed entry with invalid link {entry.link}")
+                    continue
+                batch.append(article)
+                if len(batch) >= FEED_BATCH_SIZE:
+                    yield batch
+                    batch = []
+        except (httpx.HTTPError, ParseError):
+            logger.warning(f"Could not read feed {url}", exc_info=True)
+
+    if pending:
+        logger.warning(
+            f"Stopped following sitemaps of {source['name']} after {FEED_MAX_DOCUMENTS} documents"
+        )
+    if batch:
+        yield batch
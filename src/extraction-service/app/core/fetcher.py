@@ -0,0 +1,346 @@
+import asyncio
+import os
+import time
+from typing import Callable, List, Optional
+import httpx
+from app.core.article_processing import process_articles_content
+from app.core.executor import JobCancelled, raise_if_cancelled
+from app.core.scheduler import (
+    CrawlScheduler,
+    get_crawl_scheduler,
+    THROTTLE_STATUS_CODES,
+)
+from app.models import ArticleBase, Article
+from app.utils.http_cache import (
+    CacheEntry,
+    HttpCache,
+    get_http_cache,
+    HTTP_CACHE_ARTICLE_TTL,
+)
+from app.utils.html_parser import declared_encoding, make_soup
+from app.utils.logger import DefaultLogger
+from app.utils.metrics import get_metrics
+
+FETCH_CONCURRENCY = int(os.getenv("FETCH_CONCURRENCY", "32"))
+FETCH_TIMEOUT = float(os.getenv("FETCH_TIMEOUT", "10"))
+FETCH_THROTTLE_RETRIES = int(os.getenv("FETCH_THROTTLE_RETRIES", "2"))
+# ARTICLE PAGES LARGER THAN THIS ARE ABORTED, SOURCES CAN SET THEIR OWN 'max_content_bytes'
+FETCH_MAX_BYTES = int(os.getenv("FETCH_MAX_BYTES", str(5 * 1024 * 1024)))
+
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+}
+
+_sync_client: httpx.Client = None
+
+
+class ContentRejected(Exception):
+    """Raised when a response is not downloaded because it is not HTML or exceeds its byte budget."""
+
+
+def is_html(content_type: Optional[str]) -> bool:
+    """Returns whether a Content-Type header denotes HTML. A missing header is given the benefit of the doubt."""
+    if not content_type:
+        return True
+    return content_type.split(";", 1)[0].strip().lower() in HTML_CONTENT_TYPES
+
+
+async def read_html_body(response: httpx.Response, max_bytes: int) -> bytes:
+    """
+    Reads the body of a streamed HTML response, aborting as soon as it exceeds 'max_bytes'.
+
+    The Content-Type and Content-Length headers are checked before any byte of the body is read.
+
+    Raises:
+        ContentRejected: If the response is not HTML or its body is larger than 'max_bytes'.
+    """
+    content_type = response.headers.get("content-type")
+    if not is_html(content_type):
+        raise ContentRejected(f"{response.url} is not HTML ({content_type})")
+    length = response.headers.get("content-length", "")
+    if length.isdigit() and int(length) > max_bytes:
+        raise ContentRejected(f"{response.url} declares {length} bytes")
+
+    chunks, size = [], 0
+    async for chunk in response.aiter_bytes():
+        size += len(chunk)
+        if size > max_bytes:
+            raise ContentRejected(f"{response.url} exceeds {max_bytes} bytes")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def get_sync_client() -> httpx.Client:
+    """
+    Returns a shared blocking httpx client for fetches made from scraper threads.
+    """
+    global _sync_client
+    if _sync_client is None:
+        _sync_client = httpx.Client(
+            headers=DEFAULT_HEADERS, timeout=FETCH_TIMEOUT, follow_redirects=True
+        )
+    return _sync_client
+
+
+class ContentFetcher:
+    """
+    Asynchronous article content fetcher built on a pooled HTTP/2 httpx client.
+
+    Requests are bounded by a global concurrency limit and scheduled per domain by the
+    CrawlScheduler, so a slow or throttling host only ties up its own slots while the rest of
+    the batch keeps flowing. Connections are kept alive and reused across requests to the same host.
+
+    Args:
+        concurrency (int): Maximum number of requests in flight overall.
+        timeout (float): Timeout in seconds applied to each request.
+        cache (Optional[HttpCache]): HTTP cache to use, defaults to the shared one.
+        scheduler (Optional[CrawlScheduler]): Per-domain scheduler, defaults to the shared one.
+        sources (Optional[List[dict]]): Configurations of the sources of the fetched articles,
+            whose 'max_content_bytes' override FETCH_MAX_BYTES.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = FETCH_CONCURRENCY,
+        timeout: float = FETCH_TIMEOUT,
+        cache: Optional[HttpCache] = None,
+        scheduler: Optional[CrawlScheduler] = None,
+        sources: Optional[List[dict]] = None,
+    ):
+        self._max_bytes = {
+            str(source["base_url"]).rstrip("/"): source["max_content_bytes"]
+            for source in sources or ()
+            if source.get("max_content_bytes")
+        }
+        self._global_limit = asyncio.Semaphore(concurrency)
+        self._scheduler = scheduler or get_crawl_scheduler()
+        self._cache = cache or get_http_cache()
+        self._client = httpx.AsyncClient(
+            http2=True,
+            headers=DEFAULT_HEADERS,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=concurrency,
+                max_keepalive_connections=concurrency,
+            ),
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        await self._client.aclose()
+
+    def max_bytes(self, article: ArticleBase) -> int:
+        """Returns the byte budget of an article page, as configured for its source."""
+        return self._max_bytes.get(str(article.Source).rstrip("/"), FETCH_MAX_BYTES)
+
+    async def fetch_entry(
+        self,
+        url: str,
+        ttl: int = HTTP_CACHE_ARTICLE_TTL,
+        max_bytes: int = FETCH_MAX_BYTES,
+    ) -> CacheEntry:
+        """
+        Downloads a page and returns its body and declared encoding, going through the HTTP cache.
+
+        A cached copy younger than 'ttl' is returned without any request. An older copy is
+        revalidated with a conditional GET and reused when the server answers 304 Not Modified.
+        Throttled requests (429/503) are retried up to FETCH_THROTTLE_RETRIES times, once the
+        scheduler lets the domain be contacted again.
+
+        The body is streamed: responses that are not HTML are dropped before their body is read,
+        and the download is aborted once it exceeds 'max_bytes', so the bandwidth and memory
+        spent on a page are bounded.
+
+        Args:
+            url (str): URL of the page.
+            ttl (int): Freshness lifetime in seconds of a cached copy.
+            max_bytes (int): Maximum size of the body.
+
+        Returns:
+            CacheEntry: The body, with the charset of the Content-Type header as its encoding.
+
+        Raises:
+            httpx.HTTPError: If the request fails or the response status is not successful.
+            ContentRejected: If the page is not HTML or is larger than 'max_bytes'.
+            JobCancelled: If the scrape job running the fetch has been cancelled.
+        """
+        # THE CACHE READS AND WRITES FILES, WHICH WOULD BLOCK THE EVENT LOOP
+        entry = await asyncio.to_thread(self._cache.get, url)
+        if entry is not None and entry.is_fresh(ttl):
+            return entry
+
+        headers = entry.conditional_headers() if entry is not None else None
+        for attempt in range(FETCH_THROTTLE_RETRIES + 1):
+            async with self._scheduler.async_slot(url) as permit, self._global_limit:
+                raise_if_cancelled()
+                start = time.perf_counter()
+                async with self._client.stream("GET", url, headers=headers) as response:
+                    latency = time.perf_counter() - start
+                    permit.record(response)
+                    try:
+                        if response.is_success and response.status_code != 304:
+                            body = await read_html_body(response, max_bytes)
+                    finally:
+                        get_metrics().record_fetch(
+                            url, latency, response.num_bytes_downloaded
+                        )
+            if response.status_code not in THROTTLE_STATUS_CODES:
+                break
+
+        if response.status_code == 304 and entry is not None:
+            await asyncio.to_thread(self._cache.refresh, entry, response.headers)
+            return entry
+
+        response.raise_for_status()
+        return await asyncio.to_thread(
+            self._cache.put, url, body, response.charset_encoding, response.headers
+        )
+
+    async def fetch(self, url: str, ttl: int = HTTP_CACHE_ARTICLE_TTL) -> str:
+        """Downloads a page and returns its decoded body (see 'fetch_entry')."""
+        return (await self.fetch_entry(url, ttl)).text
+
+    async def fetch_article(self, article: ArticleBase) -> Optional[Article]:
+        """
+        Fetches and processes the content of a single article.
+
+        The page is parsed from its bytes with its declared encoding, without charset detection.
+
+        Returns:
+            Optional[Article]: The processed article, or None if the HTTP fetch failed.
+
+        Raises:
+            ContentRejected: If the page is not HTML or exceeds the byte budget of its source.
+        """
+        try:
+            entry = await self.fetch_entry(
+                str(article.Link), max_bytes=self.max_bytes(article)
+            )
+        except httpx.HTTPError as e:
+            status_code = (
+                e.response.status_code
+                if isinstance(e, httpx.HTTPStatusError)
+                else "N/A"
+            )
+            DefaultLogger().get_logger().warning(
+                f"Requests failed for {article.Link} with status code {status_code}. Falling back to Selenium."
+            )
+            return None
+
+        start = time.perf_counter()
+        soup = make_soup(
+            entry.body, encoding=declared_encoding(entry.body, entry.encoding)
+        )
+        article_content = process_articles_content(article, soup)
+        get_metrics().record_parse(
+            str(article.Source), "article", time.perf_counter() - start
+        )
+        return article_content
+
+
+async def fetch_articles_content(
+    articles: List[ArticleBase],
+    fallback: Optional[Callable[[List[ArticleBase]], List[Article]]] = None,
+    fetcher: Optional[ContentFetcher] = None,
+    on_failed: Optional[Callable[[List[ArticleBase]], None]] = None,
+) -> List[Article]:
+    """
+    Fetches the content of many articles concurrently, handing failures to a fallback scraper.
+
+    Every article is fetched over HTTP through a ContentFetcher. Articles whose fetch fails are
+    pushed onto a separate queue that is drained in batches by the fallback (usually the Selenium
+    scraper) running in a worker thread, so blocked hosts are retried while the remaining HTTP
+    fetches keep going. The returned list keeps the order of the input articles.
+
+    Args:
+        articles (List[ArticleBase]): The articles to fetch content for.
+        fallback (Optional[Callable]): Blocking scraper called with batches of failed articles.
+        fetcher (Optional[ContentFetcher]): Fetcher to use. A new one is created and closed if omitted.
+        on_failed (Optional[Callable]): Called with the articles whose content could not be
+            extracted, neither over HTTP nor by the fallback. Pages rejected for their type or
+            size are not failures, since fetching them again would not help.
+
+    Returns:
+        List[Article]: The articles whose content could be extracted.
+
+    Raises:
+        JobCancelled: If the job was cancelled while the fallback was running.
+    """
+    if not articles:
+        return []
+
+    owns_fetcher = fetcher is None
+    fetcher = fetcher or ContentFetcher()
+
+    results: dict[str, Article] = {}
+    failed: asyncio.Queue = asyncio.Queue()
+
+    def report_failed(batch: List[ArticleBase]):
+        missing = [article for article in batch if article.id not in results]
+        if missing and on_failed is not None:
+            on_failed(missing)
+
+    async def fetch_one(article: ArticleBase):
+        try:
+            article_content = await fetcher.fetch_article(article)
+        except ContentRejected as e:
+            # THE BROWSER WOULD DOWNLOAD THE SAME DOCUMENT, SO THERE IS NO FALLBACK
+            DefaultLogger().get_logger().info(f"Skipping article: {e}")
+            get_metrics().record_content_fetch(str(article.Source), "rejected")
+            return
+        if article_content is not None:
+            get_metrics().record_content_fetch(str(article.Source), "http")
+            results[article.id] = article_content
+        elif fallback is not None:
+            get_metrics().record_content_fetch(str(article.Source), "fallback")
+            await failed.put(article)
+        else:
+            report_failed([article])
+
+    async def drain_failed():
+        while True:
+            batch = [await failed.get()]
+            while not failed.empty():
+                batch.append(failed.get_nowait())
+            try:
+                for article_content in await asyncio.to_thread(fallback, batch):
+                    results[article_content.id] = article_content
+            except JobCancelled:
+                raise
+            except Exception:
+                DefaultLogger().get_logger().error(
+                    f"Fallback scraping failed for {len(batch)} articles", exc_info=True
+                )
+            finally:
+                report_failed(batch)
+                for _ in batch:
+                    failed.task_done()
+
+    fallback_worker = asyncio.create_task(drain_failed()) if fallback else None
+    try:
+        await asyncio.gather(*(fetch_one(article) for article in articles))
+        if fallback_worker is not None:
+            # THE WORKER ONLY STOPS BY RAISING, WHEN THE JOB IS CANCELLED DURING THE FALLBACK
+            drained = asyncio.create_task(failed.join())
+            await asyncio.wait(
+                (drained, fallback_worker), return_when=asyncio.FIRST_COMPLETED
+            )
+            drained.cancel()
+            if fallback_worker.done():
+                fallback_worker.result()
+    finally:
+        if fallback_worker is not None:
+            fallback_worker.cancel()
+        if owns_fetcher:
+            await fetcher.close()
+
+    return [results[article.id] for article in articles if article.id in results]
@@ -0,0 +1,167 @@
+import asyncio
+import os
+import struct
+import threading
+import time
+from typing import Iterable, List
+from app.models import ArticleBase
+from app.utils.bloom import BloomFilter
+from app.utils.logger import DefaultLogger
+from app.utils.services import get_existing_links
+from app.utils.url_helpers import legacy_links
+
+KNOWN_LINKS_PATH = os.getenv("KNOWN_LINKS_PATH", "/tmp/factually/known-links.bloom")
+KNOWN_LINKS_CAPACITY = int(os.getenv("KNOWN_LINKS_CAPACITY", "2000000"))
+KNOWN_LINKS_ERROR_RATE = float(os.getenv("KNOWN_LINKS_ERROR_RATE", "0.001"))
+LINK_LOOKUP_BATCH_SIZE = int(os.getenv("LINK_LOOKUP_BATCH_SIZE", "500"))
+# SECONDS BETWEEN WRITES OF THE FILTER, WHICH IS ALSO WRITTEN AT THE END OF EVERY RUN
+KNOWN_LINKS_SAVE_INTERVAL = float(os.getenv("KNOWN_LINKS_SAVE_INTERVAL", "60"))
+
+
+class KnownLinks:
+    """
+    Persistent Bloom filter of article links already stored in the storage service.
+
+    Links are added once they have been posted to, or found in, the storage service. The filter
+    is written back to disk at most every KNOWN_LINKS_SAVE_INTERVAL seconds and at the end of
+    every run, so it survives restarts without being rewritten after every batch. Links added
+    after the last write are found again in the storage service by the next run.
+
+    Args:
+        path (str): File where the filter is persisted.
+    """
+
+    def __init__(self, path: str = KNOWN_LINKS_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._saved_at = time.monotonic()
+        self._dirty = False
+        try:
+            self._bloom = BloomFilter.load(path)
+            DefaultLogger().get_logger().info(f"Loaded known links filter from {path}")
+        except FileNotFoundError:
+            self._bloom = BloomFilter(KNOWN_LINKS_CAPACITY, KNOWN_LINKS_ERROR_RATE)
+        except (OSError, ValueError, struct.error):
+            # THE STORAGE SERVICE LOOKUPS STILL FIND THE STORED LINKS, ONLY SLOWER
+            DefaultLogger().get_logger().warning(
+                f"Could not load known links filter from {path}, starting empty",
+                exc_info=True,
+            )
+            self._bloom = BloomFilter(KNOWN_LINKS_CAPACITY, KNOWN_LINKS_ERROR_RATE)
+
+    def __contains__(self, link: str) -> bool:
+        return link in self._bloom
+
+    def add_many(self, links: Iterable[str]):
+        links = list(links)
+        if not links:
+            return
+        with self._lock:
+            self._bloom.update(links)
+            self._dirty = True
+            if time.monotonic() - self._saved_at >= KNOWN_LINKS_SAVE_INTERVAL:
+                self._save()
+
+    def save(self):
+        """Writes the filter to disk if it changed since the last write."""
+        with self._lock:
+            if self._dirty:
+                self._save()
+
+    def _save(self):
+        try:
+            self._bloom.save(self.path)
+        except OSError:
+            DefaultLogger().get_logger().warning(
+                f"Could not persist known links filter to {self.path}",
+                exc_info=True,
+            )
+            return
+        self._saved_at = time.monotonic()
+        self._dirty = False
+
+
+_instance: KnownLinks = None
+
+
+def get_known_links() -> KnownLinks:
+    """
+    Returns a singleton instance of KnownLinks.
+    """
+    global _instance
+    if _instance is None:
+        _instance = KnownLinks()
+    return _instance
+
+
+async def save_known_links():
+    """
+    Writes the known links filter to disk in a worker thread, if it has been loaded and changed.
+    """
+    if _instance is not None:
+        await asyncio.to_thread(_instance.save)
+
+
+def remember_articles(articles: Iterable[ArticleBase]):
+    """
+    Records the links of articles that have been stored so later runs skip them.
+    """
+    get_known_links().add_many(str(article.Link) for article in articles)
+
+
+async def filter_known_articles(articles: List[ArticleBase]) -> List[ArticleBase]:
+    """
+    Drops articles whose link is already stored, before their content is fetched.
+
+    Duplicated links within the batch are collapsed first. Links present in the local Bloom
+    filter are dropped without any request, and the remaining ones are checked against the
+    storage service with bulk lookups. Links reported as existing are added to the filter.
+    If the storage service can't be reached, only the local filter is applied.
+
+    Both lookups also match the forms links were stored in before they were normalized (see
+    'legacy_links'), so articles stored by earlier versions are not ingested again.
+
+    Args:
+        articles (List[ArticleBase]): Articles discovered from the archives.
+
+    Returns:
+        List[ArticleBase]: The articles whose link is not stored yet.
+    """
+    known_links = get_known_links()
+
+    unique_articles = {}
+    for article in articles:
+        unique_articles.setdefault(str(article.Link), article)
+    # EVERY FORM OF THE LINKS, MAPPED TO THE CANONICAL LINK
+    forms = {}
+    candidates = {}
+    for link, article in unique_articles.items():
+        link_forms = [link, *legacy_links(link)]
+        if not any(form in known_links for form in link_forms):
+            candidates[link] = article
+            forms.update((form, link) for form in link_forms)
+
+    existing_links = set()
+    links = list(forms)
+    try:
+        for i in range(0, len(links), LINK_LOOKUP_BATCH_SIZE):
+            existing_links.update(
+                forms[form]
+                for form in await get_existing_links(
+                    links[i : i + LINK_LOOKUP_BATCH_SIZE]
+                )
+            )
+    except Exception as e:
+        DefaultLogger().get_logger().warning(
+            f"Stored links lookup failed, relying on the local filter only: {e}"
+        )
+    known_links.add_many(existing_links)
+
+    new_articles = [
+        article for link, article in candidates.items() if link not in existing_links
+    ]
+    DefaultLogger().get_logger().info(
+        f"Skipping {len(articles) - len(new_articles)} already known articles, "
+        f"{len(new_articles)} left to fetch"
+    )
+    return new_articles
@@ -0,0 +1,60 @@
+import os
+from datetime import date
+from typing import Callable, Optional
+from app.utils.logger import DefaultLogger
+
+# UPPER BOUND OF THE EXPONENTIAL PROBING, FOR ARCHIVES THAT NEVER RUN OUT OF PAGES
+PAGE_SEARCH_MAX_PAGE = int(os.getenv("PAGE_SEARCH_MAX_PAGE", "4096"))
+
+
+def locate_first_page(
+    probe: Callable[[int], Optional[date]],
+    date_base: date,
+    max_page: int = PAGE_SEARCH_MAX_PAGE,
+) -> int:
+    """
+    Finds the first page of a newest-first paginated archive that overlaps the date range.
+
+    Pages are probed at 1, 2, 4, 8... until one holds an article not newer than 'date_base' or
+    has no articles at all, and the first such page is then located by binary search between
+    the last two probes. A backfill of an old window therefore probes O(log pages) pages instead
+    of crawling every newer page, and each page is probed at most once.
+
+    Args:
+        probe (Callable): Returns the date of the oldest article of a page, or None if the page
+            has no articles.
+        date_base (date): The base date of the range.
+        max_page (int): Last page that may be probed.
+
+    Returns:
+        int: The first page holding articles not newer than 'date_base'. The crawl from that
+            page stops by itself once it reaches the cutoff date, which is the last page.
+    """
+    probes = 0
+
+    def too_new(page: int) -> bool:
+        nonlocal probes
+        probes += 1
+        oldest = probe(page)
+        return oldest is not None and oldest > date_base
+
+    if not too_new(1):
+        return 1
+
+    # EXPONENTIAL PROBING: 'newer' IS TOO NEW, 'page' IS NOT (OR THE LAST PAGE ALLOWED)
+    newer, page = 1, 2
+    while page < max_page and too_new(page):
+        newer, page = page, min(page * 2, max_page)
+
+    # BINARY SEARCH OF THE FIRST PAGE THAT IS NOT TOO NEW
+    while page - newer > 1:
+        middle = (newer + page) // 2
+        if too_new(middle):
+            newer = middle
+        else:
+            page = middle
+
+    DefaultLogger().get_logger().info(
+        f"Located first page {page} for articles up to {date_base} in {probes} probes"
+    )
+    return page
@@ -0,0 +1,383 @@
+import asyncio
+import os
+from datetime import date
+from typing import List, Optional
+from app.core.checkpoint import JobCheckpoint, open_checkpoint
+from app.core.dedup import Deduplicator
+from app.core.executor import JobCancelled, get_scrape_executor, raise_if_cancelled
+from app.core.fetcher import ContentFetcher, fetch_articles_content
+from app.core.known_links import (
+    filter_known_articles,
+    remember_articles,
+    save_known_links,
+)
+from app.core.scraper import scrape_sources_base, scrape_articles_content_selenium
+from app.core.watermark import WatermarkTracker
+from app.models import ArticleAlias, ArticleBase, Article
+from app.utils.logger import DefaultLogger
+from app.utils.services import post_article_aliases, post_articles_bulk
+
+PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "64"))
+PIPELINE_CONTENT_WORKERS = int(os.getenv("PIPELINE_CONTENT_WORKERS", "4"))
+UPLOAD_BATCH_SIZE = int(os.getenv("UPLOAD_BATCH_SIZE", "50"))
+UPLOAD_RETRIES = int(os.getenv("UPLOAD_RETRIES", "3"))
+# SECONDS BEFORE THE FIRST UPLOAD RETRY, DOUBLED AFTER EVERY FAILED ATTEMPT
+UPLOAD_BACKOFF = float(os.getenv("UPLOAD_BACKOFF", "2"))
+# SECONDS BETWEEN CANCELLATION CHECKS OF A CRAWL THREAD WAITING ON A FULL QUEUE
+EMIT_POLL_INTERVAL = float(os.getenv("EMIT_POLL_INTERVAL", "1"))
+
+logger = DefaultLogger().get_logger()
+
+_END = object()
+
+
+class PipelineResult:
+    """
+    Outcome of an extraction pipeline run.
+
+    Attributes:
+        article_ids (List[str]): Identifiers of the articles created in the storage service.
+        discovered (int): Number of base articles discovered in the archives.
+        fetched (int): Number of articles whose content was extracted.
+        failed_batches (int): Number of upload batches that could not be stored.
+        duplicates (int): Number of near-duplicate articles recorded as aliases instead of stored.
+    """
+
+    def __init__(self):
+        self.article_ids: List[str] = []
+        self.discovered = 0
+        self.fetched = 0
+        self.failed_batches = 0
+        self.duplicates = 0
+
+
+async def upload_batch(
+    articles: List[Article],
+    result: PipelineResult,
+    checkpoint: Optional[JobCheckpoint] = None,
+    watermarks: Optional[WatermarkTracker] = None,
+):
+    """
+    Posts a batch of articles to the storage service, retrying with exponential backoff.
+
+    A batch that still fails after UPLOAD_RETRIES attempts is counted as failed and dropped, so
+    one failed POST only loses that batch instead of the whole run. Dropped articles stay
+    pending in the checkpoint, if any, so a resumed job retries them.
+
+    Returns:
+        bool: Whether the batch was stored.
+    """
+    for attempt in range(1, UPLOAD_RETRIES + 1):
+        try:
+            created_articles = await post_articles_bulk(articles)
+            break
+        except Exception as e:
+            logger.warning(
+                f"Upload of {len(articles)} articles failed (attempt {attempt}/{UPLOAD_RETRIES}): {e}"
+            )
+            if attempt < UPLOAD_RETRIES:
+                await asyncio.sleep(UPLOAD_BACKOFF * 2 ** (attempt - 1))
+    else:
+        logger.error(f"Dropping batch of {len(articles)} articles after failed uploads")
+        result.failed_batches += 1
+        if watermarks is not None:
+            watermarks.fail(articles)
+        return False
+
+    remember_articles(articles)
+    if checkpoint is not None:
+        checkpoint.remove_pending(articles)
+    if watermarks is not None:
+        watermarks.observe(articles)
+    result.article_ids.extend(article.get("id") for article in created_articles)
+    return True
+
+
+async def upload_aliases(
+    aliases: List[ArticleAlias],
+    result: PipelineResult,
+    checkpoint: Optional[JobCheckpoint] = None,
+) -> bool:
+    """
+    Records near-duplicate articles as aliases of their canonical copy in the storage service,
+    retrying with exponential backoff like 'upload_batch'.
+
+    Returns:
+        bool: Whether the aliases were recorded. Failed aliases are left to the caller.
+    """
+    if not aliases:
+        return True
+    for attempt in range(1, UPLOAD_RETRIES + 1):
+        try:
+            await post_article_aliases(aliases)
+            break
+        except Exception as e:
+            logger.warning(
+                f"Recording of {len(aliases)} article aliases failed (attempt {attempt}/{UPLOAD_RETRIES}): {e}"
+            )
+            if attempt < UPLOAD_RETRIES:
+                await asyncio.sleep(UPLOAD_BACKOFF * 2 ** (attempt - 1))
+    else:
+        return False
+    remember_articles(aliases)
+    if checkpoint is not None:
+        checkpoint.remove_pending(aliases)
+    result.duplicates += len(aliases)
+    return True
+
+
+class ArticleUploader:
+    """
+    Uploads fetched articles in batches, recording near-duplicates as aliases (see Deduplicator).
+
+    Aliases are only posted once the batch holding their canonical copy has been stored. When
+    that batch is dropped, its canonical copies are forgotten and their aliases are checked
+    again as regular articles, so no alias points to an article that was never stored.
+
+    Args:
+        deduplicator (Deduplicator): Fingerprint index of the run.
+        result (PipelineResult): Counters of the run.
+        checkpoint (Optional[JobCheckpoint]): Checkpoint whose pending articles are stored.
+        watermarks (Optional[WatermarkTracker]): Tracker of the stored articles.
+    """
+
+    def __init__(
+        self,
+        deduplicator: Deduplicator,
+        result: PipelineResult,
+        checkpoint: Optional[JobCheckpoint] = None,
+        watermarks: Optional[WatermarkTracker] = None,
+    ):
+        self.deduplicator = deduplicator
+        self.result = result
+        self.checkpoint = checkpoint
+        self.watermarks = watermarks
+        self._batch: List[Article] = []
+        self._aliases: List[tuple[ArticleAlias, Article]] = []
+
+    async def add(self, article: Article):
+        """Queues an article, uploading the batch once it holds UPLOAD_BATCH_SIZE articles."""
+        alias = self.deduplicator.check(article)
+        if alias is not None:
+            self._aliases.append((alias, article))
+            return
+        self._batch.append(article)
+        if len(self._batch) >= UPLOAD_BATCH_SIZE:
+            await self.flush()
+
+    async def flush(self):
+        """Uploads the queued batch, then the aliases whose canonical copy is stored."""
+        batch, self._batch = self._batch, []
+        if batch and not await upload_batch(
+            batch, self.result, self.checkpoint, self.watermarks
+        ):
+            self.deduplicator.forget(batch)
+            dropped = {article.id for article in batch}
+            orphans = [
+                article
+                for alias, article in self._aliases
+                if alias.CanonicalId in dropped
+            ]
+            self._aliases = [
+                (alias, article)
+                for alias, article in self._aliases
+                if alias.CanonicalId not in dropped
+            ]
+            for article in orphans:
+                await self.add(article)
+
+        queued = {article.id for article in self._batch}
+        ready = [alias for alias, _ in self._aliases if alias.CanonicalId not in queued]
+        if ready and await upload_aliases(ready, self.result, self.checkpoint):
+            self._aliases = [
+                (alias, article)
+                for alias, article in self._aliases
+                if alias.CanonicalId in queued
+            ]
+
+    async def close(self):
+        """
+        Uploads the remaining articles, including those requeued from a dropped batch.
+
+        Aliases that still could not be recorded are counted as a failed batch, so they stay
+        pending in the checkpoint and the watermarks are not advanced past them.
+        """
+        await self.flush()
+        while self._batch:
+            await self.flush()
+        if self._aliases:
+            articles = [article for _, article in self._aliases]
+            logger.error(
+                f"Dropping {len(articles)} article aliases after failed uploads"
+            )
+            self.result.failed_batches += 1
+            if self.watermarks is not None:
+                self.watermarks.fail(articles)
+            self._aliases = []
+
+
+async def run_extraction_pipeline(
+    sources: List[dict],
+    date_base: date,
+    date_cutoff: date,
+    name: Optional[str] = None,
+    job_id: Optional[str] = None,
+    checkpoint_id: Optional[str] = None,
+    incremental: bool = False,
+) -> PipelineResult:
+    """
+    Runs discovery, content fetching and storage upload as concurrent stages.
+
+    The stages are connected by bounded queues:
+        1. Discovery crawls the archives as a scrape job on the executor and pushes the base
+           articles of every page to the first queue, blocking the crawl threads when it is full.
+        2. Content workers drop already-stored links, fetch the remaining articles with a shared
+           ContentFetcher and push them to the second queue. The Selenium fallback leases its
+           drivers from its own pool, so it can't wait on crawl threads blocked on a full queue.
+        3. The uploader fingerprints every article, records near-duplicates of articles already
+           stored or uploaded as aliases (see Deduplicator) and posts the remaining ones in
+           fixed-size batches to the storage service as soon as they fill up.
+
+    Only a bounded number of articles is in flight at any time, so memory stays flat regardless
+    of the length of the date range.
+
+    With a 'checkpoint_id', the crawl frontier and the discovered articles that are not stored
+    yet are checkpointed (see JobCheckpoint). Running the pipeline again with the same id after a
+    crash first processes the pending articles and then crawls only the remaining archive pages.
+    The checkpoint is removed when the run completes or is cancelled.
+
+    The high-water mark of every source (its newest stored article) is advanced at the end of
+    the run, but never past an article that failed to be fetched or uploaded (see
+    WatermarkTracker). In incremental mode the crawl of a source stops as soon as it reaches
+    its mark.
+
+    Args:
+        sources (List[dict]): Source configurations to scrape.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+        name (Optional[str]): Description of the scrape job running the stages.
+        job_id (Optional[str]): Identifier of the scrape job running the stages.
+        checkpoint_id (Optional[str]): Stable identifier under which progress is checkpointed.
+        incremental (bool): Whether to only crawl articles newer than the sources' high-water marks.
+
+    Returns:
+        PipelineResult: The created article ids and the stage counters.
+
+    Raises:
+        JobCancelled: If the job is cancelled, during discovery or content fetching.
+    """
+    loop = asyncio.get_running_loop()
+    base_queue: asyncio.Queue = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    article_queue: asyncio.Queue = asyncio.Queue(PIPELINE_QUEUE_SIZE)
+    result = PipelineResult()
+    checkpoint = open_checkpoint(checkpoint_id, date_base, date_cutoff)
+    watermarks = WatermarkTracker(sources)
+    deduplicator = Deduplicator()
+
+    def emit(articles: List[ArticleBase]):
+        if checkpoint is not None:
+            checkpoint.add_pending(articles)
+        future = asyncio.run_coroutine_threadsafe(base_queue.put(articles), loop)
+        # THE CONTENT WORKERS OF A CANCELLED JOB STOP, SO THE QUEUE MAY NEVER BE DRAINED
+        while True:
+            try:
+                return future.result(timeout=EMIT_POLL_INTERVAL)
+            except TimeoutError:
+                try:
+                    raise_if_cancelled()
+                except JobCancelled:
+                    future.cancel()
+                    raise
+
+    async def discover():
+        try:
+            if checkpoint is not None and checkpoint.pending:
+                pending = checkpoint.pending_articles()
+                for start in range(0, len(pending), UPLOAD_BATCH_SIZE):
+                    await base_queue.put(pending[start : start + UPLOAD_BATCH_SIZE])
+            await get_scrape_executor().run(
+                scrape_sources_base,
+                sources,
+                date_base,
+                date_cutoff,
+                None,
+                emit,
+                checkpoint,
+                incremental,
+            )
+        finally:
+            for _ in range(PIPELINE_CONTENT_WORKERS):
+                await base_queue.put(_END)
+
+    async def fetch_content(fetcher: ContentFetcher):
+        while (articles := await base_queue.get()) is not _END:
+            result.discovered += len(articles)
+            failed = []
+            try:
+                new_articles = await filter_known_articles(articles)
+                articles_content = await fetch_articles_content(
+                    new_articles,
+                    fallback=scrape_articles_content_selenium,
+                    fetcher=fetcher,
+                    on_failed=failed.extend,
+                )
+            except JobCancelled:
+                raise
+            except Exception:
+                logger.error(
+                    f"Content stage failed for {len(articles)} articles", exc_info=True
+                )
+                watermarks.fail(articles)
+                continue
+            watermarks.fail(failed)
+            if checkpoint is not None:
+                # KNOWN AND REJECTED ARTICLES NEED NO FURTHER WORK, FAILED FETCHES STAY PENDING
+                kept_ids = {article.id for article in (*articles_content, *failed)}
+                checkpoint.remove_pending(
+                    article for article in articles if article.id not in kept_ids
+                )
+            for article in articles_content:
+                await article_queue.put(article)
+
+    async def upload():
+        uploader = ArticleUploader(deduplicator, result, checkpoint, watermarks)
+        while (article := await article_queue.get()) is not _END:
+            result.fetched += 1
+            await uploader.add(article)
+        await uploader.close()
+
+    await deduplicator.load(date_base, date_cutoff)
+    # EVERY STAGE BELONGS TO THE JOB, SO CANCELLING IT ALSO STOPS CONTENT FETCHES AND RENDERS
+    with get_scrape_executor().track(name or "extraction pipeline", job_id):
+        async with ContentFetcher(sources=sources) as fetcher:
+            uploader = asyncio.create_task(upload())
+            discovery = asyncio.create_task(discover())
+            content_workers = [
+                asyncio.create_task(fetch_content(fetcher))
+                for _ in range(PIPELINE_CONTENT_WORKERS)
+            ]
+            try:
+                await asyncio.gather(discovery, *content_workers)
+                await article_queue.put(_END)
+                await uploader
+            except JobCancelled:
+                if checkpoint is not None:
+                    checkpoint.delete()
+                raise
+            finally:
+                for task in (discovery, *content_workers, uploader):
+                    task.cancel()
+                if checkpoint is not None:
+                    checkpoint.save()
+                await save_known_links()
+
+    if checkpoint is not None and not result.failed_batches:
+        checkpoint.delete()
+    await watermarks.save()
+
+    logger.info(
+        f"Extraction pipeline finished: {result.discovered} discovered, {result.fetched} fetched, "
+        f"{len(result.article_ids)} inserted, {result.duplicates} near-duplicates, "
+        f"{result.failed_batches} failed batches"
+    )
+    return result
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+from typing import Optional
+from app.utils.logger import DefaultLogger
+
+RENDER_MODES_PATH = os.getenv("RENDER_MODES_PATH", "/tmp/factually/render-modes.json")
+
+STATIC = "static"
+RENDERED = "rendered"
+RENDER_MODES = (STATIC, RENDERED)
+
+
+def source_key(source: dict) -> str:
+    return source.get("id") or source["base_url"]
+
+
+def decide_render_mode(static_cards: int, rendered_cards: int) -> str:
+    """
+    Decides how the archive pages of a source must be loaded from a probed sample page.
+
+    The source is static when the plain HTTP response already holds at least as many
+    article cards as the page rendered by the browser.
+    """
+    if static_cards and static_cards >= rendered_cards:
+        return STATIC
+    return RENDERED
+
+
+class RenderModes:
+    """
+    Persistent per-source record of whether archive pages need a browser.
+
+    Sources can force a mode through their 'render_mode' setting. Otherwise the mode detected
+    by probing a sample page is stored in a JSON file, so later runs skip the probe.
+
+    Args:
+        path (str): File where the detected modes are persisted.
+    """
+
+    def __init__(self, path: str = RENDER_MODES_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        try:
+            with open(path, encoding="utf-8") as modes_file:
+                self._modes: dict[str, str] = json.load(modes_file)
+        except FileNotFoundError:
+            self._modes = {}
+        except (OSError, ValueError):
+            DefaultLogger().get_logger().warning(
+                f"Could not read render modes from {path}", exc_info=True
+            )
+            self._modes = {}
+
+    def get(self, source: dict) -> Optional[str]:
+        """
+        Returns the render mode of a source, or None if it has not been detected yet.
+        """
+        if source.get("render_mode") in RENDER_MODES:
+            return source["render_mode"]
+        return self._modes.get(source_key(source))
+
+    def set(self, source: dict, mode: str):
+        """Records the detected render mode of a source and persists it."""
+        key = source_key(source)
+        with self._lock:
+            if self._modes.get(key) == mode:
+                return
+            self._modes[key] = mode
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as modes_file:
+                    json.dump(self._modes, modes_file)
+                os.replace(tmp_path, self.path)
+            except OSError:
+                DefaultLogger().get_logger().warning(
+                    f"Could not persist render modes to {self.path}", exc_info=True
+                )
+        DefaultLogger().get_logger().info(
+            f"Archive pages of {source.get('name', key)} detected as {mode}"
+        )
+
+
+_instance: RenderModes = None
+
+
+def get_render_modes() -> RenderModes:
+    """
+    Returns a singleton instance of RenderModes.
+    """
+    global _instance
+    if _instance is None:
+        _instance = RenderModes()
+    return _instance
@@ -0,0 +1,241 @@
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional
+from urllib.parse import urlsplit
+from app.utils.logger import DefaultLogger
+
+CRAWL_RATE = float(os.getenv("CRAWL_RATE", "2"))
+CRAWL_MAX_RATE = float(os.getenv("CRAWL_MAX_RATE", "8"))
+CRAWL_MIN_RATE = float(os.getenv("CRAWL_MIN_RATE", "0.1"))
+CRAWL_BURST = int(os.getenv("CRAWL_BURST", "4"))
+CRAWL_DOMAIN_CONCURRENCY = int(os.getenv("CRAWL_DOMAIN_CONCURRENCY", "4"))
+CRAWL_BACKOFF_BASE = float(os.getenv("CRAWL_BACKOFF_BASE", "2"))
+CRAWL_MAX_BACKOFF = float(os.getenv("CRAWL_MAX_BACKOFF", "300"))
+
+# RESPONSES THAT SIGNAL THE DOMAIN IS OVERLOADED OR THROTTLING US
+THROTTLE_STATUS_CODES = (429, 503)
+
+# WAIT BETWEEN CHECKS WHEN EVERY CONNECTION SLOT OF A DOMAIN IS BUSY
+_SLOT_POLL_INTERVAL = 0.05
+
+
+def domain_of(url: str) -> str:
+    return (urlsplit(url).hostname or "").lower()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header, given either in seconds or as an HTTP date.
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class DomainState:
+    """
+    Token bucket, connection slots and backoff state of a single domain.
+
+    The refill rate adapts to the domain: every successful request raises it additively up to
+    CRAWL_MAX_RATE (or the initial rate, if higher), while every throttling response halves it and pauses the domain, for the
+    time given by Retry-After or an exponential backoff.
+    """
+
+    def __init__(self, rate: float, burst: int, concurrency: int, now: float):
+        self.base_rate = rate
+        self.max_rate = max(rate, CRAWL_MAX_RATE)
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self.tokens = float(burst)
+        self.in_flight = 0
+        self.updated_at = now
+        self.paused_until = 0.0
+        self.strikes = 0
+
+    def try_acquire(self, now: float) -> float:
+        """
+        Takes a token and a connection slot if both are available.
+
+        Returns:
+            float: 0 if the request may start, otherwise the seconds to wait before retrying.
+        """
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.in_flight >= self.concurrency:
+            return _SLOT_POLL_INTERVAL
+        self.tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+        if self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        self.tokens -= 1
+        self.in_flight += 1
+        return 0.0
+
+    def release(
+        self,
+        now: float,
+        status_code: Optional[int] = None,
+        retry_after: Optional[float] = None,
+    ) -> Optional[float]:
+        """
+        Frees the connection slot of a finished request and adapts the rate to its outcome.
+
+        Returns:
+            Optional[float]: The pause applied to the domain, if the response was a throttle.
+        """
+        self.in_flight -= 1
+        if status_code in THROTTLE_STATUS_CODES:
+            self.strikes += 1
+            self.rate = max(CRAWL_MIN_RATE, self.rate / 2)
+            pause = retry_after
+            if pause is None:
+                pause = CRAWL_BACKOFF_BASE**self.strikes
+            pause = min(CRAWL_MAX_BACKOFF, pause)
+            self.paused_until = max(self.paused_until, now + pause)
+            self.tokens = 0.0
+            return pause
+        if status_code is not None and status_code < 400:
+            self.strikes = 0
+            self.rate = min(self.max_rate, self.rate + self.base_rate * 0.05)
+        return None
+
+
+class Permit:
+    """
+    Right to send one request to a domain, handed out by CrawlScheduler.
+
+    The outcome of the request is reported with 'record' so the scheduler can back off.
+    """
+
+    __slots__ = ("domain", "status_code", "retry_after")
+
+    def __init__(self, domain: str):
+        self.domain = domain
+        self.status_code: Optional[int] = None
+        self.retry_after: Optional[float] = None
+
+    def record(self, response):
+        """Records the status code and Retry-After header of an HTTP response."""
+        self.status_code = response.status_code
+        self.retry_after = parse_retry_after(response.headers.get("retry-after"))
+
+
+class CrawlScheduler:
+    """
+    Per-domain politeness scheduler shared by the archive crawl and the content fetches.
+
+    Every domain gets its own token bucket, refilled at an adaptive rate, and a cap on the
+    number of requests in flight. Domains are scheduled independently, so a slow or throttling
+    domain only delays its own requests and the overall throughput approaches the sum of the
+    per-domain limits. Throttling responses (429/503) pause the domain, honouring Retry-After.
+
+    Blocking callers use 'slot' and asynchronous callers use 'async_slot'; both wait without
+    holding any lock, so the scheduler can be shared between scraper threads and the event loop.
+
+    Args:
+        rate (float): Initial requests per second allowed for each domain.
+        burst (int): Maximum number of tokens a domain can accumulate.
+        concurrency (int): Maximum number of requests in flight for each domain.
+        clock (Callable): Monotonic clock, replaceable for tests.
+    """
+
+    def __init__(
+        self,
+        rate: float = CRAWL_RATE,
+        burst: int = CRAWL_BURST,
+        concurrency: int = CRAWL_DOMAIN_CONCURRENCY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.concurrency = concurrency
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._domains: dict[str, DomainState] = {}
+
+    def _state(self, domain: str) -> DomainState:
+        state = self._domains.get(domain)
+        if state is None:
+            state = DomainState(self.rate, self.burst, self.concurrency, self._clock())
+            self._domains[domain] = state
+        return state
+
+    def try_acquire(self, url: str) -> tuple[Optional[Permit], float]:
+        """
+        Tries to reserve a request to the domain of a URL without waiting.
+
+        Returns:
+            tuple: The permit, or None together with the seconds to wait before trying again.
+        """
+        domain = domain_of(url)
+        with self._lock:
+            delay = self._state(domain).try_acquire(self._clock())
+        if delay > 0:
+            return None, delay
+        return Permit(domain), 0.0
+
+    def release(self, permit: Permit):
+        """Releases a permit, adapting the domain schedule to the recorded outcome."""
+        with self._lock:
+            pause = self._state(permit.domain).release(
+                self._clock(), permit.status_code, permit.retry_after
+            )
+        if pause is not None:
+            DefaultLogger().get_logger().warning(
+                f"{permit.domain} answered {permit.status_code}, pausing it for {pause:.1f}s"
+            )
+
+    @contextmanager
+    def slot(self, url: str):
+        """Blocks until a request to the domain of a URL may start and yields its Permit."""
+        while True:
+            permit, delay = self.try_acquire(url)
+            if permit is not None:
+                break
+            time.sleep(delay)
+        try:
+            yield permit
+        finally:
+            self.release(permit)
+
+    @asynccontextmanager
+    async def async_slot(self, url: str):
+        """Waits until a request to the domain of a URL may start and yields its Permit."""
+        while True:
+            permit, delay = self.try_acquire(url)
+            if permit is not None:
+                break
+            await asyncio.sleep(delay)
+        try:
+            yield permit
+        finally:
+            self.release(permit)
+
+
+_instance: CrawlScheduler = None
+_instance_lock = threading.Lock()
+
+
+def get_crawl_scheduler() -> CrawlScheduler:
+    """
+    Returns a singleton instance of CrawlScheduler.
+    """
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = CrawlScheduler()
+        return _instance
@@ -1,10 +1,11 @@
-from datetime import date, timedelta
-from typing import List
-from bs4 import BeautifulSoup
-import requests
-from requests.auth import HTTPBasicAuth
-from requests.exceptions import RequestException
+import asyncio
+import os
+import contextvars
 import time
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, List, Optional
+import httpx
 from selenium.common.exceptions import (
     TimeoutException,
     ElementClickInterceptedException,
@@ -14,11 +15,49 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from app.utils.url_helpers import safe_url_format
+from app.utils.http_cache import get_http_cache, source_ttl
+from app.utils.html_parser import declared_encoding, make_soup
 from app.utils.logger import DefaultLogger
-from app.core.article_processing import process_articles_base, process_articles_content
-from app.core.driver import scroll_down, init_driver
+from app.utils.metrics import get_metrics
+from app.core.article_processing import (
+    extract_card_fields,
+    process_article_cards,
+    process_articles_content,
+)
+from app.core.compiled_source import HEADING_TAGS, get_compiled_source
+from app.core.driver import (
+    render_page,
+    source_blocklist,
+    query_cards,
+    wait_for_cards,
+    DriverPool,
+    get_driver_pool,
+    get_fallback_driver_pool,
+)
+from app.core.checkpoint import JobCheckpoint
+from app.core.feeds import iter_feed_articles
+from app.core.page_locator import locate_first_page
+from app.core.watermark import Watermark
+from app.core.executor import JobCancelled, raise_if_cancelled
+from app.core.scheduler import get_crawl_scheduler
+from app.core.render_mode import (
+    STATIC,
+    RENDERED,
+    decide_render_mode,
+    get_render_modes,
+)
+from app.core.fetcher import (
+    FETCH_MAX_BYTES,
+    fetch_articles_content,
+    get_sync_client,
+    is_html,
+)
 from app.models import ArticleBase, Article
 
+ARTICLE_PAGE_SCROLL = os.getenv("ARTICLE_PAGE_SCROLL", "false").lower() == "true"
+# CRAWL THREADS, AT LEAST AS MANY AS DRIVERS. STATIC SOURCES ARE CRAWLED WITHOUT A DRIVER
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "8"))
+
 
 def obtain_urls(source: dict, date_base: date, date_cutoff: date):
     """
@@ -49,15 +88,238 @@ def obtain_urls(source: dict, date_base: date, date_cutoff: date):
     return urls
 
 
+def fetch_static_page(
+    url: str, headers: Optional[dict] = None, method: str = "GET"
+) -> httpx.Response:
+    """
+    Downloads a page over plain HTTP, without rendering it, once the crawl scheduler allows it.
+
+    A HEAD 'method' only asks for the headers of the page, such as its validators.
+
+    Raises:
+        httpx.HTTPError: If the request fails or the response status is not successful.
+    """
+    with get_crawl_scheduler().slot(url) as permit:
+        start = time.perf_counter()
+        response = get_sync_client().request(method, url, headers=headers)
+        get_metrics().record_fetch(
+            url, time.perf_counter() - start, response.num_bytes_downloaded
+        )
+        permit.record(response)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+def render_archive_page(source: dict, driver, url: str):
+    """Renders an archive page in the browser once the crawl scheduler allows it."""
+    with get_crawl_scheduler().slot(url):
+        timings = render_page(
+            driver,
+            url,
+            scroll=source.get("scroll", True),
+            blocked_urls=source_blocklist(source),
+        )
+    get_metrics().record_render(source["base_url"], timings)
+
+
+def load_page(
+    source: dict, driver, url: str, use_cache: bool = False, render: bool = True
+) -> str:
+    """
+    Loads a page in the browser and returns its rendered HTML, reusing the HTTP cache when possible.
+
+    With the cache enabled, a copy younger than the source TTL is returned straight from disk.
+    An older copy is revalidated with its ETag/Last-Modified validators and reused on 304 Not
+    Modified. Otherwise the page is rendered with Selenium and stored. Rendered pages are only
+    revalidated with a HEAD request, which also gives the validators stored with the rendered
+    copy, so their body is never downloaded outside the browser. Pages of static sources skip
+    the browser and the plain HTTP response is used and stored as is.
+
+    Args:
+        source (dict): Source configuration, which may define a 'cache_ttl' in seconds.
+        driver: Selenium WebDriver instance for browsing.
+        url (str): The URL to load.
+        use_cache (bool): Whether the HTTP cache may be used for this page.
+        render (bool): Whether the page must be rendered by the browser.
+
+    Returns:
+        str: The HTML of the page.
+
+    Raises:
+        WebDriverException: If the browser fails to load the page.
+        httpx.HTTPError: If the plain HTTP fetch of a page that is not rendered fails.
+    """
+    if not use_cache:
+        if not render:
+            return fetch_static_page(url).text
+        render_archive_page(source, driver, url)
+        return driver.page_source
+
+    cache = get_http_cache()
+    entry = cache.get(url)
+    if entry is not None and entry.is_fresh(source_ttl(source)):
+        DefaultLogger().get_logger().debug(f"Using cached copy of {url}")
+        return entry.text
+
+    headers = entry.conditional_headers() if entry is not None else None
+    validators = {}
+    try:
+        response = fetch_static_page(
+            url, headers=headers, method="HEAD" if render else "GET"
+        )
+        if response.status_code == 304 and entry is not None:
+            DefaultLogger().get_logger().debug(f"Revalidated cached copy of {url}")
+            cache.refresh(entry, response.headers)
+            return entry.text
+        if not render:
+            cache.put(url, response.content, response.encoding, response.headers)
+            return response.text
+        validators = response.headers
+    except httpx.HTTPError:
+        if not render:
+            raise
+        DefaultLogger().get_logger().warning(
+            f"Revalidation request failed for {url}", exc_info=True
+        )
+
+    render_archive_page(source, driver, url)
+    html = driver.page_source
+    cache.put(url, html.encode("utf-8"), "utf-8", validators)
+    return html
+
+
+def find_cards(source: dict, html: str) -> list:
+    """Parses an archive page and returns its article card elements."""
+    return make_soup(html).find_all("div", class_=source["article_selector"])
+
+
+def read_cards(source: dict, html: str) -> List[dict]:
+    """Parses an archive page and returns the fields of its article cards."""
+    start = time.perf_counter()
+    compiled = get_compiled_source(source)
+    cards = [extract_card_fields(card, compiled) for card in find_cards(source, html)]
+    get_metrics().record_parse(
+        source["base_url"], "archive", time.perf_counter() - start
+    )
+    return cards
+
+
+def render_cards(source: dict, driver, url: str) -> List[dict]:
+    """
+    Renders an archive page and reads the fields of its article cards inside the browser.
+    """
+    render_archive_page(source, driver, url)
+    start = time.perf_counter()
+    _, cards = query_cards(driver, source["article_selector"], HEADING_TAGS)
+    get_metrics().record_parse(
+        source["base_url"], "archive", time.perf_counter() - start
+    )
+    return cards
+
+
+def read_loaded_cards(source: dict, driver, start: int = 0) -> tuple[int, List[dict]]:
+    """
+    Reads the article cards of the page loaded in the browser, skipping the first 'start' cards.
+
+    Returns:
+        tuple: The total number of cards in the page and the fields of the cards from 'start' on.
+    """
+    started = time.perf_counter()
+    if source.get("card_extraction") == "browser":
+        total, fields = query_cards(
+            driver, source["article_selector"], HEADING_TAGS, start
+        )
+    else:
+        cards = find_cards(source, driver.page_source)
+        compiled = get_compiled_source(source)
+        total = len(cards)
+        fields = [extract_card_fields(card, compiled) for card in cards[start:]]
+    get_metrics().record_parse(
+        source["base_url"], "archive", time.perf_counter() - started
+    )
+    return total, fields
+
+
+def load_rendered_cards(
+    source: dict, driver, url: str, use_cache: bool = False
+) -> List[dict]:
+    """
+    Returns the card fields of an archive page loaded by the browser.
+
+    Sources with 'card_extraction' set to 'browser' read the cards in the browser, without
+    transferring the page source. Those pages are never cached, since there is no HTML to store.
+    """
+    if source.get("card_extraction") == "browser":
+        return render_cards(source, driver, url)
+    return read_cards(source, load_page(source, driver, url, use_cache))
+
+
+def load_cards(source: dict, driver, url: str, use_cache: bool = False) -> List[dict]:
+    """
+    Returns the card fields of an archive page, using the browser only when required.
+
+    Sources detected as static are fetched over plain HTTP and only fall back to the browser
+    when the selector finds nothing. Sources detected as rendered always use the browser.
+    The first page of an undetected source is probed: it is fetched both ways and the source
+    is static when the plain HTTP response holds all the cards of the rendered page. The
+    decision is persisted so later runs skip the probe.
+
+    Args:
+        source (dict): Source configuration containing scraping parameters.
+        driver: Selenium WebDriver instance for browsing.
+        url (str): The archive page URL.
+        use_cache (bool): Whether the page may be served from the HTTP cache.
+
+    Returns:
+        List[dict]: The 'title', 'date' and 'href' fields of the article cards.
+
+    Raises:
+        WebDriverException: If the browser fails to load the page.
+    """
+    render_modes = get_render_modes()
+    mode = render_modes.get(source)
+    if mode == RENDERED:
+        return load_rendered_cards(source, driver, url, use_cache)
+
+    try:
+        static_cards = read_cards(
+            source,
+            load_page(source, driver, url, use_cache and mode == STATIC, render=False),
+        )
+    except httpx.HTTPError:
+        DefaultLogger().get_logger().warning(
+            f"Plain HTTP fetch failed for {url}, rendering it", exc_info=True
+        )
+        static_cards = []
+    if mode == STATIC and static_cards:
+        return static_cards
+
+    rendered_cards = load_rendered_cards(source, driver, url)
+    if mode is None:
+        render_modes.set(
+            source, decide_render_mode(len(static_cards), len(rendered_cards))
+        )
+    return rendered_cards
+
+
 def collect_articles(
-    source: dict, driver, url: str, date_base: date, date_cutoff: date
+    source: dict,
+    driver,
+    url: str,
+    date_base: date,
+    date_cutoff: date,
+    use_cache: bool = False,
+    allow_static: bool = False,
 ):
     """
     Collects and processes articles from a given URL using a Selenium WebDriver.
 
     The function loads the specified URL, scrolls down to load dynamic content,
-    extracts article elements using BeautifulSoup, and processes them using the
-    'process_articles_base' function.
+    extracts the article cards with the configured HTML parser, or inside the browser when the
+    source sets 'card_extraction' to 'browser', and processes them using the
+    'process_article_cards' function. If 'allow_static' is set, static sources are fetched
+    over plain HTTP instead (see 'load_cards').
 
     Args:
         source (dict): Source configuration containing scraping parameters.
@@ -65,6 +327,8 @@ def collect_articles(
         url (str): The URL to scrape articles from.
         date_base (date): The base date for filtering articles.
         date_cutoff (date): The cutoff date for filtering articles.
+        use_cache (bool): Whether the page may be served from the HTTP cache.
+        allow_static (bool): Whether the page may be loaded without the browser.
 
     Returns:
         tuple: A tuple containing a list of processed ArticleBase objects and a boolean flag indicating
@@ -73,150 +337,454 @@ def collect_articles(
     DefaultLogger().get_logger().debug(f"Processing: {url}")
 
     try:
-        driver.get(url)
-        scroll_down(driver)
+        if allow_static:
+            cards = load_cards(source, driver, url, use_cache)
+        else:
+            cards = load_rendered_cards(source, driver, url, use_cache)
     except WebDriverException as e:
         DefaultLogger().get_logger().error(
             f"Error loading {url}: No articles were collected.", exc_info=True
         )
-        return None
+        return [], False
 
-    soup = BeautifulSoup(driver.page_source, "html.parser")
-    articles = soup.find_all("div", class_=source["article_selector"])
-
-    articles_processed, older_than_cutoff = process_articles_base(
-        articles, source, date_base, date_cutoff, url
+    get_metrics().record_cards(source["base_url"], len(cards))
+    articles_processed, older_than_cutoff = process_article_cards(
+        cards, source, date_base, date_cutoff, url
     )
 
     return articles_processed, older_than_cutoff
 
 
-def scrape_articles_base(
-    source: dict, date_base: date, date_cutoff: date
-) -> List[ArticleBase]:
+def iter_crawl_url(
+    source: dict,
+    driver,
+    url: str,
+    date_base: date,
+    date_cutoff: date,
+    start_page: int = 1,
+    watermark: Optional[Watermark] = None,
+    on_page: Optional[Callable[[int], None]] = None,
+) -> Iterator[List[ArticleBase]]:
     """
-    Scrapes base article information from the source over a specified date range.
+    Crawls a single archive URL of a source, following its pagination or load-more pattern.
+
+    Base articles are yielded page by page as soon as they are collected, so callers can
+    stream them to the next stage without waiting for the whole crawl. Load-more archives are
+    loaded once, and after every click only the newly appended cards are processed.
+
+    Paginated archives are crawled from the first page overlapping the date range, located by
+    sampling pages (see 'locate_first_page') unless the source disables 'page_search', up to
+    the page reaching the cutoff date. The cards of the sampled pages are kept, so the crawl
+    reuses them instead of loading those pages again.
+
+    Args:
+        source (dict): A dictionary containing source configuration for scraping.
+        driver: Selenium WebDriver instance for browsing.
+        url (str): The archive URL to crawl.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+        start_page (int): First page to crawl when the archive is paginated.
+        watermark (Optional[Watermark]): If given, only articles newer than the source's
+            high-water mark are kept and the crawl stops as soon as seen content is reached.
+        on_page (Optional[Callable]): Called with the number of every paginated page once
+            its articles have been consumed.
+
+    Yields:
+        List[ArticleBase]: The base articles collected from each page.
+    """
+
+    def keep_unseen(
+        articles: List[ArticleBase], older_than_cutoff: bool
+    ) -> tuple[List[ArticleBase], bool]:
+        if watermark is not None:
+            articles, reached = watermark.cut(articles)
+            older_than_cutoff = older_than_cutoff or reached
+        return articles, older_than_cutoff
+
+    def collect(page_url: str, **kwargs) -> tuple[List[ArticleBase], bool]:
+        return keep_unseen(
+            *collect_articles(
+                source, driver, page_url, date_base, date_cutoff, **kwargs
+            )
+        )
+
+    # CARDS OF THE PAGES PROBED BY THE PAGE SEARCH, SO THE CRAWL DOESN'T LOAD THEM AGAIN
+    probed: dict[int, List[dict]] = {}
+
+    def oldest_article(page: int) -> Optional[date]:
+        page_url = safe_url_format(url, page=page)
+        try:
+            cards = load_cards(source, driver, page_url, use_cache=True)
+        except WebDriverException:
+            DefaultLogger().get_logger().warning(
+                f"Error probing {page_url}", exc_info=True
+            )
+            return None
+        probed[page] = cards
+        # NO DATE RANGE, ONLY THE DATES OF THE PAGE MATTER
+        articles, _ = process_article_cards(cards, source, date.max, date.min, page_url)
+        return min(
+            (date.fromisoformat(article.Date) for article in articles), default=None
+        )
+
+    def collect_page(page_url: str, page: int) -> tuple[List[ArticleBase], bool]:
+        cards = probed.pop(page, None)
+        if cards is None:
+            return collect(page_url, use_cache=True, allow_static=True)
+        get_metrics().record_cards(source["base_url"], len(cards))
+        return keep_unseen(
+            *process_article_cards(cards, source, date_base, date_cutoff, page_url)
+        )
+
+    # IF THERE'S PAGE IN TEMPLATE -> PAGINATION
+    if "{page}" in source["url"]:
+        page_number = start_page
+        if start_page == 1 and source.get("page_search", True):
+            page_number = locate_first_page(oldest_article, date_base)
+        while True:
+            raise_if_cancelled()
+            url_params = {"page": page_number}
+
+            # INSERT PAGE NUMBER IN URL
+            formatted_url = safe_url_format(url, **url_params)
+
+            articles_processed, older_than_cutoff = collect_page(
+                formatted_url, page_number
+            )
+            yield articles_processed
+            if on_page is not None:
+                on_page(page_number)
+
+            if not articles_processed or older_than_cutoff:
+                break
+
+            page_number += 1
+
+    # IF THERE'S BUTTON SELECTOR -> LOAD MORE PATTERN
+    # THE PAGE IS LOADED ONCE AND ONLY THE CARDS APPENDED BY EACH CLICK ARE PROCESSED
+    elif source["button_selector"]:
+        DefaultLogger().get_logger().debug(f"Processing: {url}")
+        try:
+            render_archive_page(source, driver, url)
+        except WebDriverException:
+            DefaultLogger().get_logger().error(
+                f"Error loading {url}: No articles were collected.", exc_info=True
+            )
+            return
+        seen = 0
+        while True:
+            raise_if_cancelled()
+            try:
+                seen, cards = read_loaded_cards(source, driver, seen)
+            except WebDriverException:
+                DefaultLogger().get_logger().error(
+                    f"Error reading the articles of {url}", exc_info=True
+                )
+                break
+            get_metrics().record_cards(source["base_url"], len(cards))
+            articles_processed, older_than_cutoff = keep_unseen(
+                *process_article_cards(cards, source, date_base, date_cutoff, url)
+            )
+            yield articles_processed
+
+            if not articles_processed or older_than_cutoff:
+                break
+            try:
+                load_more_btn = WebDriverWait(driver, 5).until(
+                    EC.element_to_be_clickable(
+                        (By.CLASS_NAME, source["button_selector"])
+                    )
+                )
+                driver.execute_script("arguments[0].scrollIntoView();", load_more_btn)
+                load_more_btn.click()
+                DefaultLogger().get_logger().debug("Loading more articles with button")
+            except (TimeoutException, ElementClickInterceptedException):
+                DefaultLogger().get_logger().warning(
+                    "No more articles could be loaded with button"
+                )
+                break
+            if wait_for_cards(driver, source["article_selector"], seen) <= seen:
+                DefaultLogger().get_logger().warning(
+                    "No new articles were loaded after clicking the button"
+                )
+                break
+
+    # IF NO PAGINATION OR LOAD MORE -> COLLECT ARTICLES
+    else:
+        articles_processed, older_than_cutoff = collect(
+            url, use_cache=True, allow_static=True
+        )
+        yield articles_processed
+
 
-    This function initializes a Selenium WebDriver, obtains URLs for the given date range,
-    processes articles using pagination, load-more patterns, or single page scraping, and returns a list of
-    ArticleBase objects representing the scraped articles.
+def crawl_url(
+    source: dict, driver, url: str, date_base: date, date_cutoff: date
+) -> List[ArticleBase]:
+    """
+    Crawls a single archive URL of a source and returns every base article found.
 
     Args:
         source (dict): A dictionary containing source configuration for scraping.
+        driver: Selenium WebDriver instance for browsing.
+        url (str): The archive URL to crawl.
         date_base (date): The base date for scraping articles.
         date_cutoff (date): The cutoff date for scraping articles.
 
     Returns:
         List[ArticleBase]: A list of scraped base articles.
     """
-    driver = init_driver()
+    return [
+        article
+        for articles in iter_crawl_url(source, driver, url, date_base, date_cutoff)
+        for article in articles
+    ]
+
+
+def plan_crawl_jobs(
+    sources: List[dict],
+    date_base: date,
+    date_cutoff: date,
+    checkpoint: Optional[JobCheckpoint] = None,
+    incremental: bool = False,
+) -> List[tuple]:
+    """
+    Lists the independent crawl jobs of several sources over a date range.
 
-    article_list = []
+    Args:
+        sources (List[dict]): Source configurations to scrape.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+        checkpoint (Optional[JobCheckpoint]): If given, archive URLs it records as crawled are skipped.
+        incremental (bool): Whether sources with a high-water mark are only crawled down to it.
 
-    urls = obtain_urls(source, date_base, date_cutoff)
-    DefaultLogger().get_logger().info(f"Collecting article links from {source['name']}")
-    for url in urls:
-        # IF THERE'S PAGE IN TEMPLATE -> PAGINATION
-        if "{page}" in source["url"]:
-            page_number = 1
-            while True:
-                url_params = {"page": page_number}
+    Returns:
+        List[tuple]: (source, archive URL, cutoff date, watermark) of every job.
+    """
+    jobs = []
+    for source in sources:
+        DefaultLogger().get_logger().info(
+            f"Collecting article links from {source['name']}"
+        )
+        watermark = Watermark.from_source(source) if incremental else None
+        if watermark is None:
+            source_cutoff = date_cutoff
+            urls = obtain_urls(source, date_base, date_cutoff)
+        else:
+            # THE DAY OF THE MARK IS CRAWLED AGAIN FOR ARTICLES PUBLISHED AFTER IT
+            source_cutoff = min(watermark.date, date_base)
+            urls = obtain_urls(source, date_base, source_cutoff - timedelta(days=1))
+            DefaultLogger().get_logger().info(
+                f"Incremental crawl of {source['name']} down to {source_cutoff}"
+            )
+        if source.get("feed_url"):
+            # FEEDS AND SITEMAPS COVER THE WHOLE DATE RANGE IN A SINGLE JOB
+            urls = {source["feed_url"]}
+        for url in urls:
+            if checkpoint is None or not checkpoint.is_done(source, url):
+                jobs.append((source, url, source_cutoff, watermark))
+    return jobs
+
+
+def crawl_job(
+    source: dict,
+    url: str,
+    date_base: date,
+    cutoff: date,
+    watermark: Optional[Watermark] = None,
+    pool: Optional[DriverPool] = None,
+    on_articles: Optional[Callable[[List[ArticleBase]], None]] = None,
+    checkpoint: Optional[JobCheckpoint] = None,
+) -> List[ArticleBase]:
+    """
+    Crawls one archive URL or feed of a source, as planned by 'plan_crawl_jobs'.
 
-                # INSERT PAGE NUMBER IN URL
-                formatted_url = safe_url_format(url, **url_params)
+    Archive URLs are crawled with a driver lazily leased from the pool: it is only taken once a
+    page has to be rendered, and then kept for the rest of the crawl. See 'scrape_sources_base'
+    for the meaning of 'on_articles' and 'checkpoint'.
 
-                articles_processed, older_than_cutoff = collect_articles(
-                    source, driver, formatted_url, date_base, date_cutoff
-                )
-                article_list.extend(articles_processed)
+    Returns:
+        List[ArticleBase]: The base articles found, empty when 'on_articles' is given.
+    """
+    collected = []
+
+    def hand_over(articles: List[ArticleBase]):
+        if on_articles is None:
+            collected.extend(articles)
+        elif articles:
+            on_articles(articles)
+
+    if source.get("feed_url"):
+        for articles in iter_feed_articles(source, url, date_base, cutoff):
+            hand_over(articles)
+    else:
+        start_page = checkpoint.next_page(source, url) if checkpoint else 1
+        with (pool or get_driver_pool()).lazy_lease() as driver:
+            pages = iter_crawl_url(
+                source,
+                driver,
+                url,
+                date_base,
+                cutoff,
+                start_page=start_page,
+                watermark=watermark,
+                on_page=(
+                    (lambda page: checkpoint.page_done(source, url, page))
+                    if checkpoint is not None
+                    else None
+                ),
+            )
+            for articles in pages:
+                hand_over(articles)
+    if checkpoint is not None:
+        checkpoint.url_done(source, url)
+    return collected
+
+
+def scrape_sources_base(
+    sources: List[dict],
+    date_base: date,
+    date_cutoff: date,
+    pool: Optional[DriverPool] = None,
+    on_articles: Optional[Callable[[List[ArticleBase]], None]] = None,
+    checkpoint: Optional[JobCheckpoint] = None,
+    incremental: bool = False,
+) -> List[ArticleBase]:
+    """
+    Scrapes base article information from several sources in parallel over a driver pool.
 
-                if not articles_processed or older_than_cutoff:
-                    break
+    Every (source, archive URL) pair obtained for the date range is crawled as an independent job.
+    Jobs run in a thread pool of CRAWL_WORKERS threads, at least as wide as the driver pool, and
+    each job leases a warm driver once it first needs the browser, so static sources crawl
+    without a driver and rendered ones scale with the number of drivers. Sources with a
+    'feed_url' are discovered from their RSS/Atom feed or sitemap instead, in a single job that
+    needs no driver.
 
-                page_number += 1
+    Args:
+        sources (List[dict]): Source configurations to scrape.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+        pool (Optional[DriverPool]): Driver pool to use. Defaults to the process-wide pool.
+        on_articles (Optional[Callable]): If given, called from the crawl threads with the
+            articles of every page instead of accumulating them.
+        checkpoint (Optional[JobCheckpoint]): If given, archive URLs it records as crawled are
+            skipped, paginated URLs resume after their last crawled page, and progress is
+            recorded in it once the articles of every page have been handed over.
+        incremental (bool): If set, sources with a high-water mark are crawled from 'date_base'
+            back to the day of their mark only, and each crawl stops at the first article
+            already ingested. Sources without a mark use the given date range.
 
-        # IF THERE'S BUTTON SELECTOR -> LOAD MORE PATTERN
-        elif source["button_selector"]:
-            while True:
-                # LIST TO AVOID DUPLICATES
-                load_more_article_list = []
-                articles_processed, older_than_cutoff = collect_articles(
-                    source, driver, url, date_base, date_cutoff
-                )
-                load_more_article_list.extend(articles_processed)
-
-                if not articles_processed or older_than_cutoff:
-                    break
-                else:
-                    try:
-                        load_more_btn = WebDriverWait(driver, 5).until(
-                            EC.element_to_be_clickable(
-                                (By.CLASS_NAME, source["button_selector"])
-                            )
-                        )
-                        driver.execute_script(
-                            "arguments[0].scrollIntoView();", load_more_btn
-                        )
-                        load_more_btn.click()
-                        DefaultLogger().get_logger().debug(
-                            "Loading more articles with button"
-                        )
-                        time.sleep(2)
-                    except (TimeoutException, ElementClickInterceptedException):
-                        DefaultLogger().get_logger().warning(
-                            "No more articles could be loaded with button"
-                        )
-                        break
-            article_list.extend(load_more_article_list)
+    Returns:
+        List[ArticleBase]: A list of scraped base articles from all sources, empty when
+            'on_articles' is given.
+    """
+    pool = pool or get_driver_pool()
+    jobs = plan_crawl_jobs(sources, date_base, date_cutoff, checkpoint, incremental)
 
-        # IF NO PAGINATION OR LOAD MORE -> COLLECT ARTICLES
-        else:
-            articles_processed, older_than_cutoff = collect_articles(
-                source, driver, url, date_base, date_cutoff
+    article_list = []
+    with ThreadPoolExecutor(max_workers=max(pool.size, CRAWL_WORKERS)) as executor:
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                crawl_job,
+                source,
+                url,
+                date_base,
+                cutoff,
+                watermark,
+                pool,
+                on_articles,
+                checkpoint,
             )
-            article_list.extend(articles_processed)
+            for source, url, cutoff, watermark in jobs
+        ]
+        for (source, url, *_), future in zip(jobs, futures):
+            try:
+                article_list.extend(future.result())
+            except JobCancelled:
+                raise
+            except Exception:
+                DefaultLogger().get_logger().error(
+                    f"Error crawling {url} from source {source['name']}", exc_info=True
+                )
 
-    driver.quit()
     return article_list
 
 
-def scrape_articles_content_selenium(articles: List[ArticleBase]) -> List[Article]:
+def scrape_articles_base(
+    source: dict,
+    date_base: date,
+    date_cutoff: date,
+    pool: Optional[DriverPool] = None,
+) -> List[ArticleBase]:
+    """
+    Scrapes base article information from the source over a specified date range.
+
+    This function obtains URLs for the given date range and crawls them in parallel over the
+    driver pool, processing articles using pagination, load-more patterns, or single page scraping.
+    It returns a list of ArticleBase objects representing the scraped articles.
+
+    Args:
+        source (dict): A dictionary containing source configuration for scraping.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+        pool (Optional[DriverPool]): Driver pool to use. Defaults to the process-wide pool.
+
+    Returns:
+        List[ArticleBase]: A list of scraped base articles.
+    """
+    return scrape_sources_base([source], date_base, date_cutoff, pool)
+
+
+def scrape_articles_content_selenium(
+    articles: List[ArticleBase], pool: Optional[DriverPool] = None
+) -> List[Article]:
     """
     Scrapes the full content of articles using Selenium for rendering JavaScript content.
 
-    The function iterates over a list of ArticleBase objects, loads each article URL using a Selenium WebDriver,
-    scrolls down to load dynamic content, processes the article content using the 'process_articles_content' function,
+    The function leases a driver from the fallback driver pool, loads each article URL,
+    waits for dynamic content to settle (scrolling only if ARTICLE_PAGE_SCROLL is set), processes the article content using the 'process_articles_content' function,
     and returns a list of Article objects with complete content.
 
     Args:
         articles (List[ArticleBase]): A list of articles to scrape content for.
+        pool (Optional[DriverPool]): Driver pool to use. Defaults to the process-wide fallback
+            pool, separate from the crawl pool.
 
     Returns:
         List[Article]: A list of articles with scraped content.
     """
-    driver = init_driver()
+    pool = pool or get_fallback_driver_pool()
 
     article_list = []
 
     DefaultLogger().get_logger().info(
         f"Scrapping contents from {len(articles)} articles"
     )
-    for article in articles:
-        try:
-            driver.get(str(article.Link))
-            scroll_down(driver)
-        except WebDriverException as e:
-            DefaultLogger().get_logger().error(
-                f"Error loading {str(article.Link)}: No content was extracted.",
-                exc_info=True,
-            )
-            continue
+    with pool.lease() as driver:
+        for article in articles:
+            raise_if_cancelled()
+            try:
+                with get_crawl_scheduler().slot(str(article.Link)):
+                    timings = render_page(
+                        driver, str(article.Link), scroll=ARTICLE_PAGE_SCROLL
+                    )
+                get_metrics().record_render(str(article.Source), timings)
+            except WebDriverException as e:
+                driver.healthy = False
+                DefaultLogger().get_logger().error(
+                    f"Error loading {str(article.Link)}: No content was extracted.",
+                    exc_info=True,
+                )
+                continue
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        article_content = process_articles_content(article, soup)
-        article_list.append(article_content)
+            start = time.perf_counter()
+            soup = make_soup(driver.page_source)
+            article_content = process_articles_content(article, soup)
+            get_metrics().record_parse(
+                str(article.Source), "article", time.perf_counter() - start
+            )
+            article_list.append(article_content)
 
-    driver.quit()
     return article_list
 
 
@@ -224,9 +792,11 @@ def scrape_articles_content_requests(articles: List[ArticleBase]) -> List[Articl
     """
     Scrapes the full content of articles using HTTP requests.
 
-    The function attempts to retrieve the article content using HTTP GET requests. If successful,
+    The function retrieves the article content with GET requests of the shared HTTP client, once
+    the crawl scheduler allows each domain to be contacted. If successful,
     it processes the content using the 'process_articles_content' function. In case of request failures,
-    the article is skipped.
+    the article is skipped, as are pages that are not HTML or larger than FETCH_MAX_BYTES, whose body
+    is not downloaded beyond the budget.
 
     Args:
         articles (List[ArticleBase]): A list of articles to scrape content for.
@@ -239,28 +809,39 @@ def scrape_articles_content_requests(articles: List[ArticleBase]) -> List[Articl
         f"Scraping contents from {len(articles)} articles"
     )
 
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
-    )
-
     for article in articles:
+        url = str(article.Link)
         try:
-            response = requests.get(
-                str(article.Link), timeout=3, auth=HTTPBasicAuth("user", "pass")
-            )
-            response.raise_for_status()
-        except RequestException as e:
+            with get_crawl_scheduler().slot(url) as permit:
+                with get_sync_client().stream("GET", url) as response:
+                    permit.record(response)
+                    response.raise_for_status()
+                    # THE BODY IS ONLY READ FOR HTML PAGES, AND AT MOST ONE CHUNK PAST THE BUDGET
+                    content_type = response.headers.get("content-type", "")
+                    if not is_html(content_type):
+                        DefaultLogger().get_logger().info(
+                            f"Skipping {article.Link}: not HTML ({content_type})"
+                        )
+                        continue
+                    body = b""
+                    for chunk in response.iter_bytes():
+                        body += chunk
+                        if len(body) > FETCH_MAX_BYTES:
+                            break
+                    charset = response.charset_encoding
+        except httpx.HTTPError:
             DefaultLogger().get_logger().error(
-                f"Error loading {str(article.Link)}: No content was extracted.",
+                f"Error loading {url}: No content was extracted.",
                 exc_info=True,
             )
             continue
+        if len(body) > FETCH_MAX_BYTES:
+            DefaultLogger().get_logger().info(
+                f"Skipping {article.Link}: larger than {FETCH_MAX_BYTES} bytes"
+            )
+            continue
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        soup = make_soup(body, encoding=declared_encoding(body, charset))
         article_content = process_articles_content(article, soup)
         article_list.append(article_content)
 
@@ -271,9 +852,11 @@ def scrape_articles_content(articles: List[ArticleBase]) -> List[Article]:
     """
     Scrapes the full content of articles, using HTTP requests primarily and falling back to Selenium if necessary.
 
-    For each article, the function first attempts to retrieve the content via an HTTP GET request.
-    If the request fails, it falls back to using Selenium to load and scrape the content.
-    The function processes the content using the 'process_articles_content' function and returns a list of Article objects.
+    Articles are fetched concurrently by the asynchronous fetch engine, which applies a global and
+    a per-host concurrency limit over pooled keep-alive (HTTP/2 when available) connections.
+    Articles whose HTTP fetch fails are queued and handed in batches to the Selenium scraper,
+    so slow or blocked hosts don't delay the rest. Content is processed with the
+    'process_articles_content' function and the resulting Article objects keep the input order.
 
     Args:
         articles (List[ArticleBase]): A list of articles to scrape content for.
@@ -281,55 +864,9 @@ def scrape_articles_content(articles: List[ArticleBase]) -> List[Article]:
     Returns:
         List[Article]: A list of articles with scraped content.
     """
-    article_list = []
     DefaultLogger().get_logger().info(
         f"Scraping contents from {len(articles)} articles"
     )
-
-    session = requests.Session()
-    session.headers.update(
-        {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/115.0.0.0 Safari/537.36",
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-        }
+    return asyncio.run(
+        fetch_articles_content(articles, fallback=scrape_articles_content_selenium)
     )
-
-    driver = None
-
-    for article in articles:
-        use_selenium = False
-
-        try:
-            response = session.get(
-                str(article.Link), timeout=3, auth=HTTPBasicAuth("user", "pass")
-            )
-            response.raise_for_status()
-        except RequestException as e:
-            status_code = e.response.status_code if e.response is not None else "N/A"
-            DefaultLogger().get_logger().warning(
-                f"Requests failed for {article.Link} with status code {status_code}. Falling back to Selenium."
-            )
-            use_selenium = True
-
-        if not use_selenium:
-            soup = BeautifulSoup(response.text, "html.parser")
-        else:
-            if driver is None:
-                driver = init_driver()
-            try:
-                driver.get(str(article.Link))
-                scroll_down(driver)
-                soup = BeautifulSoup(driver.page_source, "html.parser")
-            except WebDriverException as e:
-                DefaultLogger().get_logger().error(
-                    f"Error loading {article.Link} with Selenium: {str(e)}. No content was extracted."
-                )
-                continue
-
-        article_content = process_articles_content(article, soup)
-        article_list.append(article_content)
-
-    if driver is not None:
-        driver.quit()
-
-    return article_list
@@ -0,0 +1,146 @@
+from datetime import date
+from typing import Iterable, List, Optional
+from app.models import ArticleBase
+from app.utils.logger import DefaultLogger
+from app.utils.services import update_source_watermark
+from app.utils.url_helpers import normalize_url
+
+
+class Watermark:
+    """
+    High-water mark of a source: the date and link of the newest article ingested from it.
+
+    Archive pages list articles newest first, so in incremental mode a crawl stops at the first
+    card that is older than the mark or links to the newest article already ingested.
+
+    Args:
+        date (date): Date of the newest ingested article.
+        link (Optional[str]): Link of the newest ingested article, normalized so marks stored
+            before links were normalized still match.
+    """
+
+    def __init__(self, date: date, link: Optional[str] = None):
+        self.date = date
+        self.link = (normalize_url(link) or link) if link else None
+
+    @classmethod
+    def from_source(cls, source: dict) -> Optional["Watermark"]:
+        """Returns the mark stored in a source configuration, if the source has one."""
+        if not source.get("last_article_date"):
+            return None
+        return cls(
+            date.fromisoformat(source["last_article_date"]),
+            source.get("last_article_link"),
+        )
+
+    def cut(self, articles: List[ArticleBase]) -> tuple[List[ArticleBase], bool]:
+        """
+        Keeps the articles of a page that come before the already-seen content.
+
+        Returns:
+            tuple: The new articles and whether seen content was reached.
+        """
+        for index, article in enumerate(articles):
+            if (
+                str(article.Link) == self.link
+                or date.fromisoformat(article.Date) < self.date
+            ):
+                return articles[:index], True
+        return articles, False
+
+
+class WatermarkTracker:
+    """
+    Tracks the articles stored and failed for every source during an extraction run.
+
+    The new mark of a source is its newest stored article that is older than every article of
+    the source that failed to be fetched or stored in the run, so an incremental run never stops
+    before reaching them and they are retried.
+    """
+
+    def __init__(self, sources: Iterable[dict]):
+        self._sources = {
+            source["base_url"].rstrip("/"): source
+            for source in sources
+            if source.get("id")
+        }
+        # LINK OF THE FIRST STORED ARTICLE OF EVERY DATE, BY SOURCE
+        self._days: dict[str, dict[str, str]] = {}
+        self._failed: dict[str, str] = {}
+
+    def observe(self, articles: Iterable[ArticleBase]):
+        """Records stored articles. Among articles of the same date, the first seen is kept."""
+        for article in articles:
+            days = self._days.setdefault(str(article.Source).rstrip("/"), {})
+            days.setdefault(article.Date, str(article.Link))
+
+    def fail(self, articles: Iterable[ArticleBase]):
+        """Records articles that could not be fetched or stored, holding the marks back."""
+        for article in articles:
+            self._hold(str(article.Source).rstrip("/"), article.Date)
+
+    def _hold(self, key: str, day: str):
+        if key not in self._failed or day < self._failed[key]:
+            self._failed[key] = day
+
+    def marks(self) -> dict[str, tuple[str, str]]:
+        """
+        Returns the new mark of every source that has one, by source base URL.
+
+        Returns:
+            dict: The date and link of the newest stored article older than the failed ones.
+        """
+        marks = {}
+        for key, days in self._days.items():
+            failed = self._failed.get(key)
+            dates = [day for day in days if failed is None or day < failed]
+            if dates:
+                newest = max(dates)
+                marks[key] = (newest, days[newest])
+        return marks
+
+    def export(self) -> List[dict]:
+        """Returns the state of the tracked sources, to be merged with 'from_exports'."""
+        return [
+            {
+                "id": source["id"],
+                "base_url": key,
+                "days": self._days.get(key, {}),
+                "failed": self._failed.get(key),
+            }
+            for key, source in self._sources.items()
+            if key in self._days or key in self._failed
+        ]
+
+    @classmethod
+    def from_exports(cls, exports: Iterable[dict]) -> "WatermarkTracker":
+        """Merges the states exported by the trackers of several work units of a job."""
+        exports = list(exports)
+        tracker = cls(
+            {"id": export["id"], "base_url": export["base_url"]} for export in exports
+        )
+        for export in exports:
+            days = tracker._days.setdefault(export["base_url"], {})
+            for day, link in export["days"].items():
+                days.setdefault(day, link)
+            if export["failed"]:
+                tracker._hold(export["base_url"], export["failed"])
+        return tracker
+
+    async def save(self):
+        """
+        Advances the high-water mark of every source with newly stored articles.
+
+        The storage service only moves a mark forward, so concurrent runs can't rewind it.
+        """
+        for key, (day, link) in self.marks().items():
+            source = self._sources.get(key)
+            if source is None:
+                continue
+            try:
+                await update_source_watermark(source["id"], day, link)
+            except Exception:
+                DefaultLogger().get_logger().warning(
+                    f"Could not update the watermark of {source.get('name', key)}",
+                    exc_info=True,
+                )
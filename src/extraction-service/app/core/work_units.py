@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import os
+from datetime import date
+from typing import Awaitable, Callable, List
+from app.core.dedup import Deduplicator
+from app.core.executor import get_scrape_executor
+from app.core.fetcher import ContentFetcher, fetch_articles_content
+from app.core.known_links import filter_known_articles, save_known_links
+from app.core.pipeline import ArticleUploader, PipelineResult
+from app.core.scraper import (
+    crawl_job,
+    plan_crawl_jobs,
+    scrape_articles_content_selenium,
+)
+from app.core.watermark import Watermark, WatermarkTracker
+from app.models import ArticleBase
+from app.utils.logger import DefaultLogger
+from app.utils.services import (
+    announce_job_completion,
+    complete_work_unit,
+    register_work_units,
+)
+
+# SPLIT WORKFLOWS INTO WORK UNITS SHARED BY EVERY REPLICA INSTEAD OF RUNNING THEM IN ONE
+EXTRACTION_WORK_UNITS = os.getenv("EXTRACTION_WORK_UNITS", "true").lower() == "true"
+WORK_UNIT_ROUTING_KEY = "extraction.unit"
+
+DISCOVERY = "discovery"
+CONTENT = "content"
+
+logger = DefaultLogger().get_logger()
+
+Publish = Callable[[dict, str], Awaitable[None]]
+
+
+class WorkUnitsNotPublished(Exception):
+    """Raised when work units could not be registered or published, so the job can't complete."""
+
+
+def work_unit_id(*parts: str) -> str:
+    """Returns a short identifier derived from the parts, stable across redeliveries."""
+    return hashlib.blake2b(" ".join(parts).encode("utf-8"), digest_size=8).hexdigest()
+
+
+def plan_discovery_units(
+    job_id: str,
+    sources: List[dict],
+    date_base: date,
+    date_cutoff: date,
+    incremental: bool = False,
+) -> List[dict]:
+    """
+    Splits the discovery of an extraction job into one work unit per (source, archive URL).
+
+    Args:
+        job_id (str): Correlation id of the extraction job.
+        sources (List[dict]): Source configurations to scrape.
+        date_base (date): The base date for scraping articles.
+        date_cutoff (date): The cutoff date for scraping articles.
+        incremental (bool): Whether to only crawl articles newer than the sources' high-water marks.
+
+    Returns:
+        List[dict]: The discovery work units, ready to be published.
+    """
+    return [
+        {
+            "job_id": job_id,
+            "unit_id": work_unit_id(job_id, source["name"], url),
+            "kind": DISCOVERY,
+            "source": source,
+            "url": url,
+            "date_base": date_base.isoformat(),
+            "cutoff": cutoff.isoformat(),
+            "incremental": watermark is not None,
+        }
+        for source, url, cutoff, watermark in plan_crawl_jobs(
+            sources, date_base, date_cutoff, incremental=incremental
+        )
+    ]
+
+
+async def publish_work_units(job_id: str, units: List[dict], publish: Publish):
+    """
+    Registers work units of a job in the storage service, then publishes them to the work queue.
+
+    Units are registered before they are published, so the job can't be seen as complete while
+    some of its units are still queued. Unit ids are stable, so the caller can be redelivered and
+    register and publish the same units again.
+
+    Raises:
+        WorkUnitsNotPublished: If registering or publishing the units failed.
+    """
+    if not units:
+        return
+    try:
+        await register_work_units(job_id, [unit["unit_id"] for unit in units])
+        for unit in units:
+            await publish(unit, WORK_UNIT_ROUTING_KEY)
+    except Exception as e:
+        raise WorkUnitsNotPublished(
+            f"Work units of job {job_id} could not be published: {e}"
+        ) from e
+
+
+async def run_discovery_unit(unit: dict, publish: Publish) -> List[str]:
+    """
+    Crawls the archive URL of a discovery unit as a scrape job.
+
+    The base articles of every crawled page are published as a content unit as soon as they are
+    found, so content fetching is spread over the replicas while the crawl goes on.
+
+    Returns:
+        List[str]: Always empty, discovery units store no articles themselves.
+    """
+    loop = asyncio.get_running_loop()
+    source = unit["source"]
+    children = 0
+
+    async def spawn(articles: List[ArticleBase]):
+        nonlocal children
+        children += 1
+        content_unit = {
+            "job_id": unit["job_id"],
+            "unit_id": work_unit_id(unit["unit_id"], str(children)),
+            "kind": CONTENT,
+            "source": source,
+            "articles": [article.model_dump(mode="json") for article in articles],
+        }
+        await publish_work_units(unit["job_id"], [content_unit], publish)
+
+    def on_articles(articles: List[ArticleBase]):
+        asyncio.run_coroutine_threadsafe(spawn(articles), loop).result()
+
+    watermark = Watermark.from_source(source) if unit["incremental"] else None
+    await get_scrape_executor().run(
+        crawl_job,
+        source,
+        unit["url"],
+        date.fromisoformat(unit["date_base"]),
+        date.fromisoformat(unit["cutoff"]),
+        watermark,
+        None,
+        on_articles,
+        name=f"discovery {unit['job_id']} {unit['url']}",
+        job_id=unit["unit_id"],
+    )
+    logger.info(f"Crawled {unit['url']} of {source['name']}: {children} content units")
+    return []
+
+
+async def run_content_unit(unit: dict, watermarks: WatermarkTracker) -> List[str]:
+    """
+    Fetches, deduplicates and stores the articles of a content unit.
+
+    Near-duplicates are detected against the articles already stored around the dates of the
+    unit, which includes the units finished earlier by any replica.
+
+    Args:
+        unit (dict): The content unit.
+        watermarks (WatermarkTracker): Tracker recording the articles stored and failed.
+
+    Returns:
+        List[str]: Identifiers of the articles created in the storage service.
+    """
+    articles = [ArticleBase(**article) for article in unit["articles"]]
+    result = PipelineResult()
+    result.discovered = len(articles)
+    deduplicator = Deduplicator()
+    dates = [date.fromisoformat(article.Date) for article in articles]
+    await deduplicator.load(max(dates), min(dates))
+
+    new_articles = await filter_known_articles(articles)
+    async with ContentFetcher(sources=[unit["source"]]) as fetcher:
+        articles_content = await fetch_articles_content(
+            new_articles,
+            fallback=scrape_articles_content_selenium,
+            fetcher=fetcher,
+            on_failed=watermarks.fail,
+        )
+    result.fetched = len(articles_content)
+
+    uploader = ArticleUploader(deduplicator, result, watermarks=watermarks)
+    try:
+        for article in articles_content:
+            await uploader.add(article)
+        await uploader.close()
+    finally:
+        await save_known_links()
+    return result.article_ids
+
+
+async def run_work_unit(unit: dict, publish: Publish):
+    """
+    Runs a work unit and announces the completion of its job if it was the last one pending.
+
+    A unit that fails is logged and still marked as finished, like a failed page or upload in a
+    single-replica run, so one failure can't keep the job from completing. Failures to publish
+    its child units or the completion of the job are raised instead, so the unit is redelivered.
+
+    Every unit reports the articles it stored or failed to the job, and the high-water marks of
+    the sources are advanced once the job completes, so no unit moves a mark past the articles
+    another unit failed to store.
+
+    Args:
+        unit (dict): The work unit, as published by 'publish_work_units'.
+        publish (Publish): Coroutine publishing a message with a routing key.
+
+    Raises:
+        WorkUnitsNotPublished: If child units of the unit could not be published.
+        Exception: If the unit couldn't be marked as finished or the completion published.
+    """
+    job_id = unit["job_id"]
+    watermarks = WatermarkTracker([unit["source"]])
+    try:
+        if unit["kind"] == DISCOVERY:
+            article_ids = await run_discovery_unit(unit, publish)
+        else:
+            article_ids = await run_content_unit(unit, watermarks)
+    except WorkUnitsNotPublished:
+        raise
+    except Exception:
+        logger.error(
+            f"Work unit {unit['unit_id']} of job {job_id} failed", exc_info=True
+        )
+        article_ids = []
+        if unit["kind"] == CONTENT:
+            watermarks.fail(ArticleBase(**article) for article in unit["articles"])
+
+    # A JOB WHOSE COMPLETION WASN'T ANNOUNCED IS REPORTED AS COMPLETED AGAIN ON REDELIVERY
+    job = await complete_work_unit(
+        job_id, unit["unit_id"], article_ids, watermarks.export()
+    )
+    if not job.get("completed"):
+        return
+    await WatermarkTracker.from_exports(job.get("watermarks", [])).save()
+    await publish_job_completion(job_id, job["article_ids"], publish)
+    try:
+        await announce_job_completion(job_id)
+    except Exception as e:
+        # AT WORST A LATER REDELIVERY OF THE UNIT ANNOUNCES THE COMPLETION TWICE
+        logger.warning(f"Could not record the announcement of job {job_id}: {e}")
+
+
+async def publish_job_completion(job_id: str, article_ids: List[str], publish: Publish):
+    """Notifies the orchestrator that every article of the extraction job has been stored."""
+    message_payload = {
+        "correlation_id": job_id,
+        "status": "extraction_complete",
+        "article_ids": article_ids,
+        "article_count": len(article_ids),
+    }
+    await publish(message_payload, "completion")
+    logger.info(f"Extraction job {job_id} completed: {len(article_ids)} articles")
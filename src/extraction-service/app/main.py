@@ -1,13 +1,16 @@
 from datetime import timedelta
 from contextlib import asynccontextmanager
-from app.core.scraper import scrape_articles_base, scrape_articles_content
+from app.core.driver import close_driver_pool
+from app.core.executor import JobCancelled, get_scrape_executor, shutdown_scrape_executor
+from app.core.known_links import save_known_links
+from app.core.pipeline import run_extraction_pipeline
 from app.utils.date_formatter import format_date_str, secure_date_range
 from app.models import ScrapeRequest, SourceScrapeRequest
 from app.utils.logger import DefaultLogger
-from app.utils.services import get_sources, post_articles_bulk
+from app.utils.services import get_sources
 from fastapi import FastAPI, HTTPException
 from app.rabbitmq.client import get_rabbitmq_client
-from app.rabbitmq.operations import handle_message
+from app.rabbitmq.operations import handle_message, handle_work_unit
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 import asyncio
 import uvicorn
@@ -23,6 +26,7 @@ async def lifespan(app: FastAPI):
         logger.info("RabbitMQ Client connected | Queues and Exchange declared")
 
         asyncio.create_task(client.consume('tasks_extraction', callback=handle_message))
+        asyncio.create_task(client.consume('tasks_extraction_units', callback=handle_work_unit))
     except Exception as e:
         logger.error(f"Error during RabbitMQ initialization: {e}")
 
@@ -34,6 +38,11 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error during RabbitMQ shutdown: {e}")
 
+    shutdown_scrape_executor()
+    close_driver_pool()
+    await save_known_links()
+    logger.info("Scrape executor and Selenium driver pool closed")
+
 app = FastAPI(lifespan=lifespan, title="ExtractionService")
 
 FastAPIInstrumentor.instrument_app(app)
@@ -43,9 +52,10 @@ async def scrape_source(scrape_request: SourceScrapeRequest):
     """
     Scrapes a specific source based on the provided source name and date range.
 
-    This endpoint retrieves the source configuration from the storage service,
-    scrapes the base articles using the source configuration and date range,
-    then scrapes article contents, and finally posts the scraped content to the storage service.
+    This endpoint retrieves the source configuration from the storage service and runs the
+    streaming extraction pipeline: base articles are discovered using the source configuration
+    and date range, their contents are scraped, and the articles are posted to the storage
+    service in batches as they become ready.
 
     Args:
         scrape_request (SourceScrapeRequest): Request object containing the source name, base date, and cutoff date.
@@ -54,7 +64,7 @@ async def scrape_source(scrape_request: SourceScrapeRequest):
         dict: A message indicating successful scraping and insertion of articles for the specified source.
 
     Raises:
-        HTTPException: If sources cannot be retrieved or if the specified source is not found, or if posting content fails.
+        HTTPException: If sources cannot be retrieved or if the specified source is not found, or if every upload fails.
     """
     logger.info(f"Received scrape/source request for source: {scrape_request.name}")
     date_base, date_cutoff = secure_date_range(
@@ -77,21 +87,24 @@ async def scrape_source(scrape_request: SourceScrapeRequest):
     
     logger.info(f"Found source configuration for {scrape_request.name}: {source_dict}")
 
-    articles = scrape_articles_base(source_dict, date_base, date_cutoff)
-    logger.debug(f"Scraped {len(articles)} base articles")
-
-    articles_content = scrape_articles_content(articles)
-    logger.debug(f"Scraped content for {len(articles_content)} articles")
-
     try:
-        await post_articles_bulk(articles_content)
-    except Exception as e:
-        logger.error(f"Error posting articles: {e}")
+        result = await run_extraction_pipeline(
+            [source_dict], date_base, date_cutoff, name=f"scrape/source {scrape_request.name}",
+            checkpoint_id=f"source-{source_dict['name']}-{date_base}-{date_cutoff}",
+            incremental=scrape_request.incremental,
+        )
+    except JobCancelled:
+        logger.warning(f"Scrape job for source {scrape_request.name} was cancelled")
+        raise HTTPException(status_code=409, detail="Scrape job was cancelled.")
+
+    if result.failed_batches and not result.article_ids:
         raise HTTPException(status_code=500, detail="Error inserting content articles for source.")
 
     logger.info(f"Scrape and insertion completed for source {scrape_request.name}")
     return {
-        "message": f"Scraped and inserted articles for source {scrape_request.name}"
+        "message": f"Scraped and inserted articles for source {scrape_request.name}",
+        "inserted": len(result.article_ids),
+        "failed_batches": result.failed_batches,
     }
 
 
@@ -100,10 +113,11 @@ async def scrape_all(scrape_request: ScrapeRequest):
     """
     Scrapes articles for all sources based on the provided date range.
 
-    This endpoint retrieves all source configurations from the storage service,
-    scrapes base articles for each source using the specified date range,
-    then scrapes article contents for all scraped articles,
-    and finally posts the collected articles to the storage service.
+    This endpoint retrieves all source configurations from the storage service and runs the
+    streaming extraction pipeline over all of them: base articles are discovered using the
+    specified date range, their contents are scraped, and the articles are posted to the
+    storage service in batches as they become ready. Progress is checkpointed, so repeating an
+    interrupted request with the same dates resumes it instead of starting over.
 
     Args:
         scrape_request (ScrapeRequest): Request object containing the base date and cutoff date.
@@ -112,7 +126,7 @@ async def scrape_all(scrape_request: ScrapeRequest):
         dict: A message indicating successful scraping and insertion of articles for all sources.
 
     Raises:
-        HTTPException: If sources cannot be retrieved or if posting content fails.
+        HTTPException: If sources cannot be retrieved or if every upload fails.
     """
     logger.info("Received scrape/all request")
     date_base = format_date_str(scrape_request.date_base, "%d-%m-%Y")
@@ -130,28 +144,64 @@ async def scrape_all(scrape_request: ScrapeRequest):
         logger.error(f"Error retrieving sources from storage service: {e}")
         raise HTTPException(status_code=500, detail="Error retrieving sources from storage service.")
 
-    all_articles = []
-    for source in sources_list:
-        if source.get("name"):
-            logger.info(f"Scraping articles for source: {source.get('name')}")
-            articles = scrape_articles_base(source, date_base, date_cutoff)
-            logger.debug(
-                f"Scraped {len(articles)} articles for source {source.get('name')}"
-            )
-            all_articles.extend(articles)
-
-    logger.info("Scraping content for all scraped articles")
-    articles_content = scrape_articles_content(all_articles)
-    logger.debug(f"Scraped content for {len(articles_content)} articles")
-
+    named_sources = [source for source in sources_list if source.get("name")]
+    logger.info(f"Scraping articles for sources: {[source.get('name') for source in named_sources]}")
     try:
-        await post_articles_bulk(articles_content)
-    except Exception as e:
-        logger.error(f"Error posting articles: {e}")
+        result = await run_extraction_pipeline(
+            named_sources, date_base, date_cutoff, name="scrape/all",
+            checkpoint_id=f"all-{date_base}-{date_cutoff}",
+            incremental=scrape_request.incremental,
+        )
+    except JobCancelled:
+        logger.warning("Scrape job for all sources was cancelled")
+        raise HTTPException(status_code=409, detail="Scrape job was cancelled.")
+
+    if result.failed_batches and not result.article_ids:
         raise HTTPException(status_code=500, detail="Error inserting content articles for all sources.")
 
     logger.info("Scrape and insertion completed for all sources")
-    return {"message": "Scraped and inserted articles for all sources"}
+    return {
+        "message": "Scraped and inserted articles for all sources",
+        "inserted": len(result.article_ids),
+        "failed_batches": result.failed_batches,
+    }
+
+
+@app.get("/scrape/jobs", response_model=list)
+async def list_scrape_jobs():
+    """
+    Lists the scrape jobs currently queued or running in the scrape executor.
+
+    Returns:
+        list: A list of job descriptions with their id, name, status and timestamps.
+    """
+    return [job.to_dict() for job in get_scrape_executor().jobs]
+
+
+@app.delete("/scrape/jobs/{job_id}", response_model=dict)
+async def cancel_scrape_job(job_id: str):
+    """
+    Requests the cancellation of a queued or running scrape job.
+
+    Cancellation is cooperative: the job stops at its next page or article boundary.
+
+    Args:
+        job_id (str): Identifier of the job to cancel.
+
+    Returns:
+        dict: A message confirming that cancellation was requested.
+
+    Raises:
+        HTTPException: If no job with the given id is queued or running.
+    """
+    if not get_scrape_executor().cancel(job_id):
+        raise HTTPException(status_code=404, detail=f"Scrape job '{job_id}' not found.")
+    return {"message": f"Cancellation requested for scrape job {job_id}"}
+
+
+@app.get("/health")
+async def health_check():
+    return {"status": "ok", "active_jobs": len(get_scrape_executor().jobs)}
 
 if __name__ == "__main__":
     logger.info("Starting Extraction Service")
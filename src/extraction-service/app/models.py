@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import List, Literal, Optional
 from datetime import date, timedelta
 from uuid import uuid4
 from pydantic import BaseModel, Field, HttpUrl, field_validator
@@ -11,6 +11,7 @@ class ScrapeRequest(BaseModel):
     Attributes:
         date_base (str): Base date for scraping (inclusive). Format: DD-MM-YYYY.
         date_cutoff (str): Cutoff date for scraping (exclusive). Format: DD-MM-YYYY.
+        incremental (bool): Whether to only scrape articles newer than each source's high-water mark.
     """
 
     date_base: str = Field(
@@ -21,6 +22,10 @@ class ScrapeRequest(BaseModel):
         default_factory=lambda: (date.today() - timedelta(days=1)).isoformat(),
         description="Cutoff date for scraping (exclusive). Format: DD-MM-YYYY",
     )
+    incremental: bool = Field(
+        False,
+        description="Only scrape articles newer than each source's high-water mark, stopping at already-seen content",
+    )
 
     @field_validator("date_base", "date_cutoff", mode="before")
     def validate_dates(cls, value):
@@ -106,6 +111,7 @@ class Article(ArticleBase):
     Attributes:
         Paragraphs (Optional[List[str]]): List of text paragraphs forming the article.
         References (Optional[List[Reference]]): List of references included within the article.
+        Fingerprint (Optional[str]): SimHash of the article paragraphs used to detect near-duplicates.
     """
 
     Paragraphs: Optional[List[str]] = Field(
@@ -115,6 +121,27 @@ class Article(ArticleBase):
         default_factory=list,
         description="List of references included within the text of the article",
     )
+    Fingerprint: Optional[str] = Field(
+        None, description="SimHash of the article paragraphs, as 16 hexadecimal digits"
+    )
+
+
+class ArticleAlias(ArticleBase):
+    """
+    Model representing a near-duplicate of a stored article, such as a syndicated wire story.
+
+    Attributes:
+        CanonicalId (str): Identifier of the stored article the alias duplicates.
+        Distance (int): Number of fingerprint bits in which the alias differs from the stored article.
+    """
+
+    CanonicalId: str = Field(
+        ..., description="Identifier of the stored article the alias duplicates"
+    )
+    Distance: int = Field(
+        0,
+        description="Number of fingerprint bits in which the alias differs from the stored article",
+    )
 
 
 class Source(BaseModel):
@@ -129,6 +156,17 @@ class Source(BaseModel):
         article_selector (Optional[str]): CSS selector to locate articles.
         date_format (Optional[str]): Expected date format for date extraction.
         button_selector (Optional[str]): CSS selector for navigation button, if any.
+        feed_url (Optional[str]): RSS/Atom feed, sitemap or sitemap index used to discover articles instead of the archive pages.
+        cache_ttl (Optional[int]): Seconds during which cached archive pages are reused without revalidation.
+        scroll (Optional[bool]): Whether archive pages must be scrolled down to load all their articles.
+        page_search (Optional[bool]): Whether the first page of a paginated archive overlapping the date range is located by sampling pages instead of crawling from page 1.
+        render_mode (Optional[str]): 'static' or 'rendered' to skip the automatic detection of whether archive pages need a browser.
+        card_extraction (Optional[str]): 'html' to parse rendered archive pages in Python or 'browser' to read the article cards in the browser.
+        block_requests (Optional[bool]): Whether the browser blocks the requests matching the blocklist while rendering the source pages.
+        blocked_urls (Optional[List[str]]): URL patterns blocked in addition to the default blocklist, where '*' matches any sequence of characters.
+        max_content_bytes (Optional[int]): Maximum size in bytes of an article page fetched over HTTP, larger pages are skipped.
+        last_article_date (Optional[str]): Date of the newest article ingested from the source (high-water mark).
+        last_article_link (Optional[str]): Link of the newest article ingested from the source (high-water mark).
     """
 
     id: Optional[str] = None
@@ -142,3 +180,43 @@ class Source(BaseModel):
     button_selector: Optional[str] = Field(
         None, description="CSS selector for navigation button, if any"
     )
+    feed_url: Optional[str] = Field(
+        None,
+        description="RSS/Atom feed, sitemap or sitemap index used to discover articles instead of the archive pages",
+    )
+    cache_ttl: Optional[int] = Field(
+        None,
+        description="Seconds during which cached archive pages are reused without revalidation",
+    )
+    scroll: Optional[bool] = Field(
+        True,
+        description="Whether archive pages must be scrolled down to load all their articles",
+    )
+    page_search: Optional[bool] = Field(
+        True,
+        description="Whether the first page of a paginated archive overlapping the date range is located by sampling pages",
+    )
+    render_mode: Optional[Literal["static", "rendered"]] = Field(
+        None,
+        description="Forces whether archive pages are fetched over plain HTTP or rendered by the browser",
+    )
+    card_extraction: Optional[Literal["html", "browser"]] = Field(
+        "html",
+        description="Whether the article cards of rendered archive pages are read from the page HTML or in the browser",
+    )
+    block_requests: Optional[bool] = Field(
+        True,
+        description="Whether the browser blocks the requests matching the blocklist while rendering the source pages",
+    )
+    blocked_urls: Optional[List[str]] = Field(
+        None, description="URL patterns blocked in addition to the default blocklist"
+    )
+    max_content_bytes: Optional[int] = Field(
+        None, description="Maximum size in bytes of an article page fetched over HTTP"
+    )
+    last_article_date: Optional[str] = Field(
+        None, description="Date of the newest article ingested from the source"
+    )
+    last_article_link: Optional[str] = Field(
+        None, description="Link of the newest article ingested from the source"
+    )
@@ -2,8 +2,16 @@ import json
 from app.utils.logger import DefaultLogger
 from app.main import get_rabbitmq_client
 from app.utils.date_formatter import secure_date_range
-from app.utils.services import get_sources, post_articles_bulk
-from app.core.scraper import scrape_articles_base, scrape_articles_content
+from app.utils.services import get_sources
+from app.core.executor import JobCancelled
+from app.core.pipeline import run_extraction_pipeline
+from app.core.work_units import (
+    EXTRACTION_WORK_UNITS,
+    plan_discovery_units,
+    publish_job_completion,
+    publish_work_units,
+    run_work_unit,
+)
 
 logger = DefaultLogger().get_logger()
 
@@ -13,6 +21,7 @@ async def publish_message(message: dict, routing_key: str):
         await client.publish(message, routing_key)
     except Exception as e:
         logger.error(f"Failed to publish message to routing key '{routing_key}': {e}")
+        raise
 
 async def handle_message(message):
     message_dict = json.loads(message.body.decode('utf-8'))
@@ -51,23 +60,35 @@ async def handle_message(message):
         logger.error(f"Some of the sources specified not found in Storage Service: {sources}")
         return
 
-    articles = []
-    for src in matching_sources:
-        articles_from_src = scrape_articles_base(src, date_base, date_cutoff)
-        logger.debug(f"Scraped {len(articles_from_src)} base articles from source {src.get('name')}")
-        articles.extend(articles_from_src)
-    
-    logger.debug(f"Total scraped base articles: {len(articles)}")
-    articles_content = scrape_articles_content(articles)
-    logger.debug(f"Scraped content for {len(articles_content)} articles")
+    if EXTRACTION_WORK_UNITS:
+        try:
+            await split_extraction(
+                correlation_id, matching_sources, date_base, date_cutoff,
+                bool(payload.get("incremental")),
+            )
+        except Exception as e:
+            # THE UNITS HAVE STABLE IDS, SO THE REDELIVERED TASK REGISTERS AND PUBLISHES THEM AGAIN
+            logger.error(f"Error publishing work units of extraction job {correlation_id}: {e}")
+            await message.nack(requeue=True)
+            return
+        await message.ack()
+        return
 
     try:
-        created_articles = await post_articles_bulk(articles_content)
-    except Exception as e:
-        logger.error(f"Error posting articles: {e}")
+        result = await run_extraction_pipeline(
+            matching_sources, date_base, date_cutoff,
+            name=f"extraction {correlation_id}", job_id=correlation_id,
+            checkpoint_id=correlation_id, incremental=bool(payload.get("incremental")),
+        )
+    except JobCancelled:
+        logger.warning(f"Extraction job {correlation_id} was cancelled")
+        return
+
+    if result.failed_batches and not result.article_ids:
+        logger.error(f"Error posting articles for extraction job {correlation_id}")
         return
-    
-    article_ids = [article.get("id") for article in created_articles]
+
+    article_ids = result.article_ids
 
     try:
         message_payload = {
@@ -82,4 +103,24 @@ async def handle_message(message):
     
     logger.info("Extraction task completed successfully")
 
-    await message.ack()
\ No newline at end of file
+    await message.ack()
+
+async def split_extraction(correlation_id, sources, date_base, date_cutoff, incremental):
+    units = plan_discovery_units(correlation_id, sources, date_base, date_cutoff, incremental)
+    logger.info(f"Splitting extraction job {correlation_id} into {len(units)} discovery units")
+    if units:
+        await publish_work_units(correlation_id, units, publish_message)
+    else:
+        await publish_job_completion(correlation_id, [], publish_message)
+
+async def handle_work_unit(message):
+    unit = json.loads(message.body.decode('utf-8'))
+    logger.info(f"Processing {unit.get('kind')} work unit {unit.get('unit_id')} | CorrelationID: {unit.get('job_id')}")
+    try:
+        await run_work_unit(unit, publish_message)
+    except Exception as e:
+        # THE UNIT IS REDELIVERED IF ITS CHILDREN, ITS COMPLETION OR THE JOB'S COULDN'T BE PUBLISHED
+        logger.error(f"Error completing work unit {unit.get('unit_id')}: {e}")
+        await message.nack(requeue=True)
+        return
+    await message.ack()
@@ -0,0 +1,32 @@
+from datetime import date
+from typing import List, Optional, Union
+from app.models import Article, ArticleBase
+
+
+def create_article(
+    name: Union[int, str], day: int = 2, paragraphs: Optional[List[str]] = None
+) -> ArticleBase:
+    """
+    Builds an article of http://example.com published on January 'day', 2022.
+
+    Args:
+        name (Union[int, str]): Number of the article, or the path of its link.
+        day (int): Day of publication.
+        paragraphs (Optional[List[str]]): Content of the article, which makes it an Article.
+
+    Returns:
+        ArticleBase: The article, an Article if 'paragraphs' is given.
+    """
+    if isinstance(name, int):
+        title, path = f"Article {name}", f"/article-{name}"
+    else:
+        title, path = name, name
+    fields = dict(
+        Title=title,
+        Date=date(2022, 1, day),
+        Link=f"http://example.com{path}",
+        Source="http://example.com",
+    )
+    if paragraphs is not None:
+        return Article(**fields, Paragraphs=paragraphs)
+    return ArticleBase(**fields)
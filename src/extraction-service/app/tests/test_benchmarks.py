@@ -0,0 +1,41 @@
+import httpx
+from app.benchmarks.corpus import load_more_corpus, paged_corpus
+from app.benchmarks.extraction import STAGES, compare, run
+from app.benchmarks.server import FixtureServer
+
+
+def test_fixture_server_replays_pages_by_path():
+    pages = dict(paged_corpus(pages=2, cards=3) + load_more_corpus(batches=2, cards=3))
+    with FixtureServer(pages) as server:
+        for url, html in pages.items():
+            response = httpx.get(server.url_for(url))
+            assert response.status_code == 200
+            assert response.text == html
+        assert httpx.get(f"{server.url}/missing").status_code == 404
+
+
+def test_run_measures_every_stage():
+    results = run(rounds=1, days=1, cards=5)
+    assert set(results) == set(STAGES)
+    assert results["parse"]["pages_per_sec"] > 0
+    assert results["process_articles_base"]["articles_per_sec"] > 0
+    assert results["dates"]["pages_per_sec"] is None
+
+
+def test_compare_flags_regressions():
+    baseline = {
+        "results": {
+            "parse": {"pages_per_sec": 100.0, "articles_per_sec": 1000.0},
+            "dates": {"pages_per_sec": None, "articles_per_sec": 500.0},
+        }
+    }
+    results = {
+        "parse": {"pages_per_sec": 90.0, "articles_per_sec": 500.0},
+        "dates": {"pages_per_sec": None, "articles_per_sec": 600.0},
+    }
+    regressed = {
+        (stage, metric)
+        for stage, metric, *_, worse in compare(results, baseline)
+        if worse
+    }
+    assert regressed == {("parse", "articles_per_sec")}
@@ -0,0 +1,77 @@
+import asyncio
+from datetime import date
+from app.core import checkpoint as checkpoint_module
+from app.core import pipeline
+from app.core.checkpoint import JobCheckpoint
+from app.models import Article
+from app.tests.conftest import create_article
+
+SOURCE = {"name": "Test Source", "base_url": "http://example.com"}
+DATE_BASE, DATE_CUTOFF = date(2022, 1, 3), date(2022, 1, 1)
+
+
+def test_checkpoint_round_trip(tmp_path):
+    checkpoint = JobCheckpoint("job/1", DATE_BASE, DATE_CUTOFF, str(tmp_path))
+    checkpoint.page_done(SOURCE, "http://example.com/2022/01/02", 3)
+    checkpoint.url_done(SOURCE, "http://example.com/2022/01/03")
+    checkpoint.add_pending([create_article(1), create_article(2)])
+    checkpoint.remove_pending([create_article(3)])
+    checkpoint.save()
+
+    resumed = JobCheckpoint("job/1", DATE_BASE, DATE_CUTOFF, str(tmp_path))
+    assert resumed.next_page(SOURCE, "http://example.com/2022/01/02") == 4
+    assert resumed.is_done(SOURCE, "http://example.com/2022/01/03")
+    assert len(resumed.pending_articles()) == 2
+
+    other_range = JobCheckpoint("job/1", DATE_BASE, date(2021, 1, 1), str(tmp_path))
+    assert not other_range.resumed
+
+
+def test_pipeline_resumes_pending_articles(monkeypatch, tmp_path):
+    monkeypatch.setattr(checkpoint_module, "CHECKPOINT_DIR", str(tmp_path))
+    stored = JobCheckpoint("job-1", DATE_BASE, DATE_CUTOFF)
+    stored.add_pending([create_article(1)])
+    stored.save()
+    assert (tmp_path / "job-1.json").exists()
+
+    def dummy_scrape_sources_base(
+        sources,
+        date_base,
+        date_cutoff,
+        pool,
+        on_articles,
+        checkpoint=None,
+        incremental=False,
+    ):
+        assert checkpoint is not None and checkpoint.resumed
+        on_articles([create_article(2)])
+        return []
+
+    async def dummy_filter_known_articles(articles):
+        return articles
+
+    async def dummy_fetch_articles_content(articles, fallback, fetcher, on_failed):
+        return [Article(**article.model_dump()) for article in articles]
+
+    posted = []
+
+    async def dummy_post_articles_bulk(articles):
+        posted.extend(article.Title for article in articles)
+        return [{"id": article.id} for article in articles]
+
+    monkeypatch.setattr(pipeline, "scrape_sources_base", dummy_scrape_sources_base)
+    monkeypatch.setattr(pipeline, "filter_known_articles", dummy_filter_known_articles)
+    monkeypatch.setattr(
+        pipeline, "fetch_articles_content", dummy_fetch_articles_content
+    )
+    monkeypatch.setattr(pipeline, "post_articles_bulk", dummy_post_articles_bulk)
+    monkeypatch.setattr(pipeline, "remember_articles", lambda articles: None)
+
+    asyncio.run(
+        pipeline.run_extraction_pipeline(
+            [SOURCE], DATE_BASE, DATE_CUTOFF, checkpoint_id="job-1"
+        )
+    )
+
+    assert sorted(posted) == ["Article 1", "Article 2"]
+    assert not (tmp_path / "job-1.json").exists()
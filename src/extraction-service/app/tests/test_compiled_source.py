@@ -0,0 +1,43 @@
+from datetime import date
+from bs4 import BeautifulSoup
+from app.core.compiled_source import CompiledSource, get_compiled_source
+
+SOURCE = {
+    "id": "source-1",
+    "base_url": "http://example.com",
+    "url": "http://example.com/archive/{year}/{month}/{day}?page={page}",
+    "date_format": "%d-%m-%Y",
+}
+
+
+def test_compiled_source_is_cached_per_configuration():
+    assert get_compiled_source(SOURCE) is get_compiled_source(dict(SOURCE))
+    edited = {**SOURCE, "date_format": "%Y-%m-%d"}
+    assert get_compiled_source(edited) is not get_compiled_source(SOURCE)
+
+
+def test_compiled_source_dates_from_urls():
+    compiled = CompiledSource(SOURCE)
+    assert compiled.date_from_url("http://example.com/archive/2024/3/9?page=2") == date(
+        2024, 3, 9
+    )
+    assert compiled.date_from_link("http://example.com/2024/02/30/story") is None
+    assert compiled.date_from_link("http://example.com/2024/02/29/story") == date(
+        2024, 2, 29
+    )
+
+
+def test_compiled_source_title_keeps_heading_priority():
+    compiled = CompiledSource(SOURCE)
+    card = BeautifulSoup(
+        '<div><h3><a href="/a">Headline</a></h3><a href="/b">More</a></div>',
+        "html.parser",
+    )
+    title = compiled.find_title(card)
+    assert title.get_text() == "Headline"
+    assert compiled.find_href(card, title) == "/a"
+    # AN EARLIER h3-ONLY CARD DOESN'T MAKE h3 WIN OVER h2
+    card = BeautifulSoup(
+        "<div><h2>Second headline</h2><h3>Kicker</h3></div>", "html.parser"
+    )
+    assert compiled.find_title(card).get_text() == "Second headline"
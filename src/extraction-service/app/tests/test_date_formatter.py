@@ -0,0 +1,61 @@
+import locale
+from datetime import date, datetime, timedelta
+import pytest
+from app.utils import date_formatter
+from app.utils.date_formatter import format_date_str
+
+
+@pytest.fixture(autouse=True)
+def no_locale_changes(monkeypatch):
+    def fail_setlocale(*args):
+        raise AssertionError("format_date_str must not change the process locale")
+
+    monkeypatch.setattr(locale, "setlocale", fail_setlocale)
+    monkeypatch.setattr(date_formatter, "_learned_formats", {})
+    date_formatter._parse_absolute.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "text, format, expected",
+    [
+        ("22/01/2025", "%d/%m/%Y", date(2025, 1, 22)),
+        ("Published 22 Jan 2025", "%d %b %Y", date(2025, 1, 22)),
+        ("22 de enero de 2025", "%d de %B de %Y", date(2025, 1, 22)),
+        ("3 dic. 2024", "%d %b %Y", date(2024, 12, 3)),
+        ("miércoles, 5 de marzo de 2025", "%A, %d de %B de %Y", date(2025, 3, 5)),
+        ("January 22, 2025", "%d/%m/%Y", date(2025, 1, 22)),
+        ("2025-01-22", "%d.%m.%Y", date(2025, 1, 22)),
+        ("22.01.25", "%d.%m.%y", date(2025, 1, 22)),
+    ],
+)
+def test_format_date_str(text, format, expected):
+    assert format_date_str(text, format) == expected
+
+
+def test_format_date_str_without_year_uses_current_year():
+    assert format_date_str("5 Mar", "%d %b") == date(datetime.now().year, 3, 5)
+
+
+def test_format_date_str_learns_source_format():
+    # AMBIGUOUS DATES FOLLOW THE LAST FORMAT THAT WORKED FOR THE SOURCE
+    assert format_date_str("01/22/2025", "%Y", "news.example") == date(2025, 1, 22)
+    assert format_date_str("02/03/2025", "%Y", "news.example") == date(2025, 2, 3)
+    assert format_date_str("02/03/2025", "%Y", "other.example") == date(2025, 3, 2)
+
+
+def test_format_date_str_does_not_learn_from_ambiguous_dates():
+    # READ DAY FIRST, AS WITHOUT A LEARNED FORMAT, AND NOTHING IS LEARNED
+    assert format_date_str("03/04/2025", "%Y", "news.example") == date(2025, 4, 3)
+    assert "news.example" not in date_formatter._learned_formats
+
+    assert format_date_str("01/22/2025", "%Y", "news.example") == date(2025, 1, 22)
+    # AN AMBIGUOUS DATE IN ANOTHER FORMAT DOES NOT REPLACE THE LEARNED ONE
+    assert format_date_str("03-04-2025", "%Y", "news.example") == date(2025, 4, 3)
+    assert format_date_str("03/04/2025", "%Y", "news.example") == date(2025, 3, 4)
+
+
+def test_format_date_str_relative_and_fallback():
+    today = datetime.now().date()
+    assert format_date_str("hace 2 días", "%d/%m/%Y") == today - timedelta(days=2)
+    assert format_date_str("3 days ago", "%d/%m/%Y") == today - timedelta(days=3)
+    assert format_date_str("not a date", "%d/%m/%Y") == today
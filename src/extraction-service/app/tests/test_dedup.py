@@ -0,0 +1,140 @@
+import asyncio
+import random
+from app.core import dedup, pipeline
+from app.core.dedup import Deduplicator, FingerprintIndex, hamming_distance, simhash
+from app.models import Article
+from app.tests.conftest import create_article
+
+VOCABULARY = (
+    "the central bank raised its benchmark interest rate by a quarter point on thursday "
+    "citing persistent inflation in services and a labour market that remains tighter than "
+    "expected while policymakers said further increases could not be ruled out although "
+    "pace of tightening would depend on incoming data about wages energy prices consumer demand"
+).split()
+
+
+def story(seed: int, paragraphs: int = 8):
+    # PSEUDO-RANDOM TEXT AS LONG AS A REAL ARTICLE, SO A FEW EDITS ONLY TOUCH A FEW SHINGLES
+    rng = random.Random(seed)
+    return [" ".join(rng.choices(VOCABULARY, k=60)) for _ in range(paragraphs)]
+
+
+WIRE_STORY = story(1)
+OTHER_STORY = story(2)
+
+
+def test_simhash_is_close_for_near_duplicates():
+    original = simhash(WIRE_STORY)
+    syndicated = simhash(
+        ["By Staff Reporter."] + WIRE_STORY + ["Reporting by the wire agency."]
+    )
+    assert hamming_distance(original, simhash(WIRE_STORY)) == 0
+    assert hamming_distance(original, syndicated) <= dedup.DEDUP_MAX_DISTANCE
+    assert hamming_distance(original, simhash(OTHER_STORY)) > 10
+    assert simhash(["Too short to compare."]) is None
+
+
+def test_fingerprint_index_finds_within_distance_and_evicts():
+    index = FingerprintIndex(max_distance=3, capacity=2)
+    index.add(0b1011, "a")
+    assert index.find(0b1011 ^ (1 << 63) ^ (1 << 20)) == ("a", 2)
+    assert index.find(0b1011 ^ 0xF0F0) is None
+    index.add(1 << 40, "b")
+    index.add(1 << 50, "c")
+    assert len(index) == 2
+    assert index.find(0b1011) is None
+
+
+def test_deduplicator_aliases_near_duplicates():
+    deduplicator = Deduplicator()
+    original = create_article(1, paragraphs=WIRE_STORY)
+    copy = create_article(2, paragraphs=WIRE_STORY + ["Reporting by the wire agency."])
+
+    assert deduplicator.check(original) is None
+    assert original.Fingerprint is not None
+    alias = deduplicator.check(copy)
+    assert alias.CanonicalId == original.id
+    assert alias.id == copy.id
+    assert deduplicator.check(create_article(3, paragraphs=OTHER_STORY)) is None
+
+
+def test_aliases_of_dropped_canonical_are_uploaded_as_articles(monkeypatch):
+    posted, aliased = [], []
+
+    async def dummy_post_articles_bulk(articles):
+        posted.append([article.Title for article in articles])
+        if len(posted) == 1:
+            raise Exception("Storage unavailable")
+        return [{"id": article.id} for article in articles]
+
+    async def dummy_post_article_aliases(aliases):
+        aliased.extend(aliases)
+
+    monkeypatch.setattr(pipeline, "post_articles_bulk", dummy_post_articles_bulk)
+    monkeypatch.setattr(pipeline, "post_article_aliases", dummy_post_article_aliases)
+    monkeypatch.setattr(pipeline, "remember_articles", lambda articles: None)
+    monkeypatch.setattr(pipeline, "UPLOAD_RETRIES", 1)
+
+    articles = [
+        create_article(i, paragraphs=WIRE_STORY + [f"Edition {i}."]) for i in range(3)
+    ]
+    result = pipeline.PipelineResult()
+
+    async def run():
+        uploader = pipeline.ArticleUploader(Deduplicator(), result)
+        for article in articles:
+            await uploader.add(article)
+        await uploader.close()
+
+    asyncio.run(run())
+
+    # THE FIRST COPY IS DROPPED, THE SECOND BECOMES CANONICAL AND THE THIRD ITS ALIAS
+    assert posted == [["Article 0"], ["Article 1"]]
+    assert [(alias.Title, alias.CanonicalId) for alias in aliased] == [
+        ("Article 2", articles[1].id)
+    ]
+    assert result.failed_batches == 1 and result.duplicates == 1
+
+
+def test_failed_aliases_are_retried_then_counted_as_failed(monkeypatch):
+    attempts = []
+
+    async def dummy_post_articles_bulk(articles):
+        return [{"id": article.id} for article in articles]
+
+    async def dummy_post_article_aliases(aliases):
+        attempts.append(len(aliases))
+        raise Exception("Storage unavailable")
+
+    monkeypatch.setattr(pipeline, "post_articles_bulk", dummy_post_articles_bulk)
+    monkeypatch.setattr(pipeline, "post_article_aliases", dummy_post_article_aliases)
+    monkeypatch.setattr(pipeline, "remember_articles", lambda articles: None)
+    monkeypatch.setattr(pipeline, "UPLOAD_RETRIES", 2)
+    monkeypatch.setattr(pipeline, "UPLOAD_BACKOFF", 0)
+
+    failed = []
+
+    class DummyWatermarks:
+        def observe(self, articles):
+            pass
+
+        def fail(self, articles):
+            failed.extend(article.Title for article in articles)
+
+    result = pipeline.PipelineResult()
+
+    async def run():
+        uploader = pipeline.ArticleUploader(
+            Deduplicator(), result, watermarks=DummyWatermarks()
+        )
+        for i in range(2):
+            await uploader.add(
+                create_article(i, paragraphs=WIRE_STORY + [f"Edition {i}."])
+            )
+        await uploader.close()
+
+    asyncio.run(run())
+
+    assert attempts == [1, 1]
+    assert failed == ["Article 1"]
+    assert result.failed_batches == 1 and result.duplicates == 0
@@ -0,0 +1,165 @@
+import json
+import pytest
+from selenium.common.exceptions import WebDriverException
+from app.core import driver as driver_module
+from app.core.driver import DriverPool, scroll_down
+
+
+class DummyDriver:
+    def __init__(self):
+        self.alive = True
+        self.quit_called = False
+
+    def get(self, url):
+        pass
+
+    def execute_script(self, script):
+        if not self.alive:
+            raise WebDriverException("Driver is not reachable")
+        return 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+def test_driver_pool_reuses_warm_driver():
+    pool = DriverPool(size=1, max_pages=10, factory=DummyDriver)
+    with pool.lease() as driver:
+        driver.get("http://example.com/1")
+        first = driver.driver
+    with pool.lease() as driver:
+        assert driver.driver is first
+        assert driver.pages == 1
+
+
+def test_driver_pool_recycles_after_max_pages():
+    pool = DriverPool(size=1, max_pages=2, factory=DummyDriver)
+    with pool.lease() as driver:
+        driver.get("http://example.com/1")
+        driver.get("http://example.com/2")
+        first = driver.driver
+    assert first.quit_called
+    with pool.lease() as driver:
+        assert driver.driver is not first
+
+
+def test_driver_pool_lazy_lease_only_leases_on_use():
+    created = []
+
+    def factory():
+        created.append(DummyDriver())
+        return created[-1]
+
+    pool = DriverPool(size=1, factory=factory)
+    with pool.lazy_lease() as driver:
+        assert not driver.leased
+    assert created == []
+    with pool.lazy_lease() as driver:
+        driver.get("http://example.com/1")
+        driver.blocked_urls = ["*.woff"]
+        assert driver.leased and driver.pages == 1
+    with pool.lease() as driver:
+        assert driver.driver is created[0]
+        assert driver.blocked_urls == ["*.woff"]
+
+
+def test_driver_pool_discards_unhealthy_driver():
+    pool = DriverPool(size=1, factory=DummyDriver)
+    with pool.lease() as driver:
+        first = driver.driver
+    first.alive = False
+    with pool.lease() as driver:
+        assert driver.driver is not first
+    assert first.quit_called
+
+
+def test_driver_pool_recycles_after_webdriver_error():
+    pool = DriverPool(size=1, factory=DummyDriver)
+    with pytest.raises(WebDriverException):
+        with pool.lease() as driver:
+            first = driver.driver
+            raise WebDriverException("Crashed")
+    assert first.quit_called
+
+
+class ScrollingDriver:
+    """Fake page that grows twice when scrolled and is busy on the first settle poll."""
+
+    def __init__(self, heights):
+        self.heights = list(heights)
+        self.scrolls = 0
+        self.settle_polls = 0
+
+    def execute_script(self, script):
+        if script == driver_module._SETTLE_SCRIPT:
+            self.settle_polls += 1
+            return 0 if self.settle_polls == 1 else 1000
+        if script.startswith("window.scrollTo"):
+            self.scrolls += 1
+            return None
+        return self.heights[min(self.scrolls, len(self.heights) - 1)]
+
+
+def test_scroll_down_stops_when_height_is_stable(monkeypatch):
+    monkeypatch.setattr(driver_module, "SETTLE_POLL_INTERVAL", 0)
+    driver = ScrollingDriver([1000, 2000, 3000, 3000])
+    scroll_down(driver, max_scrolls=10, timeout=5)
+    assert driver.scrolls == 3
+    assert driver.settle_polls == 4
+
+
+def test_scroll_down_is_capped(monkeypatch):
+    monkeypatch.setattr(driver_module, "SETTLE_POLL_INTERVAL", 0)
+    driver = ScrollingDriver(range(1000, 100000, 1000))
+    scroll_down(driver, max_scrolls=5, timeout=5)
+    assert driver.scrolls == 5
+
+
+class DevToolsDriver(DummyDriver):
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+        self.log = []
+
+    def execute_script(self, script):
+        return 1000
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+
+    def get_log(self, log_type):
+        entries, self.log = self.log, []
+        return entries
+
+
+def network_event(method, **params):
+    return {"message": json.dumps({"message": {"method": method, "params": params}})}
+
+
+def test_render_page_applies_blocklist_and_counts_blocked_requests():
+    pool = DriverPool(size=1, factory=DevToolsDriver)
+    with pool.lease() as driver:
+        driver.driver.log = [
+            network_event("Network.loadingFailed", blockedReason="inspector"),
+            network_event("Network.loadingFailed", errorText="net::ERR_FAILED"),
+            network_event("Network.responseReceived"),
+        ]
+        timings = driver_module.render_page(driver, "http://example.com", scroll=False)
+        driver_module.render_page(driver, "http://example.com/2", scroll=False)
+        source = {"blocked_urls": ["*widgets.example.com*"]}
+        driver_module.render_page(
+            driver,
+            "http://example.com/3",
+            scroll=False,
+            blocked_urls=driver_module.source_blocklist(source),
+        )
+
+    assert timings["blocked"] == 1
+    assert [command for command, _ in driver.commands] == [
+        "Network.enable",
+        "Network.setBlockedURLs",
+        "Network.setBlockedURLs",
+    ]
+    assert driver.commands[1][1]["urls"] == driver_module.BLOCKED_URLS
+    assert driver.commands[2][1]["urls"][-1] == "*widgets.example.com*"
+    assert driver_module.source_blocklist({"block_requests": False}) == []
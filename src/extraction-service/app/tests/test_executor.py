@@ -0,0 +1,41 @@
+import asyncio
+import threading
+import pytest
+from app.core.executor import ScrapeExecutor, JobCancelled, raise_if_cancelled
+
+
+def test_executor_runs_job_off_loop():
+    executor = ScrapeExecutor(max_workers=1)
+
+    async def run():
+        loop_thread = threading.get_ident()
+        job_thread = await executor.run(threading.get_ident, name="thread id")
+        return loop_thread, job_thread
+
+    loop_thread, job_thread = asyncio.run(run())
+    assert loop_thread != job_thread
+    assert executor.jobs == []
+    executor.shutdown()
+
+
+def test_executor_cancels_running_job():
+    executor = ScrapeExecutor(max_workers=1)
+    started = threading.Event()
+
+    def blocking_job():
+        started.set()
+        while True:
+            raise_if_cancelled()
+            threading.Event().wait(0.01)
+
+    async def run():
+        task = asyncio.create_task(executor.run(blocking_job, job_id="job-1"))
+        await asyncio.to_thread(started.wait)
+        assert [job.id for job in executor.jobs] == ["job-1"]
+        assert executor.cancel("job-1")
+        await task
+
+    with pytest.raises(JobCancelled):
+        asyncio.run(run())
+    assert executor.cancel("job-1") is False
+    executor.shutdown()
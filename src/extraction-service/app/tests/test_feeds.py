@@ -0,0 +1,102 @@
+from datetime import date
+import httpx
+from app.core import feeds
+from app.core.scheduler import CrawlScheduler
+
+SOURCE = {"name": "Test Source", "base_url": "http://example.com"}
+
+RSS = """<?xml version="1.0"?>
+<rss version="2.0"><channel>
+  <title>Example</title><link>http://example.com/</link>
+  <image><url>http://example.com/logo.png</url></image>
+  <item><title>New</title><link>http://example.com/new</link>
+    <pubDate>Mon, 03 Jan 2022 10:00:00 +0000</pubDate></item>
+  <item><title>Old</title><link>http://example.com/old</link>
+    <pubDate>Fri, 31 Dec 2021 10:00:00 +0000</pubDate></item>
+</channel></rss>"""
+
+ATOM = """<?xml version="1.0"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <entry><title>Atom</title><link rel="alternate" href="http://example.com/atom"/>
+    <published>2022-01-02T08:00:00Z</published></entry>
+</feed>"""
+
+SITEMAP_INDEX = """<?xml version="1.0"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>http://example.com/sitemap-2022.xml</loc><lastmod>2022-01-03</lastmod></sitemap>
+  <sitemap><loc>http://example.com/sitemap-2020.xml</loc><lastmod>2020-12-31</lastmod></sitemap>
+</sitemapindex>"""
+
+NEWS_SITEMAP = """<?xml version="1.0"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:news="http://www.google.com/schemas/sitemap-news/0.9">
+  <url><loc>http://example.com/news</loc>
+    <news:news><news:publication_date>2022-01-01</news:publication_date>
+    <news:title>News</news:title></news:news></url>
+  <url><loc>http://example.com/undated</loc></url>
+</urlset>"""
+
+DOCUMENTS = {
+    "/rss.xml": RSS,
+    "/atom.xml": ATOM,
+    "/sitemap.xml": SITEMAP_INDEX,
+    "/sitemap-2022.xml": NEWS_SITEMAP,
+}
+
+
+def use_documents(monkeypatch):
+    requested = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requested.append(request.url.path)
+        if request.url.path not in DOCUMENTS:
+            return httpx.Response(404)
+        return httpx.Response(200, text=DOCUMENTS[request.url.path])
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(feeds, "get_sync_client", lambda: client)
+    scheduler = CrawlScheduler(rate=100, burst=100)
+    monkeypatch.setattr(feeds, "get_crawl_scheduler", lambda: scheduler)
+    return requested
+
+
+def collect(feed_url):
+    return [
+        (article.Title, article.Date, str(article.Link))
+        for batch in feeds.iter_feed_articles(
+            SOURCE, feed_url, date(2022, 1, 3), date(2022, 1, 1)
+        )
+        for article in batch
+    ]
+
+
+def test_rss_and_atom_are_filtered_by_date(monkeypatch):
+    use_documents(monkeypatch)
+    assert collect("http://example.com/rss.xml") == [
+        ("New", "2022-01-03", "http://example.com/new")
+    ]
+    assert collect("http://example.com/atom.xml") == [
+        ("Atom", "2022-01-02", "http://example.com/atom")
+    ]
+
+
+def test_sitemap_index_skips_stale_children(monkeypatch):
+    requested = use_documents(monkeypatch)
+    assert collect("http://example.com/sitemap.xml") == [
+        ("News", "2022-01-01", "http://example.com/news")
+    ]
+    assert requested == ["/sitemap.xml", "/sitemap-2022.xml"]
+
+
+def test_entries_are_yielded_after_the_slot_is_released(monkeypatch):
+    use_documents(monkeypatch)
+    scheduler = CrawlScheduler(rate=100, burst=100, concurrency=1)
+    monkeypatch.setattr(feeds, "get_crawl_scheduler", lambda: scheduler)
+
+    entries = feeds.iter_feed_entries("http://example.com/rss.xml")
+    first = next(entries)
+
+    # A SECOND REQUEST TO THE DOMAIN CAN START WHILE THE CONSUMER HOLDS THE FIRST ENTRY
+    assert scheduler._domains["example.com"].in_flight == 0
+    assert first.link == "http://example.com/new"
+    assert [entry.link for entry in entries] == ["http://example.com/old"]
@@ -0,0 +1,145 @@
+import asyncio
+import httpx
+import pytest
+from app.core.executor import JobCancelled
+from app.core.fetcher import ContentFetcher, fetch_articles_content
+from app.core.scheduler import CrawlScheduler
+from app.models import Article
+from app.utils.http_cache import HttpCache
+from app.tests.conftest import create_article
+
+PARAGRAPH = (
+    "This is a paragraph that is definitely longer than fifty characters to be kept."
+)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/blocked":
+        return httpx.Response(403)
+    return httpx.Response(200, html=f"<main><p>{PARAGRAPH}</p></main>")
+
+
+def test_fetch_articles_content_with_fallback(tmp_path):
+    articles = [create_article("/blocked"), create_article("/first")]
+    fallback_batches = []
+
+    def dummy_fallback(batch):
+        fallback_batches.append(batch)
+        return [
+            Article(**article.model_dump(), Paragraphs=["Rendered"])
+            for article in batch
+        ]
+
+    async def run():
+        fetcher = ContentFetcher(
+            concurrency=2,
+            cache=HttpCache(str(tmp_path)),
+            scheduler=CrawlScheduler(rate=100, concurrency=1),
+        )
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return await fetch_articles_content(
+            articles, fallback=dummy_fallback, fetcher=fetcher
+        )
+
+    results = asyncio.run(run())
+    assert [article.Title for article in results] == ["/blocked", "/first"]
+    assert results[0].Paragraphs == ["Rendered"]
+    assert results[1].Paragraphs == [PARAGRAPH]
+    assert [[a.Title for a in batch] for batch in fallback_batches] == [["/blocked"]]
+
+
+def test_fetch_revalidates_stale_cache_entry(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.put(
+        "http://example.com/cached",
+        b"<main>cached</main>",
+        "utf-8",
+        {"etag": '"v1"'},
+    )
+    requests_seen = []
+
+    def not_modified(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request.headers.get("if-none-match"))
+        return httpx.Response(304)
+
+    async def run():
+        fetcher = ContentFetcher(cache=cache)
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(not_modified))
+        fresh = await fetcher.fetch("http://example.com/cached", ttl=3600)
+        stale = await fetcher.fetch("http://example.com/cached", ttl=0)
+        await fetcher.close()
+        return fresh, stale
+
+    fresh, stale = asyncio.run(run())
+    assert fresh == stale == "<main>cached</main>"
+    assert requests_seen == ['"v1"']
+
+
+def test_fetch_skips_non_html_and_oversized_pages(tmp_path):
+    latin_page = f"<main><p>{PARAGRAPH} Café</p></main>".encode("latin-1")
+
+    def pages(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/report.pdf":
+            return httpx.Response(
+                200, content=b"%PDF-1.7", headers={"content-type": "application/pdf"}
+            )
+        if request.url.path == "/live":
+            # STREAMED WITHOUT A CONTENT-LENGTH, SO THE BUDGET IS ENFORCED WHILE READING
+            async def chunks():
+                for _ in range(100):
+                    yield b"<p>" + b"x" * 1024 + b"</p>"
+
+            return httpx.Response(
+                200, content=chunks(), headers={"content-type": "text/html"}
+            )
+        return httpx.Response(
+            200,
+            content=latin_page,
+            headers={"content-type": "text/html; charset=ISO-8859-1"},
+        )
+
+    fallback_batches = []
+
+    def dummy_fallback(batch):
+        fallback_batches.append(batch)
+        return []
+
+    async def run():
+        fetcher = ContentFetcher(
+            cache=HttpCache(str(tmp_path)),
+            sources=[{"base_url": "http://example.com/", "max_content_bytes": 4096}],
+        )
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(pages))
+        return await fetch_articles_content(
+            [
+                create_article("/report.pdf"),
+                create_article("/live"),
+                create_article("/latin"),
+            ],
+            fallback=dummy_fallback,
+            fetcher=fetcher,
+        )
+
+    results = asyncio.run(run())
+    assert [article.Title for article in results] == ["/latin"]
+    assert results[0].Paragraphs == [f"{PARAGRAPH} Café"]
+    assert fallback_batches == []
+
+
+def test_fallback_cancellation_is_raised(tmp_path):
+    def cancelled_fallback(batch):
+        raise JobCancelled()
+
+    async def run():
+        fetcher = ContentFetcher(
+            concurrency=2,
+            cache=HttpCache(str(tmp_path)),
+            scheduler=CrawlScheduler(rate=100, concurrency=1),
+        )
+        fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return await fetch_articles_content(
+            [create_article("/blocked")], fallback=cancelled_fallback, fetcher=fetcher
+        )
+
+    with pytest.raises(JobCancelled):
+        asyncio.run(run())
@@ -0,0 +1,33 @@
+import pytest
+from app.benchmarks.corpus import SOURCE, archive_corpus, article_page
+from app.benchmarks.parsers import extract_archive, extract_article
+from app.utils.html_parser import PARSER_BACKENDS, make_soup
+
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+def test_backend_matches_html_parser(backend):
+    url, html, _ = archive_corpus(days=1, cards=10)[0]
+    assert extract_archive(html, url, backend) == extract_archive(
+        html, url, "html.parser"
+    )
+    html = article_page(paragraphs=10)
+    assert extract_article(html, backend) == extract_article(html, "html.parser")
+
+
+@pytest.mark.parametrize("backend", PARSER_BACKENDS)
+def test_backend_element_interface(backend):
+    soup = make_soup(
+        """
+        <div class="card wide"><div class="card"><h2> Nested <b>title</b> </h2>
+        <script>var ignored = 1;</script><a href="/link">Link</a></div></div>
+        """,
+        backend,
+    )
+    outer = soup.find("div")
+    inner = outer.find("div")
+    assert len(soup.find_all("div", class_="card")) == 2
+    assert inner.find("h2").get_text(strip=True) == "Nestedtitle"
+    assert "ignored" not in outer.get_text()
+    assert inner.find("a").get("href") == "/link"
+    assert inner.find("time") is None
+    assert inner.parent.find("a").get("href") == "/link"
@@ -0,0 +1,43 @@
+from app.utils.http_cache import HttpCache
+
+
+def test_http_cache_roundtrip(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.put(
+        "http://example.com/page",
+        "<p>café</p>".encode("utf-8"),
+        "utf-8",
+        {"etag": '"abc"', "last-modified": "Sun, 02 Jan 2022 10:00:00 GMT"},
+    )
+    entry = HttpCache(str(tmp_path)).get("http://example.com/page")
+    assert entry.text == "<p>café</p>"
+    assert entry.is_fresh(60)
+    assert not entry.is_fresh(0)
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Sun, 02 Jan 2022 10:00:00 GMT",
+    }
+
+
+def test_http_cache_evicts_least_recently_used(tmp_path):
+    cache = HttpCache(str(tmp_path), max_bytes=20)
+    cache.put("http://example.com/a", b"a" * 8)
+    cache.put("http://example.com/b", b"b" * 8)
+    cache.get("http://example.com/a")
+    cache.put("http://example.com/c", b"c" * 8)
+    assert cache.get("http://example.com/a") is not None
+    assert cache.get("http://example.com/b") is None
+    assert cache.get("http://example.com/c") is not None
+
+
+def test_http_cache_write_failures_are_cache_misses(tmp_path, monkeypatch):
+    cache = HttpCache(str(tmp_path))
+    cache.put("http://example.com/a", b"old")
+
+    def failing_write_file(path, data):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(cache, "_write_file", failing_write_file)
+    entry = cache.put("http://example.com/a", b"new")
+    assert entry.body == b"new"
+    assert cache.get("http://example.com/a") is None
@@ -0,0 +1,81 @@
+import asyncio
+import os
+from app.core import known_links
+from app.utils.bloom import BloomFilter
+from app.tests.conftest import create_article
+
+
+def test_bloom_filter_persistence(tmp_path):
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.update(["http://example.com/a", "http://example.com/b"])
+    bloom.save(str(tmp_path / "links.bloom"))
+    loaded = BloomFilter.load(str(tmp_path / "links.bloom"))
+    assert "http://example.com/a" in loaded
+    assert "http://example.com/b" in loaded
+    assert "http://example.com/c" not in loaded
+
+
+def test_filter_known_articles(monkeypatch, tmp_path):
+    registry = known_links.KnownLinks(str(tmp_path / "links.bloom"))
+    registry.add_many(["http://example.com/local", "http://example.com/legacy/"])
+    monkeypatch.setattr(known_links, "_instance", registry)
+    looked_up = []
+
+    async def dummy_get_existing_links(links):
+        looked_up.extend(links)
+        return ["http://example.com/stored", "http://example.com/stored-legacy/"]
+
+    monkeypatch.setattr(known_links, "get_existing_links", dummy_get_existing_links)
+
+    articles = [
+        create_article("/local"),
+        create_article("/stored"),
+        create_article("/legacy"),
+        create_article("/stored-legacy"),
+        create_article("/new"),
+        create_article("/new"),
+    ]
+    new_articles = asyncio.run(known_links.filter_known_articles(articles))
+
+    assert [str(article.Link) for article in new_articles] == ["http://example.com/new"]
+    assert looked_up == [
+        "http://example.com/stored",
+        "http://example.com/stored/",
+        "http://example.com/stored-legacy",
+        "http://example.com/stored-legacy/",
+        "http://example.com/new",
+        "http://example.com/new/",
+    ]
+    assert "http://example.com/stored" in registry
+    assert "http://example.com/stored-legacy" in registry
+
+
+def test_known_links_are_saved_periodically(monkeypatch, tmp_path):
+    path = str(tmp_path / "links.bloom")
+    registry = known_links.KnownLinks(path)
+    monkeypatch.setattr(known_links, "_instance", registry)
+
+    registry.add_many(["http://example.com/a"])
+    assert not os.path.exists(path)
+
+    asyncio.run(known_links.save_known_links())
+    assert "http://example.com/a" in BloomFilter.load(path)
+
+    monkeypatch.setattr(known_links, "KNOWN_LINKS_SAVE_INTERVAL", 0)
+    registry.add_many(["http://example.com/b"])
+    assert "http://example.com/b" in BloomFilter.load(path)
+
+
+def test_corrupted_known_links_file_starts_empty(tmp_path):
+    path = tmp_path / "links.bloom"
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    bloom.update(["http://example.com/a"])
+    bloom.save(str(path))
+    path.write_bytes(path.read_bytes()[:-10])
+    registry = known_links.KnownLinks(str(path))
+    assert "http://example.com/a" not in registry
+
+    path.write_bytes(b"\x00")
+    registry = known_links.KnownLinks(str(path))
+    registry.add_many(["http://example.com/b"])
+    assert "http://example.com/b" in registry
@@ -0,0 +1,49 @@
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+from app.utils import date_formatter, metrics
+
+
+def collect(reader: InMemoryMetricReader) -> dict:
+    points = {}
+    for resource_metrics in reader.get_metrics_data().resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                for point in metric.data.data_points:
+                    key = (metric.name, tuple(sorted(point.attributes.items())))
+                    points[key] = point
+    return points
+
+
+def test_source_label_groups_hosts_of_a_source():
+    assert metrics.source_label("https://www.example.com") == "example.com"
+    assert metrics.source_label("http://example.com/news/1?page=2") == "example.com"
+    assert metrics.source_label(None) == "unknown"
+
+
+def test_date_fallbacks_are_counted_by_source_and_kind(monkeypatch):
+    reader = InMemoryMetricReader()
+    provider = MeterProvider(metric_readers=[reader], views=metrics.VIEWS)
+    monkeypatch.setattr(
+        metrics, "_instance", metrics.ExtractionMetrics(provider.get_meter("test"))
+    )
+    monkeypatch.setattr(date_formatter, "_learned_formats", {})
+    date_formatter._parse_absolute.cache_clear()
+    source = "https://www.example.com"
+
+    date_formatter.format_date_str("22/01/2025", "%d/%m/%Y", source)
+    date_formatter.format_date_str("January 22, 2025", "%d/%m/%Y", source)
+    date_formatter.format_date_str("3 days ago", "%d/%m/%Y", source)
+    date_formatter.format_date_str("not a date", "%d/%m/%Y", source)
+    date_formatter.format_date_str("also not a date", "%d/%m/%Y", source)
+    metrics.get_metrics().record_render(source, {"render": 0.2, "scroll": 1.5})
+
+    points = collect(reader)
+    fallbacks = {
+        dict(attributes)["kind"]: point.value
+        for (name, attributes), point in points.items()
+        if name == "extraction.date.fallbacks"
+    }
+    assert fallbacks == {"alternative": 1, "relative": 1, "failed": 2}
+    render = points[("extraction.page.render.duration", (("source", "example.com"),))]
+    assert render.count == 1
+    assert render.explicit_bounds[0] < 0.2 < render.explicit_bounds[-1]
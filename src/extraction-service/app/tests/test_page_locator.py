@@ -0,0 +1,83 @@
+from datetime import date, timedelta
+from app.core import scraper
+from app.core.page_locator import locate_first_page
+
+NEWEST = date(2022, 6, 30)
+CARDS_PER_PAGE = 10
+PAGES = 300
+
+
+def page_dates(page: int) -> list:
+    # ONE ARTICLE PER DAY, NEWEST FIRST, 'PAGES' PAGES IN TOTAL
+    if not 1 <= page <= PAGES:
+        return []
+    first = (page - 1) * CARDS_PER_PAGE
+    return [NEWEST - timedelta(days=first + i) for i in range(CARDS_PER_PAGE)]
+
+
+def test_locate_first_page_probes_logarithmically():
+    probed = []
+
+    def probe(page):
+        probed.append(page)
+        return min(page_dates(page), default=None)
+
+    assert locate_first_page(probe, NEWEST) == 1
+    assert probed == [1]
+
+    probed.clear()
+    date_base = NEWEST - timedelta(days=1234)
+    assert locate_first_page(probe, date_base) == 124
+    assert len(probed) == len(set(probed)) < 20
+
+    probed.clear()
+    assert locate_first_page(probe, date(2000, 1, 1)) == PAGES + 1
+
+
+def test_paginated_crawl_starts_at_located_page(monkeypatch):
+    source = {
+        "name": "Paged Source",
+        "base_url": "http://example.com",
+        "url": "http://example.com/latest?page={page}",
+        "article_selector": "article",
+        "date_format": "%d/%m/%Y",
+        "button_selector": None,
+    }
+    loads = []
+
+    def dummy_load_cards(source, driver, url, use_cache=False):
+        page = int(url.rsplit("=", 1)[-1])
+        loads.append(page)
+        return [
+            {
+                "title": f"Article {day}",
+                "date": day.strftime("%d/%m/%Y"),
+                "href": f"/article-{day.isoformat()}",
+            }
+            for day in page_dates(page)
+        ]
+
+    monkeypatch.setattr(scraper, "load_cards", dummy_load_cards)
+    crawled = []
+    pages = scraper.iter_crawl_url(
+        source,
+        None,
+        source["url"],
+        NEWEST - timedelta(days=1000),
+        NEWEST - timedelta(days=1029),
+        on_page=crawled.append,
+    )
+    articles = [article for batch in pages for article in batch]
+
+    assert crawled == [101, 102, 103, 104]
+    assert len(articles) == 30
+    assert len(loads) < 30
+    # PROBED PAGES ARE NOT LOADED AGAIN BY THE CRAWL
+    assert len(loads) == len(set(loads))
+
+    loads.clear()
+    pages = scraper.iter_crawl_url(
+        source, None, source["url"], NEWEST, NEWEST - timedelta(days=4)
+    )
+    assert len([article for batch in pages for article in batch]) == 5
+    assert loads == [1]
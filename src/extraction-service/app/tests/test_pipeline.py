@@ -0,0 +1,108 @@
+import asyncio
+from datetime import date
+import pytest
+from app.core import pipeline
+from app.core.executor import JobCancelled, get_scrape_executor, raise_if_cancelled
+from app.core.fetcher import ContentFetcher
+from app.models import Article
+from app.tests.conftest import create_article
+
+
+def test_pipeline_streams_batches_to_storage(monkeypatch):
+    def dummy_scrape_sources_base(
+        sources,
+        date_base,
+        date_cutoff,
+        pool,
+        on_articles,
+        checkpoint=None,
+        incremental=False,
+    ):
+        for page in range(5):
+            on_articles([create_article(page * 3 + i) for i in range(3)])
+        return []
+
+    async def dummy_filter_known_articles(articles):
+        return articles
+
+    async def dummy_fetch_articles_content(articles, fallback, fetcher, on_failed):
+        return [Article(**article.model_dump()) for article in articles]
+
+    posted_batches = []
+
+    async def dummy_post_articles_bulk(articles):
+        posted_batches.append(len(articles))
+        if len(posted_batches) == 1:
+            raise Exception("Storage unavailable")
+        return [{"id": article.id} for article in articles]
+
+    monkeypatch.setattr(pipeline, "scrape_sources_base", dummy_scrape_sources_base)
+    monkeypatch.setattr(pipeline, "filter_known_articles", dummy_filter_known_articles)
+    monkeypatch.setattr(
+        pipeline, "fetch_articles_content", dummy_fetch_articles_content
+    )
+    monkeypatch.setattr(pipeline, "post_articles_bulk", dummy_post_articles_bulk)
+    monkeypatch.setattr(pipeline, "remember_articles", lambda articles: None)
+    monkeypatch.setattr(pipeline, "UPLOAD_BATCH_SIZE", 4)
+    monkeypatch.setattr(pipeline, "UPLOAD_RETRIES", 2)
+    monkeypatch.setattr(pipeline, "UPLOAD_BACKOFF", 0)
+
+    result = asyncio.run(
+        pipeline.run_extraction_pipeline(
+            [{"name": "Test Source"}], date(2022, 1, 3), date(2022, 1, 1)
+        )
+    )
+
+    assert result.discovered == 15
+    assert result.fetched == 15
+    assert result.failed_batches == 0
+    assert len(result.article_ids) == 15
+    assert all(size <= 4 for size in posted_batches)
+
+
+def test_cancelling_the_job_stops_the_content_fallback(monkeypatch):
+    def dummy_scrape_sources_base(
+        sources,
+        date_base,
+        date_cutoff,
+        pool,
+        on_articles,
+        checkpoint=None,
+        incremental=False,
+    ):
+        on_articles([create_article(i) for i in range(3)])
+        return []
+
+    async def dummy_filter_known_articles(articles):
+        return articles
+
+    async def blocked_fetch_article(self, article):
+        return None
+
+    rendered = []
+
+    def dummy_fallback(articles):
+        for article in articles:
+            raise_if_cancelled()
+            rendered.append(article.Title)
+            # THE JOB IS CANCELLED WHILE THE FIRST ARTICLE IS RENDERED
+            get_scrape_executor().cancel("job-1")
+        return []
+
+    monkeypatch.setattr(pipeline, "scrape_sources_base", dummy_scrape_sources_base)
+    monkeypatch.setattr(pipeline, "filter_known_articles", dummy_filter_known_articles)
+    monkeypatch.setattr(ContentFetcher, "fetch_article", blocked_fetch_article)
+    monkeypatch.setattr(pipeline, "scrape_articles_content_selenium", dummy_fallback)
+    monkeypatch.setattr(pipeline, "PIPELINE_CONTENT_WORKERS", 1)
+
+    with pytest.raises(JobCancelled):
+        asyncio.run(
+            pipeline.run_extraction_pipeline(
+                [{"name": "Test Source"}],
+                date(2022, 1, 3),
+                date(2022, 1, 1),
+                job_id="job-1",
+            )
+        )
+    assert rendered == ["Article 0"]
+    assert get_scrape_executor().cancel("job-1") is False
@@ -0,0 +1,74 @@
+import httpx
+from app.core import scraper
+from app.core.render_mode import RenderModes, STATIC, RENDERED, decide_render_mode
+
+SOURCE = {
+    "id": "source-1",
+    "name": "Test Source",
+    "base_url": "http://example.com",
+    "url": "http://example.com/{year}/{month}/{day}",
+    "article_selector": "article",
+}
+
+CARD = '<div class="article"><h2><a href="/a">A</a></h2></div>'
+
+
+def page(cards):
+    return f"<html><body>{CARD * cards}</body></html>"
+
+
+class CountingDriver:
+    def __init__(self, html):
+        self.page_source = html
+        self.loads = 0
+
+    def get(self, url):
+        self.loads += 1
+
+    def execute_script(self, script):
+        return 1000
+
+
+def test_decide_render_mode():
+    assert decide_render_mode(10, 10) == STATIC
+    assert decide_render_mode(0, 10) == RENDERED
+    assert decide_render_mode(5, 10) == RENDERED
+
+
+def test_render_modes_persist(tmp_path):
+    path = str(tmp_path / "modes.json")
+    RenderModes(path).set(SOURCE, STATIC)
+    assert RenderModes(path).get(SOURCE) == STATIC
+    assert RenderModes(path).get({**SOURCE, "render_mode": RENDERED}) == RENDERED
+
+
+def test_load_cards_probes_once_then_skips_browser(monkeypatch, tmp_path):
+    modes = RenderModes(str(tmp_path / "modes.json"))
+    monkeypatch.setattr(scraper, "get_render_modes", lambda: modes)
+    monkeypatch.setattr(
+        scraper,
+        "fetch_static_page",
+        lambda url, headers=None: httpx.Response(200, text=page(3)),
+    )
+    driver = CountingDriver(page(3))
+
+    assert len(scraper.load_cards(SOURCE, driver, "http://example.com/1")) == 3
+    assert driver.loads == 1
+    assert modes.get(SOURCE) == STATIC
+
+    assert len(scraper.load_cards(SOURCE, driver, "http://example.com/2")) == 3
+    assert driver.loads == 1
+
+
+def test_load_cards_detects_rendered_source(monkeypatch, tmp_path):
+    modes = RenderModes(str(tmp_path / "modes.json"))
+    monkeypatch.setattr(scraper, "get_render_modes", lambda: modes)
+    monkeypatch.setattr(
+        scraper,
+        "fetch_static_page",
+        lambda url, headers=None: httpx.Response(200, text=page(0)),
+    )
+    driver = CountingDriver(page(2))
+
+    assert len(scraper.load_cards(SOURCE, driver, "http://example.com/1")) == 2
+    assert modes.get(SOURCE) == RENDERED
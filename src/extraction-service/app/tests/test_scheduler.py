@@ -0,0 +1,60 @@
+import httpx
+from app.core.scheduler import CrawlScheduler, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_limits_rate_per_domain():
+    clock = FakeClock()
+    scheduler = CrawlScheduler(rate=2, burst=2, concurrency=10, clock=clock)
+
+    for _ in range(2):
+        permit, _ = scheduler.try_acquire("http://a.example/1")
+        scheduler.release(permit)
+    permit, delay = scheduler.try_acquire("http://a.example/2")
+    assert permit is None and delay == 0.5
+
+    # OTHER DOMAINS HAVE THEIR OWN BUCKET
+    permit, _ = scheduler.try_acquire("http://b.example/1")
+    assert permit is not None
+
+    clock.now = 0.5
+    permit, _ = scheduler.try_acquire("http://a.example/2")
+    assert permit is not None
+
+
+def test_concurrency_cap_per_domain():
+    scheduler = CrawlScheduler(rate=100, burst=100, concurrency=1, clock=FakeClock())
+    first, _ = scheduler.try_acquire("http://a.example/1")
+    second, _ = scheduler.try_acquire("http://a.example/2")
+    assert first is not None and second is None
+    scheduler.release(first)
+    second, _ = scheduler.try_acquire("http://a.example/2")
+    assert second is not None
+
+
+def test_throttle_response_pauses_domain():
+    clock = FakeClock()
+    scheduler = CrawlScheduler(rate=10, burst=10, concurrency=10, clock=clock)
+    permit, _ = scheduler.try_acquire("http://a.example/1")
+    permit.record(httpx.Response(429, headers={"Retry-After": "30"}))
+    scheduler.release(permit)
+
+    permit, delay = scheduler.try_acquire("http://a.example/2")
+    assert permit is None and delay == 30
+    clock.now = 30.5
+    permit, _ = scheduler.try_acquire("http://a.example/2")
+    assert permit is not None
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("120") == 120
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
@@ -1,7 +1,9 @@
 import pytest
 from datetime import date
 from app.core.scraper import obtain_urls, collect_articles, scrape_articles_base
+from app.core.driver import DriverPool
 from app.models import ArticleBase
+from app.tests.conftest import create_article
 
 
 @pytest.fixture
@@ -26,6 +28,7 @@ def test_obtain_urls(source_config):
     }
     assert urls == expected
 
+
 class DummyDriver:
     def __init__(self, html):
         self.page_source = html
@@ -88,9 +91,9 @@ def test_scrape_articles_base(monkeypatch, source_config):
     def dummy_init_driver():
         return DummyDriver()
 
-    monkeypatch.setattr("app.core.scraper.init_driver", dummy_init_driver)
+    pool = DriverPool(size=2, factory=dummy_init_driver)
 
-    def dummy_collect_articles(source, driver, url, date_base, date_cutoff):
+    def dummy_collect_articles(source, driver, url, date_base, date_cutoff, **kwargs):
         dummy_article = ArticleBase(
             Title="Dummy Article",
             Date="02-01-2022",
@@ -100,7 +103,165 @@ def test_scrape_articles_base(monkeypatch, source_config):
         return ([dummy_article], False)
 
     monkeypatch.setattr("app.core.scraper.collect_articles", dummy_collect_articles)
-    articles = scrape_articles_base(source_config, date(2022, 1, 3), date(2022, 1, 1))
+    articles = scrape_articles_base(
+        source_config, date(2022, 1, 3), date(2022, 1, 1), pool=pool
+    )
     assert isinstance(articles, list)
     assert len(articles) == 2
     assert articles[0].Title == "Dummy Article"
+
+
+def test_collect_articles_reads_cards_in_browser(source_config):
+    class CardsDriver(DummyDriver):
+        def execute_script(self, script, *args):
+            if not args:
+                return 1000
+            assert args == ("article", ["h2", "h3", "h4"], 0)
+            return {
+                "total": 1,
+                "cards": [
+                    {"title": "Dummy Article", "date": "02-01-2022", "href": "/dummy"}
+                ],
+            }
+
+    driver = CardsDriver("<html>unused</html>")
+    articles, older_than_cutoff = collect_articles(
+        {**source_config, "card_extraction": "browser"},
+        driver,
+        "http://example.com/2022/01/02",
+        date(2022, 1, 3),
+        date(2022, 1, 1),
+    )
+    assert [str(article.Link) for article in articles] == ["http://example.com/dummy"]
+    assert articles[0].Title == "Dummy Article"
+    assert older_than_cutoff is False
+
+
+def test_iter_crawl_url_load_more_processes_new_cards_only(monkeypatch, source_config):
+    from app.core import scraper
+    from app.core.driver import _COUNT_CARDS_SCRIPT
+
+    def card(day):
+        return (
+            f'<div class="article"><h2>Article {day}</h2>'
+            f'<time>{day:02d}-01-2022</time><a href="/article-{day}">Link</a></div>'
+        )
+
+    class LoadMoreDriver(DummyDriver):
+        def __init__(self):
+            self.days = [9, 8]
+            self.loads = 0
+
+        @property
+        def page_source(self):
+            return "".join(card(day) for day in self.days)
+
+        def get(self, url):
+            self.loads += 1
+
+        def execute_script(self, script, *args):
+            if script == _COUNT_CARDS_SCRIPT:
+                return len(self.days)
+            return 1000
+
+        def find_element(self, by, value):
+            return self
+
+        def is_displayed(self):
+            return True
+
+        def is_enabled(self):
+            return True
+
+        def click(self):
+            self.days += [self.days[-1] - 1, self.days[-1] - 2]
+
+    read = []
+    original = scraper.read_loaded_cards
+
+    def recording_read(source, driver, start=0):
+        total, cards = original(source, driver, start)
+        read.append(len(cards))
+        return total, cards
+
+    monkeypatch.setattr(scraper, "read_loaded_cards", recording_read)
+    driver = LoadMoreDriver()
+    source = {
+        **source_config,
+        "url": "http://example.com/news",
+        "button_selector": "more",
+    }
+    batches = list(
+        scraper.iter_crawl_url(
+            source, driver, source["url"], date(2022, 1, 8), date(2022, 1, 5)
+        )
+    )
+
+    assert driver.loads == 1
+    assert read == [2, 2, 2]
+    assert [[article.Title for article in batch] for batch in batches] == [
+        ["Article 8"],
+        ["Article 7", "Article 6"],
+        ["Article 5"],
+    ]
+
+
+def test_load_page_revalidates_rendered_page_with_head(
+    monkeypatch, tmp_path, source_config
+):
+    import httpx
+    from app.core import scraper
+    from app.utils.http_cache import HttpCache
+
+    cache = HttpCache(str(tmp_path))
+    rendered, requests = [], []
+
+    def dummy_fetch_static_page(url, headers=None, method="GET"):
+        requests.append((method, headers))
+        if headers and headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, headers={"ETag": '"v1"'})
+
+    def dummy_render_archive_page(source, driver, url):
+        rendered.append(url)
+
+    monkeypatch.setattr(scraper, "get_http_cache", lambda: cache)
+    monkeypatch.setattr(scraper, "fetch_static_page", dummy_fetch_static_page)
+    monkeypatch.setattr(scraper, "render_archive_page", dummy_render_archive_page)
+    driver = DummyDriver(create_dummy_article_html())
+    url = "http://example.com/2022/01/02"
+
+    html = scraper.load_page(source_config, driver, url, use_cache=True)
+    assert scraper.load_page(source_config, driver, url, use_cache=True) == html
+    assert requests == [("HEAD", None)]
+
+    # ONCE THE COPY EXPIRES, THE VALIDATORS OF THE HEAD REQUEST REVALIDATE IT
+    expired = {**source_config, "cache_ttl": 0}
+    assert scraper.load_page(expired, driver, url, use_cache=True) == html
+    assert requests[-1] == ("HEAD", {"If-None-Match": '"v1"'})
+    assert rendered == [url]
+
+
+def test_scrape_articles_content_requests_uses_shared_client(monkeypatch):
+    import httpx
+    from app.core import scraper
+    from app.core.scheduler import CrawlScheduler
+
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if request.url.path == "/image":
+            return httpx.Response(200, headers={"content-type": "image/png"})
+        return httpx.Response(200, html=create_dummy_article_html())
+
+    client = httpx.Client(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(scraper, "get_sync_client", lambda: client)
+    scheduler = CrawlScheduler(rate=100, burst=100)
+    monkeypatch.setattr(scraper, "get_crawl_scheduler", lambda: scheduler)
+    articles = [create_article("/article"), create_article("/image")]
+
+    results = scraper.scrape_articles_content_requests(articles)
+
+    assert [article.Title for article in results] == ["/article"]
+    assert not any("authorization" in request.headers for request in requests)
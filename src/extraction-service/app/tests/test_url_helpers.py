@@ -0,0 +1,49 @@
+from app.utils.url_helpers import (
+    canonical_link,
+    is_valid_url,
+    legacy_links,
+    normalize_url,
+)
+
+
+def test_normalize_url_canonicalizes_equivalent_links():
+    canonical = "https://news.example.com/2022/01/10/story?id=7"
+    for url in (
+        "https://news.example.com/2022/01/10/story?id=7",
+        "HTTPS://News.Example.COM:443/2022/01/10/story/?id=7#comments",
+        "https://news.example.com/2022/01/10/story?utm_source=x&id=7&fbclid=abc",
+        "https://news.example.com./2022/01/10/story?id=7&UTM_MEDIUM=social",
+    ):
+        assert normalize_url(url) == canonical
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url("http://example.com:8080/a/") == "http://example.com:8080/a"
+    assert normalize_url("http://[::1]/") == "http://[::1]/"
+    assert normalize_url("HTTP://[0:0::1]:8080/a/") == "http://[::1]:8080/a"
+
+
+def test_legacy_links_restore_trailing_slashes():
+    assert legacy_links("http://example.com/a?id=7") == ["http://example.com/a/?id=7"]
+    assert legacy_links("http://example.com/") == ["http://example.com"]
+
+
+def test_normalize_url_rejects_invalid_links():
+    for url in (
+        "mailto:desk@example.com",
+        "javascript:void(0)",
+        "ftp://example.com/file",
+        "http:///path",
+        "http://exa mple.com/",
+        "http://example.com:99999/",
+        "http://[::g]/",
+        "",
+    ):
+        assert normalize_url(url) is None
+        assert not is_valid_url(url)
+
+
+def test_canonical_link_resolves_relative_links():
+    base = "http://example.com/section/"
+    assert canonical_link(base, "/a/?utm_campaign=x") == "http://example.com/a"
+    assert canonical_link(base, "b#top") == "http://example.com/section/b"
+    assert canonical_link(base, "www.other.com/c") == "http://www.other.com/c"
+    assert canonical_link(base, "#") == "http://example.com/section"
@@ -0,0 +1,49 @@
+from datetime import date
+from app.core.watermark import Watermark, WatermarkTracker
+from app.tests.conftest import create_article
+
+
+def test_watermark_from_source():
+    assert Watermark.from_source({"name": "Test Source"}) is None
+    watermark = Watermark.from_source(
+        {"last_article_date": "2022-01-02", "last_article_link": "http://x/1"}
+    )
+    assert watermark.date == date(2022, 1, 2)
+    assert watermark.link == "http://x/1"
+
+
+def test_watermark_cut_stops_at_newest_seen_link():
+    watermark = Watermark(date(2022, 1, 2), "http://example.com/article-2")
+    page = [create_article(i, 2) for i in range(4)]
+    articles, reached = watermark.cut(page)
+    assert [article.Title for article in articles] == ["Article 0", "Article 1"]
+    assert reached
+
+
+def test_watermark_cut_stops_at_older_articles():
+    watermark = Watermark(date(2022, 1, 2), "http://example.com/unseen")
+    page = [create_article(0, 3), create_article(1, 2), create_article(2, 1)]
+    articles, reached = watermark.cut(page)
+    assert len(articles) == 2 and reached
+    articles, reached = watermark.cut(page[:2])
+    assert len(articles) == 2 and not reached
+
+
+def test_watermark_tracker_holds_marks_before_failed_articles():
+    source = {"id": "source-1", "base_url": "http://example.com/"}
+    tracker = WatermarkTracker([source])
+    tracker.observe([create_article(5, 5), create_article(3, 3), create_article(2, 2)])
+    assert tracker.marks() == {
+        "http://example.com": ("2022-01-05", "http://example.com/article-5")
+    }
+
+    # ANOTHER WORK UNIT OF THE JOB FAILED TO STORE AN ARTICLE OF THE 4TH
+    other = WatermarkTracker([source])
+    other.fail([create_article(4, 4)])
+    merged = WatermarkTracker.from_exports(tracker.export() + other.export())
+    assert merged.marks() == {
+        "http://example.com": ("2022-01-03", "http://example.com/article-3")
+    }
+
+    merged.fail([create_article(1, 2)])
+    assert merged.marks() == {}
@@ -0,0 +1,211 @@
+import asyncio
+from datetime import date, timedelta
+from app.core import dedup, pipeline, work_units
+from app.core.dedup import simhash
+from app.core.watermark import WatermarkTracker
+from app.models import Article
+from app.tests.conftest import create_article
+
+
+def test_work_units_complete_job_once(monkeypatch):
+    source = {"name": "Test Source", "base_url": "http://example.com"}
+    monkeypatch.setattr(
+        work_units,
+        "plan_crawl_jobs",
+        lambda sources, date_base, date_cutoff, incremental: [
+            (source, f"http://example.com/archive/{day}", date_cutoff, None)
+            for day in range(3)
+        ],
+    )
+
+    def dummy_crawl_job(source, url, date_base, cutoff, watermark, pool, on_articles):
+        day = int(url.rsplit("/", 1)[-1])
+        for page in range(2):
+            on_articles([create_article(day * 10 + page * 2 + i) for i in range(2)])
+        return []
+
+    async def dummy_run_content_unit(unit, watermarks):
+        return [article["Link"] for article in unit["articles"]]
+
+    # IN-MEMORY STAND-IN FOR THE JOB DOCUMENT OF THE STORAGE SERVICE
+    units, done, stored = set(), set(), []
+
+    async def dummy_register_work_units(job_id, unit_ids):
+        units.update(unit_ids)
+
+    async def dummy_complete_work_unit(job_id, unit_id, article_ids, watermarks):
+        if unit_id in done:
+            return {"completed": False}
+        done.add(unit_id)
+        stored.extend(article_ids)
+        return {"completed": units == done, "article_ids": list(stored)}
+
+    monkeypatch.setattr(work_units, "crawl_job", dummy_crawl_job)
+    monkeypatch.setattr(work_units, "run_content_unit", dummy_run_content_unit)
+    monkeypatch.setattr(work_units, "register_work_units", dummy_register_work_units)
+    monkeypatch.setattr(work_units, "complete_work_unit", dummy_complete_work_unit)
+
+    queue, completions = [], []
+
+    async def publish(message, routing_key):
+        if routing_key == work_units.WORK_UNIT_ROUTING_KEY:
+            queue.append(message)
+        else:
+            completions.append(message)
+
+    async def run():
+        discovery = work_units.plan_discovery_units(
+            "job-1", [source], date(2022, 1, 3), date(2022, 1, 1)
+        )
+        await work_units.publish_work_units("job-1", discovery, publish)
+        # UNITS ARE PROCESSED OUT OF ORDER, AS BY SEVERAL REPLICAS
+        while queue:
+            await work_units.run_work_unit(queue.pop(), publish)
+            assert not completions or not queue
+
+    asyncio.run(run())
+
+    assert len(units) == 3 + 6
+    assert units == done
+    assert len(completions) == 1
+    assert completions[0]["correlation_id"] == "job-1"
+    assert completions[0]["article_count"] == 12
+
+
+def test_failed_publishes_are_redelivered(monkeypatch):
+    source = {
+        "name": "Test Source",
+        "base_url": "http://example.com",
+        "url": "http://example.com/archive",
+    }
+
+    def dummy_crawl_job(source, url, date_base, cutoff, watermark, pool, on_articles):
+        on_articles([create_article(0)])
+        return []
+
+    async def dummy_run_content_unit(unit, watermarks):
+        return ["id-0"]
+
+    units, done, announced = set(), set(), []
+
+    async def dummy_register_work_units(job_id, unit_ids):
+        units.update(unit_ids)
+
+    async def dummy_complete_work_unit(job_id, unit_id, article_ids, watermarks):
+        done.add(unit_id)
+        return {"completed": units == done and not announced, "article_ids": ["id-0"]}
+
+    async def dummy_announce_job_completion(job_id):
+        announced.append(job_id)
+
+    monkeypatch.setattr(work_units, "crawl_job", dummy_crawl_job)
+    monkeypatch.setattr(work_units, "run_content_unit", dummy_run_content_unit)
+    monkeypatch.setattr(work_units, "register_work_units", dummy_register_work_units)
+    monkeypatch.setattr(work_units, "complete_work_unit", dummy_complete_work_unit)
+    monkeypatch.setattr(
+        work_units, "announce_job_completion", dummy_announce_job_completion
+    )
+
+    queue, completions, failures = [], [], {"extraction.unit": 1, "completion": 1}
+
+    async def publish(message, routing_key):
+        if failures.get(routing_key):
+            failures[routing_key] -= 1
+            raise ConnectionError("Broker unavailable")
+        if routing_key == work_units.WORK_UNIT_ROUTING_KEY:
+            queue.append(message)
+        else:
+            completions.append(message)
+
+    async def run_until_acked(unit):
+        # A UNIT THAT RAISES IS NACKED AND REDELIVERED
+        while True:
+            try:
+                return await work_units.run_work_unit(unit, publish)
+            except Exception:
+                pass
+
+    async def run():
+        discovery = work_units.plan_discovery_units(
+            "job-1", [source], date(2022, 1, 3), date(2022, 1, 2)
+        )
+        units.update(unit["unit_id"] for unit in discovery)
+        await run_until_acked(discovery[0])
+        assert len(queue) == 1
+        await run_until_acked(queue.pop())
+
+    asyncio.run(run())
+
+    assert units == done
+    assert len(completions) == 1
+    assert announced == ["job-1"]
+
+
+def test_content_unit_deduplicates_against_stored_articles(monkeypatch):
+    story = [
+        f"Paragraph {i} of a wire story that is long enough to be fingerprinted by the index."
+        for i in range(8)
+    ]
+    lookups, posted, aliases = [], [], []
+
+    async def dummy_get_article_fingerprints(date_from, date_to):
+        lookups.append((date_from, date_to))
+        return [{"id": "stored-1", "Fingerprint": format(simhash(story), "016x")}]
+
+    async def dummy_filter_known_articles(articles):
+        return articles
+
+    async def dummy_fetch_articles_content(articles, fallback, fetcher, on_failed):
+        return [
+            Article(
+                **article.model_dump(),
+                Paragraphs=story if article.Title == "/copy" else ["Unique."],
+            )
+            for article in articles
+        ]
+
+    async def dummy_post_articles_bulk(articles):
+        posted.extend(articles)
+        return [{"id": article.id} for article in articles]
+
+    async def dummy_post_article_aliases(batch):
+        aliases.extend(batch)
+
+    monkeypatch.setattr(
+        dedup, "get_article_fingerprints", dummy_get_article_fingerprints
+    )
+    monkeypatch.setattr(
+        work_units, "filter_known_articles", dummy_filter_known_articles
+    )
+    monkeypatch.setattr(
+        work_units, "fetch_articles_content", dummy_fetch_articles_content
+    )
+    monkeypatch.setattr(pipeline, "post_articles_bulk", dummy_post_articles_bulk)
+    monkeypatch.setattr(pipeline, "post_article_aliases", dummy_post_article_aliases)
+    monkeypatch.setattr(pipeline, "remember_articles", lambda articles: None)
+
+    source = {"name": "Test Source", "base_url": "http://example.com"}
+    unit = {
+        "job_id": "job-1",
+        "unit_id": "unit-1",
+        "kind": work_units.CONTENT,
+        "source": source,
+        "articles": [
+            create_article("/copy", day=3).model_dump(mode="json"),
+            create_article("/other", day=5).model_dump(mode="json"),
+        ],
+    }
+    article_ids = asyncio.run(
+        work_units.run_content_unit(unit, WatermarkTracker([source]))
+    )
+
+    window = timedelta(days=dedup.DEDUP_WINDOW_DAYS)
+    assert lookups == [
+        (
+            (date(2022, 1, 3) - window).isoformat(),
+            (date(2022, 1, 5) + window).isoformat(),
+        )
+    ]
+    assert [article.Title for article in posted] == ["/other"]
+    assert article_ids == [posted[0].id]
+    assert [alias.CanonicalId for alias in aliases] == ["stored-1"]
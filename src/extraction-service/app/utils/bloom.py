@@ -0,0 +1,85 @@
+import hashlib
+import math
+import os
+import struct
+import threading
+from typing import Iterable
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    The bit array is sized for 'capacity' items at the target false positive rate, and the
+    k bit positions of an item are derived from a single BLAKE2b digest by double hashing.
+    A negative answer is always exact; a positive answer is wrong with probability close to
+    'error_rate' while fewer than 'capacity' items have been added.
+
+    Args:
+        capacity (int): Expected number of items.
+        error_rate (float): Target false positive rate.
+    """
+
+    _HEADER = struct.Struct(">QI")
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.num_bits = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self._bits = bytearray(math.ceil(self.num_bits / 8))
+        self._lock = threading.Lock()
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str):
+        with self._lock:
+            for position in self._positions(item):
+                self._bits[position >> 3] |= 1 << (position & 7)
+
+    def update(self, items: Iterable[str]):
+        for item in items:
+            self.add(item)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def save(self, path: str):
+        """Atomically writes the filter to a file."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with self._lock:
+            with open(tmp_path, "wb") as bloom_file:
+                bloom_file.write(self._HEADER.pack(self.num_bits, self.num_hashes))
+                bloom_file.write(self._bits)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "BloomFilter":
+        """
+        Reads a filter previously written with 'save'.
+
+        Raises:
+            OSError: If the file can't be read.
+            struct.error: If the file is shorter than its header.
+            ValueError: If the bit array doesn't match the size in the header.
+        """
+        with open(path, "rb") as bloom_file:
+            num_bits, num_hashes = cls._HEADER.unpack(bloom_file.read(cls._HEADER.size))
+            bits = bloom_file.read()
+        if len(bits) != math.ceil(num_bits / 8) or not num_bits or not num_hashes:
+            raise ValueError(f"Truncated or corrupted Bloom filter file {path}")
+        bloom = cls.__new__(cls)
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom._bits = bytearray(bits)
+        bloom._lock = threading.Lock()
+        return bloom
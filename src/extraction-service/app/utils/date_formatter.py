@@ -1,102 +1,291 @@
+import os
 import re
-import locale
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Optional
 from app.utils.logger import DefaultLogger
+from app.utils.metrics import get_metrics
 
+DATE_MEMO_SIZE = int(os.getenv("DATE_MEMO_SIZE", "4096"))
 
-def format_date_str(text_date: str, format: str) -> datetime.date:
+ALTERNATIVE_FORMATS = (
+    "%d/%m/%Y",  # 22/1/2025
+    "%m/%d/%Y",  # 1/22/2025
+    "%d-%m-%Y",  # 22-1-2025
+    "%m-%d-%Y",  # 1-22-2025
+    "%Y-%m-%d",  # 2025-1-22
+    "%Y/%m/%d",  # 2025/1/22
+    "%d %b %Y",  # 22 Jan 2025
+    "%d de %B de %Y",  # 22 de enero de 2025
+    "%B %d, %Y",  # January 22, 2025
+)
+
+# ENGLISH AND SPANISH NAMES, FULL AND ABBREVIATED
+_MONTH_NAMES = (
+    ("january", "jan", "enero", "ene"),
+    ("february", "feb", "febrero"),
+    ("march", "mar", "marzo"),
+    ("april", "apr", "abril", "abr"),
+    ("may", "mayo"),
+    ("june", "jun", "junio"),
+    ("july", "jul", "julio"),
+    ("august", "aug", "agosto", "ago"),
+    ("september", "sep", "sept", "septiembre", "setiembre"),
+    ("october", "oct", "octubre"),
+    ("november", "nov", "noviembre"),
+    ("december", "dec", "diciembre", "dic"),
+)
+_WEEKDAY_NAMES = (
+    ("monday", "mon", "lunes", "lun"),
+    ("tuesday", "tue", "tues", "martes", "mar"),
+    ("wednesday", "wed", "miércoles", "miercoles", "mié", "mie"),
+    ("thursday", "thu", "thurs", "jueves", "jue"),
+    ("friday", "fri", "viernes", "vie"),
+    ("saturday", "sat", "sábado", "sabado", "sáb", "sab"),
+    ("sunday", "sun", "domingo", "dom"),
+)
+
+MONTHS = {
+    name: number for number, names in enumerate(_MONTH_NAMES, start=1) for name in names
+}
+
+
+def _alternation(names) -> str:
+    return "|".join(sorted(set(names), key=len, reverse=True))
+
+
+_MONTH_PATTERN = rf"(?P<month_name>{_alternation(MONTHS)})\.?"
+_WEEKDAY_PATTERN = (
+    rf"(?:{_alternation(name for names in _WEEKDAY_NAMES for name in names)})\.?"
+)
+
+_DIRECTIVES = {
+    "d": r"(?P<day>\d{1,2})",
+    "m": r"(?P<month>\d{1,2})",
+    "Y": r"(?P<year>\d{4})",
+    "y": r"(?P<short_year>\d{2})",
+    "b": _MONTH_PATTERN,
+    "B": _MONTH_PATTERN,
+    "a": _WEEKDAY_PATTERN,
+    "A": _WEEKDAY_PATTERN,
+    "H": r"\d{1,2}",
+    "I": r"\d{1,2}",
+    "M": r"\d{1,2}",
+    "S": r"\d{1,2}",
+    "f": r"\d{1,6}",
+    "p": r"[ap]\.?\s?m\.?",
+    "z": r"(?:z|[+-]\d{2}:?\d{2})",
+    "%": "%",
+}
+
+_LEADING_WORDS = re.compile(r"^(updated|published)\s+", re.IGNORECASE)
+_RELATIVE_EN = re.compile(r"(\d+)\s+(minute|hour|day)s?\s+ago", re.IGNORECASE)
+_RELATIVE_ES = re.compile(r"hace\s+(\d+)\s+(minuto|hora|d[ií]a)s?", re.IGNORECASE)
+_RELATIVE_DELTAS = {
+    "minute": timedelta(minutes=1),
+    "minuto": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "hora": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "dia": timedelta(days=1),
+}
+
+# LAST FORMAT THAT PARSED AN UNAMBIGUOUS DATE OF EACH SOURCE, WRITTEN FROM SEVERAL CRAWL THREADS
+_learned_formats: dict[str, str] = {}
+_learned_formats_lock = threading.Lock()
+
+
+class DateFormat:
     """
-    Formats a text date string into a datetime.date object using the specified format.
+    A strptime format compiled to a locale-independent regular expression.
 
-    The function attempts to parse the given date string by first removing any leading words such as
-    'updated', 'published' or blank space, then trying specific locales and common date formats. If relative date formats
-    (e.g., '2 days ago') are detected, they are processed accordingly. In case of failure, a warning is logged
-    and the current date is returned as a fallback.
+    Month and weekday names are matched against built-in English and Spanish tables, so parsing
+    never depends on (or changes) the process locale. Formats using directives without a
+    regex translation are parsed with 'datetime.strptime' in the default locale instead.
 
     Args:
-        text_date (str): The date string to be formatted.
-        format (str): The expected date format for parsing the date string.
-
-    Returns:
-        datetime.date: The formatted date object.
+        format (str): The strptime format.
     """
-    # REMOVE UPTADED OR PUBLISHED OR BLANK STARTING TEXT
-    text_date = re.sub(
-        r"^(updated|published)\s+", "", text_date, flags=re.IGNORECASE
-    ).strip()
 
-    # 1. TEST SPECIFIC FORMAT IN ENG/ESP
-    for loc in ["en_US.UTF-8", "es_ES.UTF-8"]:
+    def __init__(self, format: str):
+        self.format = format
+        self.pattern = self._compile(format)
+
+    @staticmethod
+    def _compile(format: str) -> Optional[re.Pattern]:
+        parts = []
+        for token in re.split(r"(%.)", format):
+            if token.startswith("%") and len(token) == 2:
+                if token[1] not in _DIRECTIVES:
+                    return None
+                parts.append(_DIRECTIVES[token[1]])
+            elif token:
+                parts.append(
+                    "".join(
+                        r"\s+" if chunk.isspace() else re.escape(chunk)
+                        for chunk in re.split(r"(\s+)", token)
+                        if chunk
+                    )
+                )
         try:
-            locale.setlocale(locale.LC_TIME, loc)
-            parsed_date = datetime.strptime(text_date, format).date()
+            return re.compile("".join(parts), re.IGNORECASE)
+        except re.error:
+            # REPEATED DIRECTIVES
+            return None
 
-            if parsed_date.year == 1900:
-                parsed_date = parsed_date.replace(year=datetime.now().year)
+    def parse(self, text: str) -> Optional[tuple]:
+        """
+        Parses a date string.
+
+        Returns:
+            Optional[tuple]: (year, month, day), with year None when the format has no year,
+            or None if the string does not match the format.
+        """
+        if self.pattern is None:
+            try:
+                parsed = datetime.strptime(text, self.format)
+            except ValueError:
+                return None
+            return (
+                (parsed.year if parsed.year != 1900 else None),
+                parsed.month,
+                parsed.day,
+            )
+
+        match = self.pattern.fullmatch(text)
+        if match is None:
+            return None
+        fields = match.groupdict()
+
+        year = fields.get("year")
+        if year is not None:
+            year = int(year)
+        elif fields.get("short_year") is not None:
+            year = int(fields["short_year"])
+            year += 2000 if year < 69 else 1900
+
+        if fields.get("month_name") is not None:
+            month = MONTHS[fields["month_name"].lower()]
+        elif fields.get("month") is not None:
+            month = int(fields["month"])
+        else:
+            month = 1
+        day = int(fields["day"]) if fields.get("day") is not None else 1
 
-            return parsed_date
-        except (ValueError, locale.Error):
-            continue
-
-    # 2. TEST COMMON FORMATS
-    formats_alternative = [
-        "%d/%m/%Y",  # 22/1/2025
-        "%m/%d/%Y",  # 1/22/2025
-        "%d-%m-%Y",  # 22-1-2025
-        "%m-%d-%Y",  # 1-22-2025
-        "%Y-%m-%d",  # 2025-1-22
-        "%Y/%m/%d",  # 2025/1/22
-        "%d %b %Y",  # 22 Jan 2025
-        "%d de %B de %Y",  # 22 de enero de 2025
-        "%B %d, %Y",  # January 22, 2025
-    ]
-
-    for fmt in formats_alternative:
         try:
-            return datetime.strptime(text_date, fmt).date()
+            # LEAP YEAR PLACEHOLDER SO 29 FEBRUARY IS ACCEPTED WITHOUT A YEAR
+            date(year or 2000, month, day)
         except ValueError:
-            continue
+            return None
+        return year, month, day
 
-    # 3. TEST RELATIVE FORMATS
-    if any(keyword in text_date.lower() for keyword in ["ago", "hace"]):
-        try:
-            matches = None
-            # ENG/ESP
-            if "ago" in text_date.lower():
-                matches = re.search(
-                    r"(\d+)\s+(minute|hour|day)s?\s+ago", text_date, re.IGNORECASE
-                )
-            else:
-                matches = re.search(
-                    r"hace\s+(\d+)\s+(minuto|hora|d[ií]a)s?", text_date, re.IGNORECASE
+
+@lru_cache(maxsize=None)
+def compile_date_format(format: str) -> DateFormat:
+    """Returns the compiled DateFormat of a strptime format."""
+    return DateFormat(format)
+
+
+@lru_cache(maxsize=DATE_MEMO_SIZE)
+def _parse_absolute(text_date: str, formats: tuple) -> Optional[tuple]:
+    for index, format in enumerate(formats):
+        parsed = compile_date_format(format).parse(text_date)
+        if parsed is not None:
+            # AMBIGUOUS IF A LATER FORMAT READS A DIFFERENT DATE, E.G. 03/04/2025 AS D/M OR M/D
+            ambiguous = any(
+                other not in (None, parsed)
+                for other in (
+                    compile_date_format(fmt).parse(text_date)
+                    for fmt in formats[index + 1 :]
                 )
+            )
+            return (*parsed, format, ambiguous)
+    return None
+
+
+def _parse_relative(text_date: str) -> Optional[date]:
+    lowered = text_date.lower()
+    if "ago" in lowered:
+        matches = _RELATIVE_EN.search(text_date)
+    elif "hace" in lowered:
+        matches = _RELATIVE_ES.search(text_date)
+    else:
+        return None
+    if not matches:
+        return None
+
+    unit = matches.group(2).lower().replace("í", "i")
+    return (datetime.now() - _RELATIVE_DELTAS[unit] * int(matches.group(1))).date()
+
+
+def format_date_str(
+    text_date: str, format: str, source: Optional[str] = None
+) -> datetime.date:
+    """
+    Formats a text date string into a datetime.date object using the specified format.
+
+    The function attempts to parse the given date string by first removing any leading words such as
+    'updated', 'published' or blank space, then trying the given format and common date formats with
+    English and Spanish month names. If relative date formats (e.g., '2 days ago') are detected, they
+    are processed accordingly. In case of failure, a warning is logged and the current date is
+    returned as a fallback.
 
-            if matches:
-                n = int(matches.group(1))
-                unit = matches.group(2).lower().replace("í", "i").replace("á", "a")
+    The format that parses an unambiguous date of a source is remembered and tried right after the
+    given format for the following dates of the same source, so a source known to write month/day
+    dates keeps that order for ambiguous ones. Ambiguous dates never teach a format and, without a
+    learned format, are read in the order of ALTERNATIVE_FORMATS. Absolute results are memoized
+    per date string.
+    Dates not parsed with the given format are counted by the 'extraction.date.fallbacks' metric.
 
-                delta_mapping = {
-                    "minute": timedelta(minutes=1),
-                    "minuto": timedelta(minutes=1),
-                    "hour": timedelta(hours=1),
-                    "hora": timedelta(hours=1),
-                    "day": timedelta(days=1),
-                    "dia": timedelta(days=1),
-                }
+    Args:
+        text_date (str): The date string to be formatted.
+        format (str): The expected date format for parsing the date string.
+        source (Optional[str]): Key of the source the date belongs to, used to learn its format.
 
-                if unit in delta_mapping:
-                    delta = delta_mapping[unit] * n
-                    return (datetime.now() - delta).date()
+    Returns:
+        datetime.date: The formatted date object.
+    """
+    # REMOVE UPTADED OR PUBLISHED OR BLANK STARTING TEXT
+    text_date = _LEADING_WORDS.sub("", text_date).strip()
 
-        except Exception as e:
-            DefaultLogger().get_logger().error(f"Error processing relative date: {e}")
+    # 1. TEST SPECIFIC FORMAT, LEARNED FORMAT AND COMMON FORMATS
+    with _learned_formats_lock:
+        learned_format = _learned_formats.get(source)
+    formats = tuple(
+        dict.fromkeys(
+            fmt for fmt in (format, learned_format, *ALTERNATIVE_FORMATS) if fmt
+        )
+    )
+    parsed = _parse_absolute(text_date, formats)
+    if parsed is not None:
+        year, month, day, matched_format, ambiguous = parsed
+        if source is not None and not ambiguous:
+            with _learned_formats_lock:
+                _learned_formats[source] = matched_format
+        try:
+            parsed_date = date(year or datetime.now().year, month, day)
+        except ValueError:
+            pass
+        else:
+            if matched_format != format:
+                get_metrics().record_date_fallback(source, "alternative")
+            return parsed_date
+
+    # 2. TEST RELATIVE FORMATS
+    relative_date = _parse_relative(text_date)
+    if relative_date is not None:
+        get_metrics().record_date_fallback(source, "relative")
+        return relative_date
 
-    # 4. FALLBACK
+    # 3. FALLBACK
+    get_metrics().record_date_fallback(source, "failed")
     DefaultLogger().get_logger().warning(
         f"Date not parsed: {text_date}. Format given {format}. Using fallback"
     )
     return datetime.today().date()
 
+
 def secure_date_range(date_base_str: str, date_cutoff_str: str):
     """
     Adjusts the date range provided in string format.
@@ -115,4 +304,4 @@ def secure_date_range(date_base_str: str, date_cutoff_str: str):
     date_cutoff = format_date_str(date_cutoff_str, "%d-%m-%Y")
     if date_base == date_cutoff:
         date_cutoff = date_base - timedelta(days=1)
-    return date_base, date_cutoff
\ No newline at end of file
+    return date_base, date_cutoff
@@ -0,0 +1,151 @@
+import codecs
+import os
+import re
+from typing import Optional
+from bs4 import BeautifulSoup, FeatureNotFound
+from app.utils.logger import DefaultLogger
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+HTML_PARSER = os.getenv("HTML_PARSER", "html.parser")
+PARSER_BACKENDS = ("html.parser", "lxml", "selectolax")
+
+# BeautifulSoup leaves the text of these elements out of get_text()
+_NON_TEXT_TAGS = ("script", "style", "template")
+
+# HTML REQUIRES THE <meta charset> DECLARATION WITHIN THE FIRST 1024 BYTES
+_META_CHARSET = re.compile(
+    rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE
+)
+_META_PRESCAN_BYTES = 1024
+
+
+def declared_encoding(body: bytes, encoding: Optional[str] = None) -> str:
+    """
+    Returns the encoding of an HTML body without any statistical charset detection.
+
+    The charset of the Content-Type header wins, then a <meta> declaration at the top of the
+    document, and UTF-8 otherwise.
+
+    Args:
+        body (bytes): The HTML document.
+        encoding (Optional[str]): Charset declared by the Content-Type header, if any.
+    """
+    candidates = [encoding]
+    match = _META_CHARSET.search(body[:_META_PRESCAN_BYTES])
+    if match:
+        candidates.append(match.group(1).decode("ascii"))
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            return codecs.lookup(candidate).name
+        except LookupError:
+            continue
+    return "utf-8"
+
+
+class SelectolaxElement:
+    """
+    Wraps a selectolax node behind the subset of the BeautifulSoup Tag interface used by the
+    article processing functions: 'find', 'find_all', 'get', 'get_text' and 'parent'.
+
+    Lookups only consider descendants of the node and text extraction skips script, style and
+    template contents, matching BeautifulSoup's behaviour.
+    """
+
+    __slots__ = ("_node",)
+
+    def __init__(self, node):
+        self._node = node
+
+    @classmethod
+    def wrap(cls, node) -> Optional["SelectolaxElement"]:
+        return cls(node) if node is not None else None
+
+    @property
+    def name(self) -> str:
+        return self._node.tag
+
+    @property
+    def parent(self) -> Optional["SelectolaxElement"]:
+        parent = self._node.parent
+        if parent is None or parent.tag == "-document":
+            return None
+        return SelectolaxElement(parent)
+
+    def _select(self, selector: str):
+        return (node for node in self._node.css(selector) if node != self._node)
+
+    def find(self, name: str) -> Optional["SelectolaxElement"]:
+        return self.wrap(next(self._select(name), None))
+
+    def find_all(self, name: str, class_: Optional[str] = None) -> list:
+        selector = name
+        if class_ is not None:
+            selector = (
+                f'{name}[class="{class_}"]' if " " in class_ else f"{name}.{class_}"
+            )
+        return [SelectolaxElement(node) for node in self._select(selector)]
+
+    def get(self, key: str, default=None):
+        return self._node.attributes.get(key, default)
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        if self._node.css_first(", ".join(_NON_TEXT_TAGS)) is None:
+            return self._node.text(deep=True, separator=separator, strip=strip)
+
+        strings = []
+        for node in self._node.traverse(include_text=True):
+            if node.tag != "-text" or node.parent.tag in _NON_TEXT_TAGS:
+                continue
+            text = node.text_content or ""
+            if strip:
+                text = text.strip()
+                if not text:
+                    continue
+            strings.append(text)
+        return separator.join(strings)
+
+
+def make_soup(markup, parser: Optional[str] = None, encoding: Optional[str] = None):
+    """
+    Parses an HTML document with the configured parser backend.
+
+    The backend is chosen per deployment through the HTML_PARSER environment variable:
+    'html.parser' (BeautifulSoup's pure-Python parser), 'lxml' (BeautifulSoup over lxml) or
+    'selectolax' (lexbor, wrapped in SelectolaxElement). Every backend exposes the same
+    'find'/'find_all'/'get'/'get_text' interface. Unavailable backends fall back to
+    'html.parser' with a warning.
+
+    Byte documents are decoded with 'encoding' or, if omitted, with the encoding found by
+    'declared_encoding', so the parsers never fall back to slow charset detection.
+
+    Args:
+        markup (str or bytes): The HTML document.
+        parser (Optional[str]): Backend to use, defaults to HTML_PARSER.
+        encoding (Optional[str]): Encoding of a byte document.
+
+    Returns:
+        The parsed document.
+    """
+    parser = parser or HTML_PARSER
+    if isinstance(markup, bytes):
+        markup = markup.decode(encoding or declared_encoding(markup), errors="replace")
+    if parser == "selectolax":
+        if LexborHTMLParser is not None:
+            return SelectolaxElement(LexborHTMLParser(markup).root)
+        DefaultLogger().get_logger().warning(
+            "selectolax is not installed, falling back to html.parser"
+        )
+        parser = "html.parser"
+    try:
+        return BeautifulSoup(markup, parser)
+    except FeatureNotFound:
+        DefaultLogger().get_logger().warning(
+            f"HTML parser '{parser}' is not available, falling back to html.parser"
+        )
+        return BeautifulSoup(markup, "html.parser")
@@ -0,0 +1,267 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from app.utils.logger import DefaultLogger
+
+HTTP_CACHE_DIR = os.getenv("HTTP_CACHE_DIR", "/tmp/factually/http-cache")
+HTTP_CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+HTTP_CACHE_DEFAULT_TTL = int(os.getenv("HTTP_CACHE_DEFAULT_TTL", "3600"))
+HTTP_CACHE_ARTICLE_TTL = int(os.getenv("HTTP_CACHE_ARTICLE_TTL", str(7 * 24 * 3600)))
+
+
+def source_ttl(source: Optional[dict]) -> int:
+    """
+    Returns the freshness lifetime in seconds for archive pages of a source.
+
+    Sources can override the default through their 'cache_ttl' setting.
+    """
+    if source and source.get("cache_ttl") is not None:
+        return int(source["cache_ttl"])
+    return HTTP_CACHE_DEFAULT_TTL
+
+
+class CacheEntry:
+    """
+    A cached response body together with its HTTP validators.
+
+    Attributes:
+        url (str): URL of the cached page.
+        body (bytes): Raw body of the page.
+        encoding (Optional[str]): Declared encoding of the body, if any.
+        etag (Optional[str]): ETag returned by the server.
+        last_modified (Optional[str]): Last-Modified header returned by the server.
+        stored_at (float): Epoch timestamp of the last download or successful revalidation.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        body: bytes,
+        encoding: Optional[str] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+        stored_at: Optional[float] = None,
+    ):
+        self.url = url
+        self.body = body
+        self.encoding = encoding
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at or time.time()
+
+    @property
+    def text(self) -> str:
+        return self.body.decode(self.encoding or "utf-8", errors="replace")
+
+    def is_fresh(self, ttl: int) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    def conditional_headers(self) -> dict:
+        """Returns the If-None-Match/If-Modified-Since headers to revalidate the entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def meta(self) -> dict:
+        return {
+            "url": self.url,
+            "encoding": self.encoding,
+            "etag": self.etag,
+            "last_modified": self.last_modified,
+            "stored_at": self.stored_at,
+        }
+
+
+class HttpCache:
+    """
+    On-disk HTTP response cache with size-bounded LRU eviction.
+
+    Every entry is stored as a '<key>.body' file holding the raw body and a '<key>.json' file
+    holding its validators, where the key is the SHA-256 of the URL. An in-memory index keeps
+    the entries in least-recently-used order and evicts from its head once the total size
+    exceeds 'max_bytes'. The index is rebuilt from file access times on start-up.
+
+    Files are replaced atomically, and entries that can't be read or written are treated as
+    cache misses, so a full or broken disk only costs downloads.
+
+    Args:
+        directory (str): Directory where entries are stored.
+        max_bytes (int): Maximum total size of the cached bodies.
+    """
+
+    def __init__(
+        self, directory: str = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES
+    ):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        os.makedirs(directory, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def _load_index(self):
+        entries = []
+        for filename in os.listdir(self.directory):
+            if not filename.endswith(".body"):
+                continue
+            stat = os.stat(os.path.join(self.directory, filename))
+            entries.append((stat.st_mtime, filename[: -len(".body")], stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._size += size
+        self._evict()
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """
+        Returns the cached entry for a URL and marks it as recently used.
+
+        Returns:
+            Optional[CacheEntry]: The entry, or None if the URL is not cached.
+        """
+        key = self._key(url)
+        with self._lock:
+            if key not in self._index:
+                return None
+            self._index.move_to_end(key)
+            try:
+                with open(self._path(key, "json"), encoding="utf-8") as meta_file:
+                    meta = json.load(meta_file)
+                with open(self._path(key, "body"), "rb") as body_file:
+                    body = body_file.read()
+                os.utime(self._path(key, "body"))
+            except (OSError, ValueError):
+                DefaultLogger().get_logger().warning(
+                    f"Corrupted cache entry for {url}", exc_info=True
+                )
+                self._remove(key)
+                return None
+        return CacheEntry(body=body, **meta)
+
+    def put(
+        self,
+        url: str,
+        body: bytes,
+        encoding: Optional[str] = None,
+        headers: Optional[dict] = None,
+    ) -> CacheEntry:
+        """
+        Stores a response body with the validators found in its headers.
+
+        Args:
+            url (str): URL of the page.
+            body (bytes): Raw body to store.
+            encoding (Optional[str]): Declared encoding of the body.
+            headers (Optional[dict]): Response headers holding ETag/Last-Modified.
+
+        Returns:
+            CacheEntry: The stored entry.
+        """
+        headers = headers or {}
+        entry = CacheEntry(
+            url,
+            body,
+            encoding=encoding,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+        key = self._key(url)
+        with self._lock:
+            try:
+                self._write(key, entry)
+            except OSError:
+                # THE PAGE IS SIMPLY NOT CACHED, AND DOWNLOADED AGAIN NEXT TIME
+                DefaultLogger().get_logger().warning(
+                    f"Could not cache {url}", exc_info=True
+                )
+                self._remove(key)
+                return entry
+            self._size += len(body) - self._index.get(key, 0)
+            self._index[key] = len(body)
+            self._index.move_to_end(key)
+            self._evict()
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: Optional[dict] = None):
+        """
+        Marks an entry as fresh again after a 304 Not Modified revalidation.
+
+        Args:
+            entry (CacheEntry): The revalidated entry.
+            headers (Optional[dict]): Headers of the 304 response, which may carry new validators.
+        """
+        headers = headers or {}
+        entry.etag = headers.get("etag") or entry.etag
+        entry.last_modified = headers.get("last-modified") or entry.last_modified
+        entry.stored_at = time.time()
+        key = self._key(entry.url)
+        with self._lock:
+            if key not in self._index:
+                return
+            try:
+                self._write_file(
+                    self._path(key, "json"), json.dumps(entry.meta()).encode("utf-8")
+                )
+            except OSError:
+                DefaultLogger().get_logger().warning(
+                    f"Could not refresh cache entry for {entry.url}", exc_info=True
+                )
+
+    def _write(self, key: str, entry: CacheEntry):
+        self._write_file(self._path(key, "body"), entry.body)
+        self._write_file(
+            self._path(key, "json"), json.dumps(entry.meta()).encode("utf-8")
+        )
+
+    @staticmethod
+    def _write_file(path: str, data: bytes):
+        # A CRASH MID-WRITE LEAVES THE PREVIOUS FILE, NEVER A TRUNCATED ONE
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+
+    def _remove(self, key: str):
+        self._size -= self._index.pop(key, 0)
+        for suffix in ("body", "json"):
+            try:
+                os.remove(self._path(key, suffix))
+            except FileNotFoundError:
+                pass
+
+    def _evict(self):
+        while self._size > self.max_bytes and self._index:
+            key = next(iter(self._index))
+            self._remove(key)
+
+
+_instance: HttpCache = None
+_instance_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """
+    Returns a singleton instance of HttpCache.
+    """
+    global _instance
+    with _instance_lock:
+        if _instance is None:
+            _instance = HttpCache()
+            DefaultLogger().get_logger().info(
+                f"Initialized HTTP cache in {HTTP_CACHE_DIR}"
+            )
+        return _instance
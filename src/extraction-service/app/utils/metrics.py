@@ -0,0 +1,149 @@
+import os
+from functools import lru_cache
+from typing import Optional
+from urllib.parse import urlsplit
+from opentelemetry.metrics import Meter, get_meter_provider, set_meter_provider
+from opentelemetry.sdk.metrics import MeterProvider
+from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+from opentelemetry.sdk.metrics.view import ExplicitBucketHistogramAggregation, View
+from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+from opentelemetry.sdk.resources import Resource
+from opentelemetry.semconv.resource import ResourceAttributes
+from app.utils.logger import OTLP_ENDPOINT, SERVICE_NAME
+
+METRICS_EXPORT_INTERVAL = int(os.getenv("METRICS_EXPORT_INTERVAL", "15000"))
+
+# SECONDS, FROM A CACHED FETCH TO A SLOW RENDER
+_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+_CARD_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 200, 500)
+
+VIEWS = (
+    View(
+        instrument_name="extraction.*.duration",
+        aggregation=ExplicitBucketHistogramAggregation(_DURATION_BUCKETS),
+    ),
+    View(
+        instrument_name="extraction.page.articles",
+        aggregation=ExplicitBucketHistogramAggregation(_CARD_BUCKETS),
+    ),
+)
+
+
+@lru_cache(maxsize=1024)
+def source_label(url: Optional[str]) -> str:
+    """
+    Returns the label identifying the source of a URL: its host, without any 'www.' prefix.
+
+    Source base URLs, archive pages and article links of the same source get the same label.
+    """
+    host = urlsplit(str(url)).hostname if url else None
+    if not host:
+        return "unknown"
+    return host[4:] if host.startswith("www.") else host
+
+
+class ExtractionMetrics:
+    """
+    OpenTelemetry instruments of the extraction stages, all labeled by source.
+
+    Args:
+        meter (Meter): Meter the instruments are created from.
+    """
+
+    def __init__(self, meter: Meter):
+        self.render_time = meter.create_histogram(
+            "extraction.page.render.duration",
+            unit="s",
+            description="Time to load a page in the browser",
+        )
+        self.scroll_time = meter.create_histogram(
+            "extraction.page.scroll.duration",
+            unit="s",
+            description="Time spent scrolling a rendered page to load lazy content",
+        )
+        self.fetch_latency = meter.create_histogram(
+            "extraction.fetch.duration",
+            unit="s",
+            description="Latency of plain HTTP requests",
+        )
+        self.bytes_downloaded = meter.create_counter(
+            "extraction.fetch.bytes",
+            unit="By",
+            description="Response bytes downloaded over plain HTTP",
+        )
+        self.parse_time = meter.create_histogram(
+            "extraction.parse.duration",
+            unit="s",
+            description="Time to parse a page and extract its cards or content",
+        )
+        self.articles_per_page = meter.create_histogram(
+            "extraction.page.articles",
+            unit="{article}",
+            description="Article cards found on an archive page",
+        )
+        self.content_fetches = meter.create_counter(
+            "extraction.content.articles",
+            unit="{article}",
+            description="Articles whose content was requested, by method ('http', 'fallback' or 'rejected')",
+        )
+        self.date_fallbacks = meter.create_counter(
+            "extraction.date.fallbacks",
+            unit="{date}",
+            description="Dates not parsed with the source format, by kind ('alternative', 'relative' or 'failed')",
+        )
+
+    def record_render(self, url: str, timings: dict):
+        """Records the render and scroll times returned by 'render_page'."""
+        attributes = {"source": source_label(url)}
+        self.render_time.record(timings["render"], attributes)
+        if timings["scroll"]:
+            self.scroll_time.record(timings["scroll"], attributes)
+
+    def record_fetch(self, url: str, seconds: float, size: int):
+        attributes = {"source": source_label(url)}
+        self.fetch_latency.record(seconds, attributes)
+        self.bytes_downloaded.add(size, attributes)
+
+    def record_parse(self, url: str, kind: str, seconds: float):
+        self.parse_time.record(seconds, {"source": source_label(url), "page": kind})
+
+    def record_cards(self, url: str, count: int):
+        self.articles_per_page.record(count, {"source": source_label(url)})
+
+    def record_content_fetch(self, url: str, method: str):
+        self.content_fetches.add(1, {"source": source_label(url), "method": method})
+
+    def record_date_fallback(self, url: Optional[str], kind: str):
+        self.date_fallbacks.add(1, {"source": source_label(url), "kind": kind})
+
+
+def _init_meter_provider():
+    if isinstance(get_meter_provider(), MeterProvider):
+        return
+    resource = Resource.create(
+        {
+            ResourceAttributes.SERVICE_NAME: SERVICE_NAME,
+            ResourceAttributes.SERVICE_VERSION: os.getenv("SERVICE_VERSION", "1.0.0"),
+        }
+    )
+    reader = PeriodicExportingMetricReader(
+        OTLPMetricExporter(endpoint=f"{OTLP_ENDPOINT}/v1/metrics"),
+        export_interval_millis=METRICS_EXPORT_INTERVAL,
+    )
+    set_meter_provider(
+        MeterProvider(resource=resource, metric_readers=[reader], views=VIEWS)
+    )
+
+
+def get_metrics() -> ExtractionMetrics:
+    """
+    Returns the process-wide extraction instruments, exporting them over OTLP.
+    """
+    global _instance
+    if _instance is None:
+        _init_meter_provider()
+        _instance = ExtractionMetrics(get_meter_provider().get_meter("extraction"))
+    return _instance
+
+
+_instance: ExtractionMetrics = None
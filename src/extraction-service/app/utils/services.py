@@ -28,3 +28,80 @@ async def post_articles_bulk(articles):
             raise Exception("Error inserting articles")
         logger.info("Articles successfully inserted into Storage Service")
         return response.json()
+
+async def get_existing_links(links):
+    logger.debug(f"Looking up {len(links)} article links in Storage Service")
+    async with httpx.AsyncClient() as client:
+        response = await client.post(f"{STORAGE_SERVICE_URL}/articles/exists", json={"links": links})
+        if response.status_code != 200:
+            logger.error("Failed to look up article links in Storage Service")
+            raise Exception("Failed to look up article links")
+        existing_links = response.json()
+        logger.debug(f"{len(existing_links)} article links already stored")
+        return existing_links
+
+async def post_article_aliases(aliases):
+    logger.debug(f"Posting {len(aliases)} article aliases to Storage Service")
+    async with httpx.AsyncClient() as client:
+        payload = jsonable_encoder(aliases)
+        response = await client.post(f"{STORAGE_SERVICE_URL}/articles/aliases", json=payload)
+        if response.status_code != 201:
+            logger.error("Error recording article aliases in Storage Service")
+            raise Exception("Error recording article aliases")
+        return response.json()
+
+async def get_article_fingerprints(date_from, date_to):
+    logger.debug(f"Requesting article fingerprints from {date_from} to {date_to} from Storage Service")
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            f"{STORAGE_SERVICE_URL}/articles/fingerprints",
+            params={"date_from": date_from, "date_to": date_to},
+        )
+        if response.status_code != 200:
+            logger.error("Failed to retrieve article fingerprints from Storage Service")
+            raise Exception("Failed to retrieve article fingerprints")
+        return response.json()
+
+async def update_source_watermark(source_id, last_article_date, last_article_link):
+    logger.debug(f"Updating watermark of source {source_id} to {last_article_date}")
+    async with httpx.AsyncClient() as client:
+        response = await client.put(
+            f"{STORAGE_SERVICE_URL}/sources/{source_id}/watermark",
+            json={"last_article_date": last_article_date, "last_article_link": last_article_link},
+        )
+        if response.status_code != 200:
+            logger.error(f"Failed to update watermark of source {source_id}")
+            raise Exception("Failed to update source watermark")
+        return response.json()
+
+async def register_work_units(job_id, unit_ids):
+    logger.debug(f"Registering {len(unit_ids)} work units of job {job_id} in Storage Service")
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            f"{STORAGE_SERVICE_URL}/jobs/{job_id}/units", json={"unit_ids": unit_ids}
+        )
+        if response.status_code != 200:
+            logger.error(f"Failed to register work units of job {job_id}")
+            raise Exception("Failed to register work units")
+        return response.json()
+
+async def complete_work_unit(job_id, unit_id, article_ids, watermarks=None):
+    logger.debug(f"Completing work unit {unit_id} of job {job_id} in Storage Service")
+    async with httpx.AsyncClient() as client:
+        response = await client.post(
+            f"{STORAGE_SERVICE_URL}/jobs/{job_id}/done",
+            json={"unit_id": unit_id, "article_ids": article_ids, "watermarks": watermarks or []},
+        )
+        if response.status_code != 200:
+            logger.error(f"Failed to complete work unit {unit_id} of job {job_id}")
+            raise Exception("Failed to complete work unit")
+        return response.json()
+
+async def announce_job_completion(job_id):
+    logger.debug(f"Recording the completion announcement of job {job_id} in Storage Service")
+    async with httpx.AsyncClient() as client:
+        response = await client.post(f"{STORAGE_SERVICE_URL}/jobs/{job_id}/announced")
+        if response.status_code != 200:
+            logger.error(f"Failed to record the completion announcement of job {job_id}")
+            raise Exception("Failed to record job completion announcement")
+        return response.json()
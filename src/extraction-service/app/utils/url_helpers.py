@@ -1,5 +1,37 @@
-from urllib.parse import urljoin
-from pydantic import HttpUrl, ValidationError
+import ipaddress
+import os
+import re
+from functools import lru_cache
+from typing import List, Optional
+from urllib.parse import urljoin, urlsplit, urlunsplit
+
+URL_CACHE_SIZE = int(os.getenv("URL_CACHE_SIZE", "65536"))
+
+# QUERY PARAMETERS THAT ONLY TRACK THE VISIT AND NEVER CHANGE THE PAGE
+TRACKING_PARAMETERS = frozenset(
+    (
+        "fbclid",
+        "gclid",
+        "dclid",
+        "gbraid",
+        "wbraid",
+        "msclkid",
+        "yclid",
+        "igshid",
+        "mc_cid",
+        "mc_eid",
+        "_ga",
+        "_gl",
+        "ocid",
+        "cmpid",
+        "ref_src",
+        "ref_url",
+    )
+)
+TRACKING_PREFIXES = ("utm_",)
+
+_HOST_PATTERN = re.compile(r"^[\w-]+(\.[\w-]+)*\.?$")
+_DEFAULT_PORTS = {"http": 80, "https": 443}
 
 
 class SafeDict(dict):
@@ -17,9 +49,99 @@ def fix_links(url_base: str, url_relative: str) -> str:
     return url_relative
 
 
-def is_valid_url(url: str) -> bool:
+def _is_tracking(parameter: str) -> bool:
+    name = parameter.split("=", 1)[0].lower()
+    return name in TRACKING_PARAMETERS or name.startswith(TRACKING_PREFIXES)
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def normalize_url(url: str) -> Optional[str]:
+    """
+    Returns the canonical form of an absolute HTTP(S) URL, or None if it is not one.
+
+    The scheme and host are lowercased, default ports and fragments are dropped, tracking
+    parameters (utm_*, fbclid, gclid...) are removed from the query and a trailing slash is
+    stripped from the path, so links to the same page compare equal. Links stored before they
+    were normalized are matched through 'legacy_links'. The validation is only
+    structural (scheme, host and no whitespace), which is much cheaper than building a pydantic
+    HttpUrl and enough to reject mailto:, javascript: and malformed links.
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        Optional[str]: The normalized URL, or None if the URL is not a valid HTTP(S) URL.
+    """
+    url = url.strip()
+    if not url or any(char.isspace() for char in url):
+        return None
     try:
-        HttpUrl(url=url)
-        return True
-    except ValidationError as e:
-        return False
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return None
+    scheme = parts.scheme.lower()
+    host = parts.hostname
+    if scheme not in _DEFAULT_PORTS or not host:
+        return None
+    if ":" in host:
+        # IPV6 LITERAL, KEPT BETWEEN BRACKETS IN THE NETLOC
+        try:
+            netloc = f"[{ipaddress.IPv6Address(host).compressed}]"
+        except ValueError:
+            return None
+    elif _HOST_PATTERN.match(host):
+        netloc = host.rstrip(".")
+    else:
+        return None
+
+    if port is not None and port != _DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    if parts.username is not None:
+        userinfo = parts.netloc.rpartition("@")[0]
+        netloc = f"{userinfo}@{netloc}"
+
+    path = parts.path.rstrip("/") or "/"
+    query = "&".join(
+        parameter
+        for parameter in parts.query.split("&")
+        if parameter and not _is_tracking(parameter)
+    )
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def canonical_link(url_base: str, url_relative: str) -> Optional[str]:
+    """
+    Resolves a link against the page it was found on and normalizes it (see 'normalize_url').
+
+    Returns:
+        Optional[str]: The canonical absolute link, or None if the link is not a valid HTTP(S) URL.
+    """
+    link = fix_links(url_base, url_relative.strip())
+    if link.startswith("www."):
+        link = f"http://{link}"
+    return normalize_url(link)
+
+
+def legacy_links(link: str) -> List[str]:
+    """
+    Returns the other forms a canonical link may have been stored in before links were normalized.
+
+    Links used to be stored as found on the page, so articles stored with a trailing slash don't
+    match their canonical link. Tracking parameters and fragments can't be recovered from the
+    canonical link, so articles stored with them are not matched.
+
+    Args:
+        link (str): A link returned by 'normalize_url'.
+
+    Returns:
+        List[str]: The legacy forms of the link.
+    """
+    parts = urlsplit(link)
+    path = "" if parts.path == "/" else f"{parts.path}/"
+    return [urlunsplit(parts._replace(path=path))]
+
+
+def is_valid_url(url: str) -> bool:
+    return normalize_url(url) is not None
@@ -28,7 +28,8 @@ async def start_workflow(workflow_request: WorkflowRequest, background_tasks: Ba
     "sources": workflow_request.sources,
     "articles": workflow_request.articles,
     "date_base": workflow_request.date_base.isoformat(),
-    "date_cutoff": workflow_request.date_cutoff.isoformat()
+    "date_cutoff": workflow_request.date_cutoff.isoformat(),
+    "incremental": workflow_request.incremental
     }
 
     message = MessagePayload(
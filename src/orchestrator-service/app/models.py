@@ -18,6 +18,10 @@ class WorkflowRequest(BaseModel):
     )
     date_base: date = Field(..., description="Start date for scraping")
     date_cutoff: date = Field(..., description="End date for scraping")
+    incremental: bool = Field(
+        default=False,
+        description="Only scrape articles newer than each source's high-water mark"
+    )
 
 class WorkflowResponse(BaseModel):
     correlation_id: UUID
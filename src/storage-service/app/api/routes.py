@@ -1,9 +1,10 @@
 from fastapi import APIRouter, HTTPException, BackgroundTasks
+from pymongo import ReturnDocument
 from pymongo.errors import DuplicateKeyError, BulkWriteError
 from fastapi.encoders import jsonable_encoder
 from typing import List
 import uuid
-from app.models import Article, Source, SearchResult, SearchRequest, article_helper, source_helper
+from app.models import Article, ArticleAlias, ArticleFingerprint, Source, SearchResult, SearchRequest, LinksRequest, SourceWatermark, WorkUnits, WorkUnitResult, ExtractionJob, article_helper, extraction_job_helper, source_helper
 from app.db.mongo import MongoClientSingleton
 from app.db.weaviate_client import WeaviateAsyncClientSingleton, sync_articles_to_weaviate
 from app.utils.logger import DefaultLogger
@@ -90,6 +91,61 @@ async def create_articles_bulk(articles: List[Article], background_tasks: Backgr
     background_tasks.add_task(sync_articles_to_weaviate, created_articles)
     return created_articles
 
+@router.post("/articles/exists", response_model=List[str])
+async def find_existing_links(request: LinksRequest):
+    """
+    Returns which of the given links already belong to a stored article or alias.
+    """
+    logger.info(f"Received request to look up {len(request.links)} article links")
+    existing_links = []
+    for collection in ("articles", "aliases"):
+        cursor = MongoClientSingleton.get_db()[collection].find(
+            {"Link": {"$in": request.links}}, {"Link": 1, "_id": 0}
+        )
+        async for article in cursor:
+            existing_links.append(article["Link"])
+    logger.debug(f"Found {len(existing_links)} existing article links")
+    return existing_links
+
+@router.post("/articles/aliases", response_model=List[str], status_code=201)
+async def create_article_aliases(aliases: List[ArticleAlias]):
+    """
+    Records near-duplicates of stored articles as aliases of them.
+
+    Aliases whose link is already recorded are skipped. Returns the links of the recorded aliases.
+    """
+    logger.info(f"Received request to record {len(aliases)} article aliases")
+    aliases_data = [jsonable_encoder(alias) for alias in aliases]
+    for alias_data in aliases_data:
+        alias_data["_id"] = alias_data.pop("id")
+    if not aliases_data:
+        return []
+    try:
+        result = await MongoClientSingleton.get_db()["aliases"].insert_many(aliases_data, ordered=False)
+        inserted_ids = set(result.inserted_ids)
+    except BulkWriteError as bwe:
+        failed_ids = {error["op"].get("_id") for error in bwe.details.get("writeErrors", [])}
+        logger.debug(f"Skipped {len(failed_ids)} aliases already recorded")
+        inserted_ids = {alias["_id"] for alias in aliases_data} - failed_ids
+    logger.info(f"Recorded {len(inserted_ids)} article aliases")
+    return [alias["Link"] for alias in aliases_data if alias["_id"] in inserted_ids]
+
+@router.get("/articles/fingerprints", response_model=List[ArticleFingerprint])
+async def list_article_fingerprints(date_from: str, date_to: str):
+    """
+    Retrieves the fingerprints of the articles published between two ISO dates, both included.
+    """
+    logger.info(f"Received request for article fingerprints from {date_from} to {date_to}")
+    fingerprints = []
+    cursor = MongoClientSingleton.get_db()["articles"].find(
+        {"Date": {"$gte": date_from, "$lte": date_to}, "Fingerprint": {"$ne": None}},
+        {"Fingerprint": 1},
+    )
+    async for article in cursor:
+        fingerprints.append(ArticleFingerprint(id=article["_id"], Fingerprint=article["Fingerprint"]))
+    logger.debug(f"Retrieved {len(fingerprints)} article fingerprints")
+    return fingerprints
+
 @router.get("/articles", response_model=List[Article])
 async def list_articles():
     """
@@ -242,6 +298,37 @@ async def update_source(source_id: str, source: Source):
         logger.error(f"Source with id {source_id} not found for update")
         raise HTTPException(status_code=404, detail="Source not found")
 
+@router.put("/sources/{source_id}/watermark", response_model=Source)
+async def update_source_watermark(source_id: str, watermark: SourceWatermark):
+    """
+    Advances the high-water mark of a source to its newest ingested article.
+
+    The mark only moves forward: an update older than the stored date is ignored.
+    """
+    logger.info(f"Received request to update watermark of source with id: {source_id}")
+    try:
+        valid_id = str(uuid.UUID(source_id))
+    except ValueError:
+        logger.error(f"Invalid source id format: {source_id}")
+        raise HTTPException(status_code=400, detail="Invalid source id format.")
+    sources = MongoClientSingleton.get_db()["sources"]
+    await sources.update_one(
+        {
+            "_id": valid_id,
+            "$or": [
+                {"last_article_date": None},
+                {"last_article_date": {"$lte": watermark.last_article_date}},
+            ],
+        },
+        {"$set": jsonable_encoder(watermark)},
+    )
+    source = await sources.find_one({"_id": valid_id})
+    if source is None:
+        logger.error(f"Source with id {source_id} not found for watermark update")
+        raise HTTPException(status_code=404, detail="Source not found")
+    logger.debug(f"Watermark of source {source['name']} at {source.get('last_article_date')}")
+    return source_helper(source)
+
 @router.delete("/sources/{source_id}", status_code=204)
 async def delete_source(source_id: str):
     """
@@ -261,6 +348,81 @@ async def delete_source(source_id: str):
         logger.error(f"Source with id {source_id} not found for deletion")
         raise HTTPException(status_code=404, detail="Source not found")
 
+@router.post("/jobs/{job_id}/units", response_model=ExtractionJob)
+async def register_work_units(job_id: str, request: WorkUnits):
+    """
+    Registers work units of an extraction job, creating the job on its first units.
+
+    Registering a unit again has no effect, so a redelivered unit can safely register its children again.
+    """
+    logger.info(f"Received request to register {len(request.unit_ids)} work units of job {job_id}")
+    job = await MongoClientSingleton.get_db()["extraction_jobs"].find_one_and_update(
+        {"_id": job_id},
+        {
+            "$addToSet": {"units": {"$each": request.unit_ids}},
+            "$setOnInsert": {"done": [], "article_ids": [], "completed": False, "announced": False},
+        },
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return extraction_job_helper(job)
+
+@router.post("/jobs/{job_id}/done", response_model=ExtractionJob)
+async def complete_work_unit(job_id: str, result: WorkUnitResult):
+    """
+    Marks a work unit of an extraction job as finished and records the articles it stored.
+
+    Finishing a unit twice has no effect. Units register their children before finishing, so the job
+    is complete once every registered unit is finished, and 'completed' is only set in the response
+    to the update that completed it, or to a unit finished again before the completion was announced.
+    """
+    logger.info(f"Received request to complete work unit {result.unit_id} of job {job_id}")
+    jobs = MongoClientSingleton.get_db()["extraction_jobs"]
+    job = await jobs.find_one_and_update(
+        {"_id": job_id, "units": result.unit_id, "done": {"$ne": result.unit_id}},
+        {
+            "$addToSet": {"done": result.unit_id},
+            "$push": {
+                "article_ids": {"$each": result.article_ids},
+                "watermarks": {"$each": result.watermarks},
+            },
+        },
+        return_document=ReturnDocument.AFTER,
+    )
+    redelivered = job is None
+    if redelivered:
+        job = await jobs.find_one({"_id": job_id})
+        if job is None or result.unit_id not in job["units"]:
+            logger.error(f"Work unit {result.unit_id} of job {job_id} not found")
+            raise HTTPException(status_code=404, detail="Work unit not found")
+        logger.debug(f"Work unit {result.unit_id} of job {job_id} already finished")
+    completed = False
+    if not set(job["units"]) - set(job["done"]):
+        update = await jobs.update_one({"_id": job_id, "completed": False}, {"$set": {"completed": True}})
+        completed = update.modified_count == 1
+        if redelivered and not completed:
+            # A UNIT REDELIVERED AFTER ITS JOB COMPLETED RETRIES THE ANNOUNCEMENT THAT FAILED
+            completed = not job.get("announced", False)
+    if completed:
+        logger.info(f"All work units of job {job_id} finished")
+    return extraction_job_helper(job, completed)
+
+@router.post("/jobs/{job_id}/announced", response_model=ExtractionJob)
+async def announce_job_completion(job_id: str):
+    """
+    Records that the completion of an extraction job has been announced to the orchestrator.
+    """
+    logger.info(f"Received request to record the completion announcement of job {job_id}")
+    job = await MongoClientSingleton.get_db()["extraction_jobs"].find_one_and_update(
+        {"_id": job_id, "completed": True},
+        {"$set": {"announced": True}},
+        return_document=ReturnDocument.AFTER,
+    )
+    if job is None:
+        logger.error(f"Completed job {job_id} not found")
+        raise HTTPException(status_code=404, detail="Completed job not found")
+    return extraction_job_helper(job)
+
 @router.post("/search", response_model=List[SearchResult])
 async def search_articles(request: SearchRequest):
     """
@@ -35,14 +35,17 @@ def check_and_pull_model():
 
 async def create_indexes():
     """
-    Creates unique indexes for the articles and sources collections in the database.
+    Creates unique indexes for the articles, aliases and sources collections in the database.
 
-    This function ensures that each article's 'Link' field and each source's 'base_url' field is unique,
-    preventing duplicate entries.
+    This function ensures that each article's and alias' 'Link' field and each source's 'base_url' field is unique,
+    preventing duplicate entries. Articles are also indexed by date, for the fingerprint lookups.
     """
-    logger.info("Creating unique indexes for articles and sources")
+    logger.info("Creating unique indexes for articles, aliases and sources")
     db = await MongoClientSingleton.init_client()
     await db["articles"].create_index("Link", unique=True)
+    await db["articles"].create_index("Date")
+    await db["aliases"].create_index("Link", unique=True)
+    await db["aliases"].create_index("CanonicalId")
     await db["sources"].create_index("base_url", unique=True)
 
 @asynccontextmanager
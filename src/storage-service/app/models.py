@@ -1,4 +1,4 @@
-from typing import List, Optional, Union
+from typing import List, Literal, Optional, Union
 from datetime import date
 from uuid import uuid4
 from pydantic import BaseModel, Field, HttpUrl, field_validator
@@ -61,6 +61,7 @@ class Article(ArticleBase):
     Attributes:
         Paragraphs (Optional[List[str]]): List of text paragraphs forming the article.
         References (Optional[List[Reference]]): List of references included within the article.
+        Fingerprint (Optional[str]): SimHash of the article paragraphs used to detect near-duplicates.
     """
 
     Paragraphs: Optional[List[str]] = Field(
@@ -70,6 +71,9 @@ class Article(ArticleBase):
         default_factory=list,
         description="List of references included within the text of the article",
     )
+    Fingerprint: Optional[str] = Field(
+        None, description="SimHash of the article paragraphs, as 16 hexadecimal digits"
+    )
     Summary: Optional[str] = Field(None, description="A brief summary of the article")
     Sentiment: Optional[str] = Field(None, description="Sentiment analysis of the article (e.g., positive, neutral, negative)")
     Classification: Optional[List[str]] = Field(
@@ -77,6 +81,29 @@ class Article(ArticleBase):
     )
 
 
+class ArticleAlias(ArticleBase):
+    """
+    Model representing a near-duplicate of a stored article, such as a syndicated wire story.
+
+    Attributes:
+        CanonicalId (str): Identifier of the stored article the alias duplicates.
+        Distance (int): Number of fingerprint bits in which the alias differs from the stored article.
+    """
+
+    CanonicalId: str = Field(
+        ..., description="Identifier of the stored article the alias duplicates"
+    )
+    Distance: int = Field(
+        0,
+        description="Number of fingerprint bits in which the alias differs from the stored article",
+    )
+
+
+class ArticleFingerprint(BaseModel):
+    id: str = Field(..., description="Identifier of the article")
+    Fingerprint: str = Field(..., description="SimHash of the article paragraphs")
+
+
 class Source(BaseModel):
     """
     Model representing a source for scraping articles.
@@ -89,6 +116,17 @@ class Source(BaseModel):
         article_selector (Optional[str]): CSS selector to locate articles.
         date_format (Optional[str]): Expected date format for date extraction.
         button_selector (Optional[str]): CSS selector for navigation button, if any.
+        feed_url (Optional[str]): RSS/Atom feed, sitemap or sitemap index used to discover articles instead of the archive pages.
+        cache_ttl (Optional[int]): Seconds during which cached archive pages are reused without revalidation.
+        scroll (Optional[bool]): Whether archive pages must be scrolled down to load all their articles.
+        page_search (Optional[bool]): Whether the first page of a paginated archive overlapping the date range is located by sampling pages instead of crawling from page 1.
+        render_mode (Optional[str]): 'static' or 'rendered' to skip the automatic detection of whether archive pages need a browser.
+        card_extraction (Optional[str]): 'html' to parse rendered archive pages in Python or 'browser' to read the article cards in the browser.
+        block_requests (Optional[bool]): Whether the browser blocks the requests matching the blocklist while rendering the source pages.
+        blocked_urls (Optional[List[str]]): URL patterns blocked in addition to the default blocklist, where '*' matches any sequence of characters.
+        max_content_bytes (Optional[int]): Maximum size in bytes of an article page fetched over HTTP, larger pages are skipped.
+        last_article_date (Optional[str]): Date of the newest article ingested from the source (high-water mark).
+        last_article_link (Optional[str]): Link of the newest article ingested from the source (high-water mark).
     """
 
     id: str = Field(default_factory=lambda: str(uuid4()))
@@ -102,6 +140,47 @@ class Source(BaseModel):
     button_selector: Optional[str] = Field(
         None, description="CSS selector for navigation button, if any"
     )
+    feed_url: Optional[str] = Field(
+        None,
+        description="RSS/Atom feed, sitemap or sitemap index used to discover articles instead of the archive pages",
+    )
+    cache_ttl: Optional[int] = Field(
+        None,
+        description="Seconds during which cached archive pages are reused without revalidation",
+    )
+    scroll: Optional[bool] = Field(
+        True,
+        description="Whether archive pages must be scrolled down to load all their articles",
+    )
+    page_search: Optional[bool] = Field(
+        True,
+        description="Whether the first page of a paginated archive overlapping the date range is located by sampling pages",
+    )
+    render_mode: Optional[Literal["static", "rendered"]] = Field(
+        None,
+        description="Forces whether archive pages are fetched over plain HTTP or rendered by the browser",
+    )
+    card_extraction: Optional[Literal["html", "browser"]] = Field(
+        "html",
+        description="Whether the article cards of rendered archive pages are read from the page HTML or in the browser",
+    )
+    block_requests: Optional[bool] = Field(
+        True,
+        description="Whether the browser blocks the requests matching the blocklist while rendering the source pages",
+    )
+    blocked_urls: Optional[List[str]] = Field(
+        None, description="URL patterns blocked in addition to the default blocklist"
+    )
+    max_content_bytes: Optional[int] = Field(
+        None, description="Maximum size in bytes of an article page fetched over HTTP"
+    )
+    last_article_date: Optional[str] = Field(
+        None, description="Date of the newest article ingested from the source"
+    )
+    last_article_link: Optional[str] = Field(
+        None, description="Link of the newest article ingested from the source"
+    )
+
 
 class SearchRequest(BaseModel):
     query: str = Field(..., description="Search query string")
@@ -112,6 +191,58 @@ class SearchRequest(BaseModel):
         3, description="Maximum number of results to return (default: 3)"
     )
 
+
+class LinksRequest(BaseModel):
+    links: List[str] = Field(..., description="Article links to look up")
+
+
+class SourceWatermark(BaseModel):
+    last_article_date: str = Field(
+        ..., description="Date of the newest ingested article, in ISO format"
+    )
+    last_article_link: str = Field(
+        ..., description="Link of the newest ingested article"
+    )
+
+
+class WorkUnits(BaseModel):
+    unit_ids: List[str] = Field(
+        ..., description="Identifiers of the work units to register"
+    )
+
+
+class WorkUnitResult(BaseModel):
+    unit_id: str = Field(..., description="Identifier of the finished work unit")
+    article_ids: List[str] = Field(
+        [], description="Identifiers of the articles the unit stored"
+    )
+    watermarks: List[dict] = Field(
+        [],
+        description="Articles the unit stored and failed, by source, to advance the source watermarks",
+    )
+
+
+class ExtractionJob(BaseModel):
+    """
+    Progress of an extraction job split into work units.
+
+    Attributes:
+        id (str): Correlation id of the job.
+        pending (int): Number of registered work units not finished yet.
+        article_ids (List[str]): Identifiers of the articles stored by the finished units.
+        watermarks (List[dict]): Watermark reports of the finished units, only returned with 'completed'.
+        completed (bool): Whether the completion of the job must be announced. Only the update that
+            finished the last pending unit reports it, unless the announcement was never recorded,
+            in which case a redelivered unit reports it again.
+    """
+
+    id: str
+    pending: int
+    article_ids: List[str] = []
+    watermarks: List[dict] = []
+    completed: bool = False
+
+
 class SearchResult(BaseModel):
     Title: str
     Date: str
@@ -173,4 +304,24 @@ def article_to_weaviate_object(article: Union[Article, dict]) -> dict:
         "classification": ", ".join(article.Classification) if article.Classification else "None",
         "date": article.Date,
         "source": str(article.Source),
-    }
\ No newline at end of file
+    }
+
+
+def extraction_job_helper(job, completed: bool = False) -> ExtractionJob:
+    """
+    Converts a MongoDB extraction job document into an ExtractionJob model object.
+
+    Args:
+        job (dict): The MongoDB document representing an extraction job.
+        completed (bool): Whether the update that returned the document completed the job.
+
+    Returns:
+        ExtractionJob: The parsed ExtractionJob model instance.
+    """
+    return ExtractionJob(
+        id=job["_id"],
+        pending=len(set(job["units"]) - set(job["done"])),
+        article_ids=job["article_ids"],
+        watermarks=job.get("watermarks", []) if completed else [],
+        completed=completed,
+    )
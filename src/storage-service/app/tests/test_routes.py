@@ -0,0 +1,255 @@
+import asyncio
+from uuid import uuid4
+import pytest
+from fastapi import HTTPException
+from app.api import routes
+from app.db.mongo import MongoClientSingleton
+from app.models import LinksRequest, SourceWatermark, WorkUnitResult, WorkUnits
+
+
+def matches(document: dict, query: dict) -> bool:
+    # THE SUBSET OF THE MONGO QUERY LANGUAGE USED BY THE ROUTES
+    for field, condition in query.items():
+        if field == "$or":
+            if not any(matches(document, option) for option in condition):
+                return False
+            continue
+        value = document.get(field)
+        if isinstance(condition, dict):
+            for operator, operand in condition.items():
+                if operator == "$ne" and (
+                    operand in value if isinstance(value, list) else value == operand
+                ):
+                    return False
+                if operator == "$in" and value not in operand:
+                    return False
+                if operator == "$lte" and (value is None or value > operand):
+                    return False
+                if operator == "$gte" and (value is None or value < operand):
+                    return False
+        elif isinstance(value, list):
+            if condition not in value:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def apply(document: dict, update: dict):
+    for field, value in update.get("$set", {}).items():
+        document[field] = value
+    for field, value in update.get("$addToSet", {}).items():
+        items = document.setdefault(field, [])
+        for item in value["$each"] if isinstance(value, dict) else [value]:
+            if item not in items:
+                items.append(item)
+    for field, value in update.get("$push", {}).items():
+        document.setdefault(field, []).extend(value["$each"])
+
+
+class FakeUpdateResult:
+    def __init__(self, modified_count: int):
+        self.modified_count = modified_count
+
+
+class FakeCursor:
+    def __init__(self, documents: list):
+        self._documents = iter(documents)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._documents)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    """In-memory stand-in for a motor collection."""
+
+    def __init__(self, documents: list = None):
+        self.documents = [dict(document) for document in documents or []]
+
+    def find(self, query: dict, projection: dict = None) -> FakeCursor:
+        found = [document for document in self.documents if matches(document, query)]
+        if projection:
+            # LIKE MONGO, THE ID IS RETURNED UNLESS IT IS EXCLUDED
+            fields = [field for field, keep in {"_id": 1, **projection}.items() if keep]
+            found = [{field: document[field] for field in fields} for document in found]
+        return FakeCursor(found)
+
+    async def find_one(self, query: dict):
+        return next(
+            (dict(document) for document in self.documents if matches(document, query)),
+            None,
+        )
+
+    async def update_one(self, query: dict, update: dict) -> FakeUpdateResult:
+        for document in self.documents:
+            if matches(document, query):
+                apply(document, update)
+                return FakeUpdateResult(1)
+        return FakeUpdateResult(0)
+
+    async def find_one_and_update(
+        self, query: dict, update: dict, upsert=False, return_document=None
+    ):
+        for document in self.documents:
+            if matches(document, query):
+                apply(document, update)
+                return dict(document)
+        if not upsert:
+            return None
+        document = {"_id": query["_id"], **update.get("$setOnInsert", {})}
+        apply(document, update)
+        self.documents.append(document)
+        return dict(document)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    collections = {
+        "articles": FakeCollection(),
+        "aliases": FakeCollection(),
+        "sources": FakeCollection(),
+        "extraction_jobs": FakeCollection(),
+    }
+    monkeypatch.setattr(MongoClientSingleton, "_db", collections)
+    return collections
+
+
+def test_job_completes_once_every_unit_is_done(db):
+    async def run():
+        await routes.register_work_units("job-1", WorkUnits(unit_ids=["a", "b"]))
+        first = await routes.complete_work_unit(
+            "job-1", WorkUnitResult(unit_id="a", article_ids=["1"])
+        )
+        # A DISCOVERY UNIT REGISTERS ITS CHILDREN BEFORE IT IS DONE
+        await routes.register_work_units("job-1", WorkUnits(unit_ids=["b", "c"]))
+        second = await routes.complete_work_unit(
+            "job-1", WorkUnitResult(unit_id="b", article_ids=["2"])
+        )
+        last = await routes.complete_work_unit(
+            "job-1",
+            WorkUnitResult(
+                unit_id="c", article_ids=["3"], watermarks=[{"id": "source-1"}]
+            ),
+        )
+        again = await routes.complete_work_unit(
+            "job-1", WorkUnitResult(unit_id="c", article_ids=["3"])
+        )
+        return first, second, last, again
+
+    first, second, last, again = asyncio.run(run())
+
+    assert (first.pending, first.completed) == (1, False)
+    assert (second.pending, second.completed) == (1, False)
+    assert last.completed and last.pending == 0
+    assert last.article_ids == ["1", "2", "3"]
+    assert last.watermarks == [{"id": "source-1"}]
+    # THE COMPLETION WAS NOT ANNOUNCED, SO A REDELIVERED UNIT REPORTS IT AGAIN
+    assert again.completed and again.article_ids == ["1", "2", "3"]
+
+
+def test_announced_job_is_not_completed_again(db):
+    async def run():
+        await routes.register_work_units("job-1", WorkUnits(unit_ids=["a"]))
+        with pytest.raises(HTTPException) as not_completed:
+            await routes.announce_job_completion("job-1")
+        assert not_completed.value.status_code == 404
+
+        await routes.complete_work_unit("job-1", WorkUnitResult(unit_id="a"))
+        announced = await routes.announce_job_completion("job-1")
+        again = await routes.complete_work_unit("job-1", WorkUnitResult(unit_id="a"))
+
+        with pytest.raises(HTTPException) as unknown:
+            await routes.complete_work_unit("job-1", WorkUnitResult(unit_id="z"))
+        assert unknown.value.status_code == 404
+        return announced, again
+
+    announced, again = asyncio.run(run())
+
+    assert not announced.completed
+    assert db["extraction_jobs"].documents[0]["announced"]
+    assert not again.completed
+
+
+def test_source_watermark_only_moves_forward(db):
+    source_id = str(uuid4())
+    db["sources"].documents.append(
+        {
+            "_id": source_id,
+            "name": "Test Source",
+            "base_url": "http://source.com",
+            "url": "http://source.com/articles",
+            "article_selector": ".article",
+            "date_format": "%Y-%m-%d",
+            "last_article_date": None,
+        }
+    )
+
+    def update(day: str):
+        return asyncio.run(
+            routes.update_source_watermark(
+                source_id,
+                SourceWatermark(
+                    last_article_date=day, last_article_link=f"http://source.com/{day}"
+                ),
+            )
+        )
+
+    assert update("2022-01-05").last_article_date == "2022-01-05"
+    assert update("2022-01-03").last_article_date == "2022-01-05"
+    source = update("2022-01-07")
+    assert source.last_article_date == "2022-01-07"
+    assert source.last_article_link == "http://source.com/2022-01-07"
+
+    with pytest.raises(HTTPException) as missing:
+        asyncio.run(
+            routes.update_source_watermark(
+                str(uuid4()),
+                SourceWatermark(last_article_date="2022-01-01", last_article_link="x"),
+            )
+        )
+    assert missing.value.status_code == 404
+
+
+def test_existing_links_cover_articles_and_aliases(db):
+    db["articles"].documents.append({"_id": "1", "Link": "http://example.com/a"})
+    db["aliases"].documents.append({"_id": "2", "Link": "http://example.com/b"})
+
+    existing = asyncio.run(
+        routes.find_existing_links(
+            LinksRequest(
+                links=[
+                    "http://example.com/a",
+                    "http://example.com/b",
+                    "http://example.com/c",
+                ]
+            )
+        )
+    )
+
+    assert existing == ["http://example.com/a", "http://example.com/b"]
+
+
+def test_fingerprints_are_listed_by_date(db):
+    db["articles"].documents.extend(
+        [
+            {"_id": "1", "Date": "2022-01-01", "Fingerprint": "00ff"},
+            {"_id": "2", "Date": "2022-01-03", "Fingerprint": "ff00"},
+            {"_id": "3", "Date": "2022-01-03", "Fingerprint": None},
+            {"_id": "4", "Date": "2022-01-09", "Fingerprint": "0f0f"},
+        ]
+    )
+
+    fingerprints = asyncio.run(
+        routes.list_article_fingerprints("2022-01-01", "2022-01-05")
+    )
+
+    assert [(entry.id, entry.Fingerprint) for entry in fingerprints] == [
+        ("1", "00ff"),
+        ("2", "ff00"),
+    ]